@@ -0,0 +1,101 @@
+"""Benchmark: blank-page and separator detection on a scan-like PDF.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_blank_detection --pages 5000
+    python -m benchmarks.bench_blank_detection --input scan.pdf --workers 4
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from src.services.blank_page_detector import (EMPTY_STREAM, TEXT_LAYER, classify_pages,
+                                              propose_splits)
+
+
+DOCUMENT_LENGTH = 25     # Pages per document in the generated sample
+SCAN_WIDTH, SCAN_HEIGHT = 425, 550
+TEXT_PAGE_EVERY = 7      # Short born-digital text pages among the scans
+
+
+def scan_image(rng: np.random.Generator, shade: int, text: bool) -> bytes:
+    """JPEG of a scanned sheet: paper noise, optionally with lines of text."""
+    sheet = rng.normal(shade, 4, (SCAN_HEIGHT, SCAN_WIDTH))
+    if text:
+        for top in range(60, SCAN_HEIGHT - 60, 18):
+            length = int(rng.integers(120, SCAN_WIDTH - 80))
+            sheet[top:top + 7, 40:40 + length] = rng.normal(40, 20, (7, length))
+    else:
+        # A few specks of dust
+        for _ in range(3):
+            y, x = rng.integers(0, SCAN_HEIGHT - 2), rng.integers(0, SCAN_WIDTH - 2)
+            sheet[y:y + 2, x:x + 2] = 30
+    pixmap = fitz.Pixmap(fitz.csGRAY, SCAN_WIDTH, SCAN_HEIGHT,
+                         np.clip(sheet, 0, 255).astype(np.uint8).tobytes(), False)
+    return pixmap.tobytes("jpg")
+
+
+def build_sample_pdf(path: str, page_count: int) -> set:
+    """Write scanned documents separated by blank or slip sheets.
+
+    Separators rotate between a scanned blank page, a coloured slip sheet
+    and a page with no content at all. Every TEXT_PAGE_EVERY-th document
+    page is born-digital with a single short line, which must not count
+    as blank. Returns the separator page numbers.
+    """
+    rng = np.random.default_rng(7)
+    text_pages = [scan_image(rng, 235, True) for _ in range(64)]
+    separators = [scan_image(rng, 238, False), scan_image(rng, 170, False), None]
+    doc = fitz.open()
+    separator_pages = set()
+    for number in range(1, page_count + 1):
+        page = doc.new_page(width=612, height=792)
+        if number % (DOCUMENT_LENGTH + 1) == 0:
+            separator_pages.add(number)
+            image = separators[len(separator_pages) % len(separators)]
+        elif number % TEXT_PAGE_EVERY == 0:
+            page.insert_text((72, 72), f"Page {number}", fontname="helv", fontsize=11)
+            image = None
+        else:
+            image = random.Random(number).choice(text_pages)
+        if image is not None:
+            page.insert_image(page.rect, stream=image)
+    doc.save(path, garbage=1)
+    doc.close()
+    return separator_pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="PDF to classify (default: generate a sample)")
+    parser.add_argument("--pages", type=int, default=5000, help="pages in the generated sample")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker processes; 0 = one per CPU (default: 0)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = args.input or os.path.join(tmp, "scan.pdf")
+        expected = None if args.input else build_sample_pdf(source_path, args.pages)
+        started = time.perf_counter()
+        verdicts = classify_pages(source_path, workers=args.workers)
+        seconds = time.perf_counter() - started
+
+    blank = {verdict.page for verdict in verdicts if verdict.blank}
+    shortcut = sum(1 for verdict in verdicts if verdict.method in (EMPTY_STREAM, TEXT_LAYER))
+    print(f"pages: {len(verdicts)}  blank: {len(blank)}  "
+          f"classified without rendering: {shortcut}")
+    print(f"proposed splits: {len(propose_splits(verdicts))}")
+    print(f"seconds: {seconds:.2f}  ({len(verdicts) / seconds:.0f} pages/s)")
+    if expected is not None:
+        print(f"missed separators: {len(expected - blank)}  "
+              f"false blanks: {len(blank - expected)}")
+
+
+if __name__ == "__main__":
+    main()
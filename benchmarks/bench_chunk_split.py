@@ -0,0 +1,107 @@
+"""Benchmark: peak memory of the every-N-pages streaming split.
+
+Each source size is split in a fresh process, which reports its peak RSS
+and its RSS after each chunk. Memory should stay flat as the source grows:
+the script exits with status 1 when the largest source's peak RSS is more
+than --tolerance-mb above the smallest's, or a chunk fails, so it can gate
+CI like startup_budget.
+
+Run from the repository root (RSS is read from /proc, so Linux only):
+
+    python -m benchmarks.bench_chunk_split --pages 5000 20000 --chunk 500
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import write_synthetic_pdf
+from src.services.pdf_service import PDFService
+
+
+# The open source's xref table alone grows by about 1 MB per 1,000 pages;
+# keeping the written chunks in memory would add tens of MB per chunk
+DEFAULT_TOLERANCE_MB = 32.0
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB."""
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def measure(source_path: str, pages_per_chunk: int, output_dir: str) -> dict:
+    """Split in this process and report the chunk count, RSS samples and time."""
+    started = time.perf_counter()
+    rss_after_chunk = []
+    failed = 0
+    for result in PDFService.split_every_n_pages(source_path, pages_per_chunk, "Bench", "VOL",
+                                                 output_folder=output_dir):
+        failed += not result['success']
+        rss_after_chunk.append(round(current_rss_mb(), 1))
+        if result['success']:
+            os.remove(result['output_path'])
+    return {
+        'chunks': len(rss_after_chunk),
+        'failed': failed,
+        'seconds': round(time.perf_counter() - started, 2),
+        'rss_first_chunk_mb': rss_after_chunk[0],
+        'rss_last_chunk_mb': rss_after_chunk[-1],
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs='+', default=[5000, 20000],
+                        help="source sizes to compare (default: 5000 20000)")
+    parser.add_argument("--chunk", type=int, default=500, help="pages per output")
+    parser.add_argument("--tolerance-mb", type=float, default=DEFAULT_TOLERANCE_MB,
+                        help="allowed peak RSS growth from the smallest to the largest "
+                             f"source (default: {DEFAULT_TOLERANCE_MB:g})")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        with tempfile.TemporaryDirectory() as output_dir:
+            print(json.dumps(measure(args.measure, args.chunk, output_dir)))
+        return 0
+
+    peaks = {}
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for page_count in sorted(args.pages):
+            source_path = os.path.join(tmp, f"source_{page_count}.pdf")
+            write_synthetic_pdf(source_path, page_count)
+            child = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_chunk_split",
+                 "--measure", source_path, "--chunk", str(args.chunk)],
+                capture_output=True, text=True, check=True
+            )
+            stats = json.loads(child.stdout.strip().splitlines()[-1])
+            print(f"{page_count} pages ({os.path.getsize(source_path) / 2**20:.0f} MB): "
+                  f"{stats['chunks']} chunks in {stats['seconds']:.2f} s, failed {stats['failed']}, "
+                  f"RSS after first/last chunk {stats['rss_first_chunk_mb']}/"
+                  f"{stats['rss_last_chunk_mb']} MB, peak {stats['peak_rss_mb']} MB")
+            os.remove(source_path)
+            peaks[page_count] = stats['peak_rss_mb']
+            failed += stats['failed']
+
+    growth = peaks[max(peaks)] - peaks[min(peaks)]
+    print(f"peak RSS growth: {growth:.1f} MB (tolerance {args.tolerance_mb:g} MB)")
+    if failed:
+        print(f"FAIL: {failed} chunk(s) failed")
+        return 1
+    if growth > args.tolerance_mb:
+        print("FAIL: memory grows with the source size")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
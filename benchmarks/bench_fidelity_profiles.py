@@ -0,0 +1,58 @@
+"""Benchmark: copy time per fidelity profile on an annotation-heavy PDF.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_fidelity_profiles --pages 300
+    python -m benchmarks.bench_fidelity_profiles --input some.pdf
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Tuple
+
+from benchmarks.corpus import build_annotated_pdf
+from src.services.fidelity_profiles import FIDELITY_PROFILES
+from src.services.split_session import SplitSession
+
+
+def run(source_path: str, repeat: int) -> List[Tuple[str, float]]:
+    """Copy the whole source once per profile and keep the best time."""
+    rows = []
+    with SplitSession(source_path) as session:
+        selection = session.select_pages(1, session.page_count)
+        for profile in FIDELITY_PROFILES:
+            best = float('inf')
+            for _ in range(repeat):
+                started = time.perf_counter()
+                new_doc = session.extract_selection(selection, profile)
+                best = min(best, time.perf_counter() - started)
+                new_doc.close()
+            rows.append((profile, best))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="PDF to split (default: generate a sample)")
+    parser.add_argument("--pages", type=int, default=300, help="pages in the generated sample")
+    parser.add_argument("--repeat", type=int, default=3, help="copies per profile")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = args.input or os.path.join(tmp, "annotated.pdf")
+        if not args.input:
+            build_annotated_pdf(source_path, args.pages)
+        rows = run(source_path, args.repeat)
+
+    full_time = dict(rows)['full']
+    print(f"{'profile':<12}{'copy s':>10}{'saved s':>10}{'saved':>8}")
+    for profile, seconds in rows:
+        saved = full_time - seconds
+        share = saved / full_time if full_time else 0.0
+        print(f"{profile:<12}{seconds:>10.3f}{saved:>10.3f}{share:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: folder batch intake and splitting, serial against parallel.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_folder_batch --files 240 --pages 40
+    python -m benchmarks.bench_folder_batch --folder inbox/ --rule every --rule-pages 10
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from benchmarks.corpus import write_synthetic_pdf
+from src.services.folder_batch import SplitRule, run_folder_batch
+from src.services.metadata_cache import get_metadata_cache
+
+
+def build_sample_folder(folder: str, file_count: int, page_count: int) -> None:
+    """Write file_count PDFs, varying the page count so files differ in cost."""
+    for number in range(file_count):
+        write_synthetic_pdf(os.path.join(folder, f"Intake{number:04d}.pdf"),
+                            page_count + number % 7 * page_count // 4)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--folder", help="folder of PDFs (default: generate a sample)")
+    parser.add_argument("--files", type=int, default=240, help="files in the generated sample")
+    parser.add_argument("--pages", type=int, default=40, help="base pages per generated file")
+    parser.add_argument("--rule", default="cover", choices=["cover", "every"])
+    parser.add_argument("--rule-pages", type=int, default=1)
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 0],
+                        help="worker counts to compare; 0 = one per CPU (default: 1 0)")
+    args = parser.parse_args()
+
+    rule = SplitRule(args.rule, args.rule_pages)
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = args.folder
+        if not folder:
+            folder = os.path.join(tmp, "inbox")
+            os.mkdir(folder)
+            build_sample_folder(folder, args.files, args.pages)
+        for workers in args.workers:
+            output_folder = os.path.join(tmp, f"out_{workers}")
+            os.mkdir(output_folder)
+            get_metadata_cache().clear()
+            summary = run_folder_batch(folder, rule, output_folder, workers=workers)['summary']
+            print(f"workers {workers or os.cpu_count()}: {summary['files']} files, "
+                  f"{summary['pages']} pages -> {summary['outputs']} outputs "
+                  f"(failed {summary['failed']}, invalid {summary['invalid']})  "
+                  f"intake {summary['intake_seconds']:.2f} s  "
+                  f"total {summary['total_seconds']:.2f} s")
+            shutil.rmtree(output_folder)
+
+
+if __name__ == "__main__":
+    main()
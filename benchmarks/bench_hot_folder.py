@@ -0,0 +1,77 @@
+"""Benchmark: draining a burst of files dropped into a watched inbox.
+
+A watcher is started on an empty inbox, then the burst is written at
+once. The watcher's peak RSS should not grow with the burst size,
+because at most --max-queued files are tracked at a time.
+
+Run from the repository root (RSS is read from /proc, so Linux only):
+
+    python -m benchmarks.bench_hot_folder --files 200 1000 --max-queued 100
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import tempfile
+import threading
+import time
+
+from benchmarks.corpus import write_synthetic_pdf
+from src.services.folder_batch import SplitRule
+from src.services.hot_folder import FolderConfig, HotFolderService
+
+
+def run_burst(template_path: str, file_count: int, max_queued: int, workers: int) -> dict:
+    """Drop file_count copies into a watched inbox and time until all are split."""
+    with tempfile.TemporaryDirectory() as tmp:
+        inbox, output = os.path.join(tmp, "in"), os.path.join(tmp, "out")
+        os.mkdir(inbox)
+        os.mkdir(output)
+        events = {'file': 0, 'backpressure': 0}
+
+        def on_event(event: dict) -> None:
+            if event['event'] in events:
+                events[event['event']] += 1
+                if events['file'] == file_count:
+                    service.stop()
+
+        service = HotFolderService([inbox], FolderConfig(SplitRule('cover', 1), output),
+                                   workers=workers, max_queued=max_queued,
+                                   settle_seconds=0.2, on_event=on_event)
+        watcher = threading.Thread(target=service.run)
+        watcher.start()
+        time.sleep(0.5)
+        started = time.perf_counter()
+        for number in range(file_count):
+            shutil.copyfile(template_path, os.path.join(inbox, f"scan{number:05}.pdf"))
+        watcher.join()
+        return {
+            'files': file_count,
+            'seconds': round(time.perf_counter() - started, 2),
+            'counts': service.counts,
+            'backpressure_events': events['backpressure'],
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, nargs='+', default=[200, 1000],
+                        help="burst sizes to compare (default: 200 1000)")
+    parser.add_argument("--pages", type=int, default=4, help="pages per file")
+    parser.add_argument("--max-queued", type=int, default=100, help="files tracked at once")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template_path = os.path.join(tmp, "template.pdf")
+        write_synthetic_pdf(template_path, args.pages)
+        for file_count in args.files:
+            print(json.dumps(run_burst(template_path, file_count, args.max_queued,
+                                       args.workers)))
+
+
+if __name__ == "__main__":
+    main()
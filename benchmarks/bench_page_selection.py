@@ -0,0 +1,80 @@
+"""Benchmark: per-page insert_pdf loop vs compiled page-selection runs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_page_selection --pages 2000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+import fitz  # PyMuPDF
+
+from src.models.page_selection import compile_selection
+from src.services.split_session import SplitSession
+
+
+def build_sample_pdf(path: str, page_count: int) -> None:
+    """Write a PDF whose pages share one font and carry a little text."""
+    doc = fitz.open()
+    for number in range(1, page_count + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Synthetic page {number}", fontname="helv")
+        page.insert_text((72, 100), "Lorem ipsum dolor sit amet " * 4, fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+def per_page_loop(source: fitz.Document, pages: List[int]) -> fitz.Document:
+    """The original strategy: one insert_pdf call per page."""
+    output = fitz.open()
+    for page in pages:
+        output.insert_pdf(source, from_page=page - 1, to_page=page - 1)
+    return output
+
+
+def time_call(func: Callable[[], fitz.Document], repeat: int) -> float:
+    """Best wall-clock time over several runs, closing each result."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func()
+        best = min(best, time.perf_counter() - started)
+        output.close()
+    return best
+
+
+def run(page_count: int, expressions: List[str], repeat: int) -> List[Tuple[str, int, int, float, float]]:
+    """Benchmark every expression against a freshly generated PDF."""
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "sample.pdf")
+        build_sample_pdf(source_path, page_count)
+        with SplitSession(source_path) as session:
+            for expression in expressions:
+                selection = compile_selection(expression, session.page_count)
+                pages = selection.pages()
+                loop_time = time_call(lambda: per_page_loop(session.doc, pages), repeat)
+                runs_time = time_call(lambda: session.extract_selection(selection), repeat)
+                rows.append((expression, len(pages), len(selection.runs), loop_time, runs_time))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000, help="pages in the sample PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    expressions = ["all", "1-50,75,80-120,last-10", "odd"]
+    print(f"{'selection':<26}{'pages':>7}{'runs':>7}{'per-page s':>12}{'runs s':>10}{'speedup':>9}")
+    for expression, pages, runs, loop_time, runs_time in run(args.pages, expressions, args.repeat):
+        speedup = loop_time / runs_time if runs_time else float('inf')
+        print(f"{expression:<26}{pages:>7}{runs:>7}{loop_time:>12.3f}{runs_time:>10.3f}{speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: fast structural pre-validation vs a full open and page count.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_prevalidation --pages 5000
+    python -m benchmarks.bench_prevalidation --input some.pdf
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable
+
+import fitz  # PyMuPDF
+
+from src.services.pdf_prevalidator import prevalidate_pdf
+
+
+def build_sample_pdf(path: str, page_count: int) -> None:
+    """Write a text-only PDF with page_count pages."""
+    doc = fitz.open()
+    for number in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Sample page {number + 1}", fontname="helv")
+    doc.save(path)
+    doc.close()
+
+
+def full_open(path: str) -> bool:
+    """What validation did before: open the document and count pages."""
+    doc = fitz.open(path)
+    try:
+        return len(doc) > 0
+    finally:
+        doc.close()
+
+
+def best_time(check: Callable[[str], object], path: str, repeat: int) -> float:
+    """Fastest of repeat runs of check(path), in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        check(path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="PDF to validate (default: generate a sample)")
+    parser.add_argument("--pages", type=int, default=5000, help="pages in the generated sample")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per method")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = args.input or os.path.join(tmp, "sample.pdf")
+        if not args.input:
+            build_sample_pdf(source_path, args.pages)
+        result = prevalidate_pdf(source_path)
+        fast = best_time(prevalidate_pdf, source_path, args.repeat)
+        full = best_time(full_open, source_path, args.repeat)
+
+    print(f"pre-validation verdict: {result.verdict} ({result.reason})")
+    print(f"{'method':<10}{'seconds':>12}")
+    print(f"{'fast':<10}{fast:>12.5f}")
+    print(f"{'full':<10}{full:>12.5f}")
+    if fast:
+        print(f"speed-up: {full / fast:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark: save time and output size for each save profile.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_save_profiles --pages 500
+    python -m benchmarks.bench_save_profiles --input some.pdf
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import warnings
+from typing import List, Tuple
+
+import fitz  # PyMuPDF
+
+from src.services.save_profiles import SAVE_PROFILES, save_document
+from src.services.split_session import SplitSession
+
+
+def build_sample_pdf(path: str, page_count: int) -> None:
+    """Write a PDF with repeated text and an embedded image on every page."""
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 200), False)
+    pixmap.set_rect(pixmap.irect, (90, 140, 200))
+    image = pixmap.tobytes("png")
+    doc = fitz.open()
+    for number in range(1, page_count + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Synthetic page {number}", fontname="helv")
+        page.insert_textbox(fitz.Rect(72, 100, 540, 400),
+                            "Lorem ipsum dolor sit amet, consectetur adipiscing. " * 20,
+                            fontsize=9)
+        page.insert_image(fitz.Rect(72, 420, 272, 620), stream=image)
+    doc.save(path)
+    doc.close()
+
+
+def run(source_path: str, output_dir: str, repeat: int) -> List[Tuple[str, float, int]]:
+    """Split the whole source once per profile and measure the save."""
+    rows = []
+    with SplitSession(source_path) as session:
+        selection = session.select_pages(1, session.page_count)
+        for profile in SAVE_PROFILES:
+            output_path = os.path.join(output_dir, f"out_{profile}.pdf")
+            best = float('inf')
+            for _ in range(repeat):
+                new_doc = session.extract_selection(selection)
+                started = time.perf_counter()
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    save_document(new_doc, output_path, profile)
+                best = min(best, time.perf_counter() - started)
+                new_doc.close()
+            rows.append((profile, best, os.path.getsize(output_path)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="PDF to split (default: generate a sample)")
+    parser.add_argument("--pages", type=int, default=500, help="pages in the generated sample")
+    parser.add_argument("--repeat", type=int, default=3, help="saves per profile")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = args.input or os.path.join(tmp, "sample.pdf")
+        if not args.input:
+            build_sample_pdf(source_path, args.pages)
+        source_size = os.path.getsize(source_path)
+        print(f"source: {source_size / 1024:.0f} KiB")
+        print(f"{'profile':<10}{'save s':>10}{'size KiB':>12}{'vs source':>11}")
+        for profile, seconds, size in run(source_path, tmp, args.repeat):
+            print(f"{profile:<10}{seconds:>10.3f}{size / 1024:>12.0f}{size / source_size:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
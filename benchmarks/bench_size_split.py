@@ -0,0 +1,112 @@
+"""Benchmark: splitting to a maximum file size from per-page estimates.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_size_split --pages 2000 --max-mb 5
+    python -m benchmarks.bench_size_split --input filing.pdf --max-mb 10
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+
+from src.services.metadata_cache import get_metadata_cache
+from src.services.pdf_service import PDFService
+from src.services.size_splitter import MEGABYTE, get_cost_table, pack_pages
+
+
+TEMPLATE_PAGES = 10
+
+
+def build_sample_pdf(path: str, page_count: int) -> None:
+    """Write pages mixing shared resources with per-page images.
+
+    Nine of every ten pages are grafted from a template, so each has its
+    own content stream but all share one logo image and the fonts. The
+    tenth page also carries a photo-sized image of its own, so parts
+    differ in size.
+    """
+    logo = solid_pixmap(300, 100, (20, 60, 120))
+    template = fitz.open()
+    for number in range(TEMPLATE_PAGES):
+        page = template.new_page(width=612, height=792)
+        page.insert_image(fitz.Rect(36, 20, 186, 70), pixmap=logo)
+        page.insert_textbox(fitz.Rect(72, 100, 540, 740),
+                            f"Template page {number}\n" + "Lorem ipsum dolor sit amet. " * 120,
+                            fontsize=9, fontname="helv")
+    doc = fitz.open()
+    while doc.page_count < page_count:
+        doc.insert_pdf(template, to_page=min(TEMPLATE_PAGES, page_count - doc.page_count) - 2,
+                       final=0)
+        if doc.page_count < page_count:
+            with fitz.open() as photo_page:
+                photo_page.insert_pdf(template, from_page=TEMPLATE_PAGES - 1)
+                photo_page[0].insert_image(
+                    fitz.Rect(72, 500, 472, 750),
+                    pixmap=solid_pixmap(400, 300, (doc.page_count % 255, 90, 200))
+                )
+                doc.insert_pdf(photo_page)
+    doc.save(path, garbage=1)
+    doc.close()
+    template.close()
+
+
+def solid_pixmap(width: int, height: int, rgb: tuple) -> 'fitz.Pixmap':
+    """An RGB pixmap of one colour."""
+    return fitz.Pixmap(fitz.csRGB, width, height, bytes(rgb) * (width * height), False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="PDF to split (default: generate a sample)")
+    parser.add_argument("--pages", type=int, default=2000, help="pages in the generated sample")
+    parser.add_argument("--max-mb", type=float, default=5.0, help="size limit per part")
+    parser.add_argument("--save-profile", default="fast", help="output save profile")
+    args = parser.parse_args()
+    max_bytes = int(args.max_mb * MEGABYTE)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = args.input or os.path.join(tmp, "sample.pdf")
+        if not args.input:
+            build_sample_pdf(source_path, args.pages)
+
+        started = time.perf_counter()
+        with fitz.open(source_path) as doc:
+            table = get_cost_table(doc, source_path, args.save_profile)
+        estimate_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        ranges = pack_pages(table, max_bytes)
+        pack_seconds = time.perf_counter() - started
+
+        output_dir = os.path.join(tmp, "out")
+        os.mkdir(output_dir)
+        started = time.perf_counter()
+        results = PDFService.split_by_size(source_path, max_bytes, "Bench", "SIZE",
+                                           output_folder=output_dir,
+                                           save_profile=args.save_profile)
+        split_seconds = time.perf_counter() - started
+        source_bytes = os.path.getsize(source_path)
+        page_count = get_metadata_cache().get(source_path).page_count
+
+    parts = [result for result in results if result.get('success')]
+    errors = [abs(part['estimated_bytes'] - part['size_bytes']) / part['size_bytes']
+              for part in parts]
+    over = sum(1 for part in parts if part['size_bytes'] > max_bytes)
+    print(f"source: {page_count} pages, {source_bytes / MEGABYTE:.1f} MB  "
+          f"limit: {args.max_mb:g} MB")
+    print(f"estimate table: {estimate_seconds:.3f} s  packing: {pack_seconds * 1000:.1f} ms  "
+          f"planned parts: {len(ranges)}")
+    print(f"written parts: {len(parts)}  failed: {len(results) - len(parts)}  "
+          f"re-split: {len(parts) - len(ranges)}  over limit: {over}")
+    if parts:
+        print(f"estimate error: mean {100 * sum(errors) / len(errors):.1f}%  "
+              f"max {100 * max(errors):.1f}%")
+        print(f"largest part: {max(part['size_bytes'] for part in parts) / MEGABYTE:.2f} MB")
+    print(f"split seconds: {split_seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
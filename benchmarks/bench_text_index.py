@@ -0,0 +1,66 @@
+"""Benchmark: pattern splitting with a fresh vs a reused page-text index.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_text_index --pages 2000
+    python -m benchmarks.bench_text_index --input filing.pdf --pattern "EXHIBIT [A-Z]+"
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+
+from src.services.page_text_index import PageTextIndex
+from src.services.pattern_splitter import find_pattern_splits
+
+
+EXHIBIT_LENGTH = 40      # Pages per exhibit in the generated sample
+BODY_LINES = 30
+
+
+def build_sample_pdf(path: str, page_count: int) -> None:
+    """Write exhibits with an "EXHIBIT <letters>" header on every page."""
+    doc = fitz.open()
+    for number in range(page_count):
+        exhibit = number // EXHIBIT_LENGTH
+        label = chr(65 + exhibit % 26) * (exhibit // 26 + 1)
+        page = doc.new_page()
+        page.insert_text((72, 50), f"EXHIBIT {label}", fontname="helv", fontsize=14)
+        body = "\n".join(f"Paragraph {line} of page {number + 1}, exhibit {label}."
+                         for line in range(BODY_LINES))
+        page.insert_text((72, 140), body, fontname="helv", fontsize=10)
+    doc.save(path)
+    doc.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="PDF to search (default: generate a sample)")
+    parser.add_argument("--pages", type=int, default=2000, help="pages in the generated sample")
+    parser.add_argument("--pattern", default=r"EXHIBIT [A-Z]+", help="first regex pattern")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="extraction processes; 0 = one per CPU (default: 0)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = args.input or os.path.join(tmp, "exhibits.pdf")
+        if not args.input:
+            build_sample_pdf(source_path, args.pages)
+        index = PageTextIndex()
+        runs = [("first pattern (builds index)", args.pattern, 'regex'),
+                ("second pattern (reuses index)", r"^EXHIBIT (\w+)$", 'regex'),
+                ("FTS query (reuses index)", "EXHIBIT", 'fts')]
+        print(f"{'run':<32}{'seconds':>10}{'splits':>8}")
+        for label, pattern, mode in runs:
+            started = time.perf_counter()
+            splits = find_pattern_splits(source_path, pattern, mode=mode,
+                                         workers=args.workers, index=index)
+            print(f"{label:<32}{time.perf_counter() - started:>10.3f}{len(splits):>8}")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Reproducible synthetic PDFs for the benchmarks.
+
+Every kind is generated from a seed, so two runs of the same
+(kind, pages, seed) produce byte-identical files and benchmark numbers
+compare like with like:
+
+    text         one content stream of text per page, no images
+    scan         one full-page grayscale JPEG per page, like a scanner's output
+    fonts        text in a dozen embedded fonts shared across pages
+    annotations  internal links, notes and a form field on every page
+    large        text plus a small image per page, for 10,000+ page sources
+
+text, scan and large are written directly rather than through PyMuPDF,
+which takes seconds instead of minutes for tens of thousands of pages.
+
+Run from the repository root to write a corpus folder:
+
+    python -m benchmarks.corpus out/ --kinds text scan --pages 200
+"""
+
+import argparse
+import os
+import random
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+
+CORPUS_VERSION = 1        # Bump when a generator changes its output
+IMAGE_BYTES = 8000        # Uncompressed grayscale image on every large page (40 x 200)
+TEXT_LINES = 40
+SCAN_WIDTH, SCAN_HEIGHT = 850, 1100        # 100 dpi letter
+SCAN_VARIANTS = 8                          # Distinct page images, made unique per page
+EMBEDDED_FONTS = ['tiro', 'tibo', 'tiit', 'tibi', 'cour', 'cobo', 'coit', 'cobi',
+                  'helv', 'hebo', 'heit', 'hebi']
+FONTS_PER_PAGE = 4
+
+# (width, height, filter, data) of a grayscale image XObject
+Image = Tuple[int, int, str, bytes]
+# Content stream and optional image of one page
+Page = Tuple[bytes, Optional[Image]]
+
+
+def write_synthetic_pdf(path: str, page_count: int, image_bytes: int = IMAGE_BYTES,
+                        seed: int = 0) -> None:
+    """Write a PDF whose pages each have their own content stream and image.
+
+    Args:
+        path: Output file
+        page_count: Number of pages
+        image_bytes: Size of each page's uncompressed image; 0 for text only
+        seed: Seed for the image contents
+    """
+    rng = random.Random(seed)
+    height = image_bytes // 40
+
+    def pages() -> Iterator[Page]:
+        for page in range(page_count):
+            lines = b" ".join(b"(Page %d line %d lorem ipsum dolor sit amet) Tj T*" % (page, line)
+                              for line in range(TEXT_LINES))
+            text = b"BT /F1 9 Tf 72 720 Td 11 TL " + lines + b" ET"
+            if not image_bytes:
+                yield text, None
+            else:
+                yield (b"q 200 0 0 400 300 300 cm /Im0 Do Q " + text,
+                       (40, height, '', rng.randbytes(40 * height)))
+
+    _write_pages(path, pages())
+
+
+def write_scan_pdf(path: str, page_count: int, seed: int = 0) -> None:
+    """Write a PDF of full-page grayscale JPEGs with paper noise and text lines."""
+    rng = random.Random(seed)
+    variants = [_scan_jpeg(rng) for _ in range(SCAN_VARIANTS)]
+
+    def pages() -> Iterator[Page]:
+        for page in range(page_count):
+            jpeg = variants[page % SCAN_VARIANTS]
+            # A comment segment after SOI makes every page's image unique
+            comment = b"page %d" % page
+            segment = b"\xff\xfe" + (len(comment) + 2).to_bytes(2, 'big') + comment
+            unique = jpeg[:2] + segment + jpeg[2:]
+            yield (b"q 612 0 0 792 0 0 cm /Im0 Do Q",
+                   (SCAN_WIDTH, SCAN_HEIGHT, 'DCTDecode', unique))
+
+    _write_pages(path, pages())
+
+
+def write_fonts_pdf(path: str, page_count: int, seed: int = 0) -> None:
+    """Write text set in several embedded fonts per page, shared across pages."""
+    rng = random.Random(seed)
+    buffers = {name: fitz.Font(name).buffer for name in EMBEDDED_FONTS}
+    doc = fitz.open()
+    for number in range(page_count):
+        page = doc.new_page()
+        for slot, name in enumerate(rng.sample(EMBEDDED_FONTS, FONTS_PER_PAGE)):
+            page.insert_font(fontname=f"F{slot}", fontbuffer=buffers[name])
+            page.insert_text((72, 72 + slot * 160),
+                             f"Page {number + 1} in {name}. " + "Sphinx of black quartz. " * 4,
+                             fontname=f"F{slot}", fontsize=10)
+    # Identical font programs collapse into one object each
+    _save_reproducibly(doc, path, garbage=3)
+
+
+def build_annotated_pdf(path: str, page_count: int, per_page: int = 15, seed: int = 0) -> None:
+    """Write a PDF whose pages carry internal links, notes and form fields."""
+    doc = fitz.open()
+    for _ in range(page_count):
+        doc.new_page()
+    for number, page in enumerate(doc):
+        page.insert_text((72, 60), f"Annotated page {number + 1}", fontname="helv")
+        for i in range(per_page):
+            rect = fitz.Rect(72, 80 + i * 20, 300, 96 + i * 20)
+            target = (number + i + 1 + seed) % page_count
+            page.insert_link({'kind': fitz.LINK_GOTO, 'from': rect, 'page': target})
+            page.add_text_annot(fitz.Point(320, 88 + i * 20), f"Note {i}")
+        widget = fitz.Widget()
+        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+        widget.field_name = f"field_{number}"
+        widget.rect = fitz.Rect(72, 420, 300, 440)
+        page.add_widget(widget)
+    _save_reproducibly(doc, path)
+
+
+GENERATORS: Dict[str, Callable[..., None]] = {
+    'text': lambda path, pages, seed: write_synthetic_pdf(path, pages, 0, seed),
+    'scan': write_scan_pdf,
+    'fonts': write_fonts_pdf,
+    'annotations': lambda path, pages, seed: build_annotated_pdf(path, pages, seed=seed),
+    'large': lambda path, pages, seed: write_synthetic_pdf(path, pages, IMAGE_BYTES, seed),
+}
+CORPUS_KINDS = tuple(GENERATORS)
+
+
+def corpus_file(folder: str, kind: str, page_count: int, seed: int = 0) -> str:
+    """Path of a corpus PDF in folder, generating it on first use.
+
+    Files are named after their kind, size, seed and generator version,
+    so a cached corpus is reused only if it is what would be generated.
+
+    Raises:
+        ValueError: If kind is not a corpus kind
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown corpus kind '{kind}'. Choose from: {', '.join(CORPUS_KINDS)}")
+    path = Path(folder) / f"{kind}_{page_count}p_s{seed}_v{CORPUS_VERSION}.pdf"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix('.tmp')
+        GENERATORS[kind](str(partial), page_count, seed)
+        os.replace(partial, path)
+    return str(path)
+
+
+def _save_reproducibly(doc: 'fitz.Document', path: str, **options) -> None:
+    """Save without the timestamps and random file ID PyMuPDF would add."""
+    doc.set_metadata({})
+    doc.save(path, no_new_id=True, **options)
+    doc.close()
+
+
+def _scan_jpeg(rng: random.Random) -> bytes:
+    """JPEG of a scanned sheet: paper noise with dark bands for lines of text."""
+    paper = bytes(228 + value % 14 for value in range(256))
+    ink = bytes(40 + value % 90 for value in range(256))
+    rows: List[bytes] = []
+    for row in range(SCAN_HEIGHT):
+        noise = rng.randbytes(SCAN_WIDTH)
+        in_text = 100 <= row < SCAN_HEIGHT - 100 and row % 22 < 9
+        if in_text:
+            length = rng.randrange(300, SCAN_WIDTH - 160)
+            rows.append(noise[:80].translate(paper) + noise[80:80 + length].translate(ink)
+                        + noise[80 + length:].translate(paper))
+        else:
+            rows.append(noise.translate(paper))
+    pixmap = fitz.Pixmap(fitz.csGRAY, SCAN_WIDTH, SCAN_HEIGHT, b"".join(rows), False)
+    return pixmap.tobytes("jpg", jpg_quality=70)
+
+
+def _write_pages(path: str, pages: Iterator[Page]) -> None:
+    """Write pages sharing one font, each with its own content and image objects."""
+    offsets: List[int] = []
+    kids: List[int] = []
+    with open(path, 'wb') as handle:
+        def write_object(body: bytes, stream: bytes = b'') -> int:
+            offsets.append(handle.tell())
+            handle.write(b"%d 0 obj\n" % len(offsets) + body)
+            if stream:
+                handle.write(b"\nstream\n" + stream + b"\nendstream")
+            handle.write(b"\nendobj\n")
+            return len(offsets)
+
+        handle.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        # The page tree goes last, once the page numbers are known: reserve 1 and 2
+        offsets.extend([0, 0])
+        font = write_object(b"<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>")
+        for content, image in pages:
+            resources = b"/Font<</F1 %d 0 R>>" % font
+            if image:
+                width, height, filter_name, data = image
+                filter_entry = b"/Filter/" + filter_name.encode() if filter_name else b""
+                image_xref = write_object(
+                    b"<</Type/XObject/Subtype/Image/Width %d/Height %d/ColorSpace/DeviceGray"
+                    b"/BitsPerComponent 8%s/Length %d>>" % (width, height, filter_entry, len(data)),
+                    data
+                )
+                resources += b"/XObject<</Im0 %d 0 R>>" % image_xref
+            content_xref = write_object(b"<</Length %d>>" % len(content), content)
+            kids.append(write_object(b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]"
+                                     b"/Contents %d 0 R/Resources<<%s>>>>"
+                                     % (content_xref, resources)))
+        for xref, body in ((1, b"<</Type/Catalog/Pages 2 0 R>>"),
+                           (2, b"<</Type/Pages/Count %d/Kids[%s]>>"
+                            % (len(kids), b" ".join(b"%d 0 R" % kid for kid in kids)))):
+            offsets[xref - 1] = handle.tell()
+            handle.write(b"%d 0 obj\n" % xref + body + b"\nendobj\n")
+        xref_offset = handle.tell()
+        handle.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1))
+        handle.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+        handle.write(b"trailer\n<</Size %d/Root 1 0 R>>\nstartxref\n%d\n%%%%EOF\n"
+                     % (len(offsets) + 1, xref_offset))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", help="folder to write the corpus to")
+    parser.add_argument("--kinds", nargs='+', default=list(CORPUS_KINDS), choices=CORPUS_KINDS)
+    parser.add_argument("--pages", type=int, default=200,
+                        help="pages per file (large: 50 times this)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for kind in args.kinds:
+        pages = args.pages * 50 if kind == 'large' else args.pages
+        path = corpus_file(args.folder, kind, pages, args.seed)
+        print(f"{path}: {os.path.getsize(path) / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
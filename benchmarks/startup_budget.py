@@ -0,0 +1,44 @@
+"""Cold-start budget check for the GUI.
+
+Launches `main_gui.py --measure-startup` under `-X importtime` and exits
+with status 1 when the time to first paint exceeds the budget, so it can
+gate CI:
+
+    python -m benchmarks.startup_budget --budget 1.5
+"""
+
+import argparse
+import sys
+
+from src.startup_profile import measure_cold_start
+
+
+DEFAULT_BUDGET_SECONDS = 1.5
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help="maximum seconds from process start to first paint")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="launches to measure; the best is compared to the budget")
+    args = parser.parse_args()
+
+    results = [measure_cold_start() for _ in range(max(1, args.runs))]
+    best = min(results, key=lambda result: result['first_paint_seconds'])
+    print(f"first paint:  {best['first_paint_seconds']:.3f} s (budget {args.budget:.3f} s)")
+    print(f"window.show:  {best['window_show_seconds']:.3f} s")
+    print(f"process wall: {best['wall_seconds']:.3f} s")
+    print("slowest imports (self time):")
+    for module, self_us in best['slowest_imports']:
+        print(f"  {self_us / 1000:8.1f} ms  {module}")
+
+    if best['first_paint_seconds'] > args.budget:
+        print("FAIL: cold start is over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""Benchmark suite: timed split, validation, metadata and gap cases.
+
+Every case runs against a reproducible synthetic corpus (see corpus.py),
+kept in --corpus-dir between runs. Each case is run once to warm up and
+then sampled for --min-seconds, spread over --rounds passes through all
+cases. The best sample is compared with the stored baseline, since it is
+the least disturbed by other load, and a case slower than the baseline
+by more than --threshold counts as a regression (exit code 1). Baselines
+are only comparable on the same machine, so record one there before
+comparing:
+
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite                      # compare with the baseline
+    python -m benchmarks.suite --cases split --threshold 0.15 --output run.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import fitz  # PyMuPDF
+
+from benchmarks.corpus import CORPUS_VERSION, corpus_file
+from src.models.page_coverage import PageCoverage
+from src.services.metadata_cache import MetadataCache, read_metadata
+from src.services.pdf_processor import PDFProcessor
+from src.services.pdf_service import PDFService
+
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+DEFAULT_CORPUS_DIR = Path(tempfile.gettempdir()) / 'sps-benchmark-corpus'
+DEFAULT_THRESHOLD = 0.30      # 30% slower than the baseline is a regression
+DEFAULT_ROUNDS = 5            # Passes over all cases; each samples every case
+DEFAULT_MIN_SECONDS = 1.0     # Timed seconds per case, spread over the rounds
+DOCUMENT_PAGES = 200
+LARGE_PAGES = 10000
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmark: run(source_path, output_dir) is timed as a whole."""
+    name: str
+    kind: str
+    pages: int
+    run: Callable[[str, str], Any]
+    number: int = 1           # Calls per timing, for cases too fast to time once
+
+
+def split_first_half(source: str, output_dir: str) -> None:
+    PDFService.split_pdf(source, 1, DOCUMENT_PAGES // 2, "Bench", "HALF",
+                         output_folder=output_dir)
+
+
+def split_first_volume(source: str, output_dir: str) -> None:
+    PDFService.split_pdf(source, 1, 500, "Bench", "VOL", output_folder=output_dir)
+
+
+def processor_split(source: str, output_dir: str) -> None:
+    result = PDFProcessor.split_single({
+        'input_path': source, 'output_folder': output_dir, 'start_page': 1,
+        'end_page': DOCUMENT_PAGES // 2, 'client_name': 'Bench', 'document_code': 'HALF',
+    })
+    if not result['success']:
+        raise RuntimeError(result['error'])
+
+
+def batch_of(split_pages: int, count: int) -> Callable[[str, str], None]:
+    """A case that splits count consecutive runs of split_pages pages in one batch."""
+    def run(source: str, output_dir: str) -> None:
+        requests = [{'start_page': number * split_pages + 1,
+                     'end_page': (number + 1) * split_pages,
+                     'document_code': f"EXH{number:03d}", 'client_name': 'Bench',
+                     'output_folder': output_dir} for number in range(count)]
+        failed = [result for result in PDFService.batch_split_pdf(source, requests)
+                  if not result['success']]
+        if failed:
+            raise RuntimeError(failed[0]['error'])
+    return run
+
+
+def check_structure(source: str, output_dir: str) -> None:
+    if not PDFService.check_pdf_structure(source)['valid']:
+        raise RuntimeError(f"{source} failed validation")
+
+
+def full_open(source: str, output_dir: str) -> None:
+    with fitz.open(source) as doc:
+        doc.load_page(doc.page_count - 1)
+
+
+def metadata_uncached(source: str, output_dir: str) -> None:
+    read_metadata(source)
+
+
+def metadata_cached(source: str, output_dir: str) -> None:
+    cache = _warm_caches.setdefault(source, MetadataCache())
+    cache.get(source)
+
+
+_warm_caches: Dict[str, MetadataCache] = {}
+
+
+def gap_calculation(source: str, output_dir: str) -> None:
+    # 2,000 four-page splits with one page left out after every tenth
+    splits = [[(start, start + 3)] for start in range(1, LARGE_PAGES, 5) if start % 50 != 46]
+    coverage = PageCoverage(LARGE_PAGES, splits)
+    if not coverage.has_gaps():
+        raise RuntimeError("Expected gaps")
+
+
+CASES: List[Case] = [
+    Case('split_single/text', 'text', DOCUMENT_PAGES, split_first_half),
+    Case('split_single/scan', 'scan', DOCUMENT_PAGES, split_first_half),
+    Case('split_single/fonts', 'fonts', DOCUMENT_PAGES, split_first_half),
+    Case('split_single/annotations', 'annotations', DOCUMENT_PAGES, split_first_half),
+    Case('split_single/large', 'large', LARGE_PAGES, split_first_volume),
+    Case('processor_split/text', 'text', DOCUMENT_PAGES, processor_split),
+    Case('batch_split/text', 'text', DOCUMENT_PAGES, batch_of(4, 50)),
+    Case('batch_split/annotations', 'annotations', DOCUMENT_PAGES, batch_of(4, 50)),
+    Case('batch_split/large', 'large', LARGE_PAGES, batch_of(500, LARGE_PAGES // 500)),
+    Case('validate/scan', 'scan', DOCUMENT_PAGES, check_structure, number=200),
+    Case('validate/large', 'large', LARGE_PAGES, check_structure, number=200),
+    Case('full_open/large', 'large', LARGE_PAGES, full_open),
+    Case('metadata/large', 'large', LARGE_PAGES, metadata_uncached),
+    Case('metadata_cached/large', 'large', LARGE_PAGES, metadata_cached, number=200),
+    Case('gaps/10k_pages', 'text', DOCUMENT_PAGES, gap_calculation),
+]
+
+
+def run_cases(cases: List[Case], corpus_dir: str, rounds: int = DEFAULT_ROUNDS,
+              min_seconds: float = DEFAULT_MIN_SECONDS) -> Dict[str, Dict[str, Any]]:
+    """Time every case in interleaved rounds; seconds are per call.
+
+    Each round samples every case for min_seconds / rounds (at least one
+    sample of case.number calls), so a slow spell on a shared machine
+    affects all cases a little rather than one case a lot. Each case's
+    first call warms the caches and is not counted, and garbage
+    collection is off while timing, as in timeit.
+    """
+    sources = {case.name: corpus_file(corpus_dir, case.kind, case.pages) for case in cases}
+    times: Dict[str, List[float]] = {case.name: [] for case in cases}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for case in cases:
+            case.run(sources[case.name], output_dir)
+        for _ in range(rounds):
+            for case in cases:
+                budget = time.perf_counter() + min_seconds / rounds
+                while True:
+                    times[case.name].append(_sample(case, sources[case.name], output_dir))
+                    if time.perf_counter() >= budget:
+                        break
+    return {name: {'best': round(min(samples), 9),
+                   'median': round(statistics.median(samples), 9),
+                   'samples': len(samples)}
+            for name, samples in times.items()}
+
+
+def _sample(case: Case, source: str, output_dir: str) -> float:
+    """Seconds per call of one sample, starting from an empty output folder."""
+    shutil.rmtree(output_dir)
+    os.mkdir(output_dir)
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(case.number):
+            case.run(source, output_dir)
+        return (time.perf_counter() - started) / case.number
+    finally:
+        gc.enable()
+
+
+def environment() -> Dict[str, Any]:
+    """What the numbers depend on besides the code."""
+    return {
+        'python': platform.python_version(),
+        'pymupdf': fitz.VersionBind,
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'cpus': os.cpu_count(),
+        'corpus_version': CORPUS_VERSION,
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[Dict[str, Any]]:
+    """Each case's change against the baseline, flagged when beyond threshold."""
+    rows = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            rows.append({'case': name, 'best': result['best'], 'status': 'new'})
+            continue
+        change = result['best'] / reference['best'] - 1 if reference['best'] else 0.0
+        status = ('regression' if change > threshold
+                  else 'faster' if change < -threshold else 'ok')
+        rows.append({'case': name, 'best': result['best'], 'baseline': reference['best'],
+                     'change': round(change, 4), 'status': status})
+    return rows
+
+
+def print_rows(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'case':<28}{'baseline ms':>13}{'best ms':>11}{'change':>9}  status")
+    for row in rows:
+        baseline = f"{row['baseline'] * 1000:.2f}" if 'baseline' in row else "-"
+        change = f"{row['change']:+.1%}" if 'change' in row else "-"
+        print(f"{row['case']:<28}{baseline:>13}{row['best'] * 1000:>11.2f}{change:>9}  "
+              f"{row['status']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs='*', default=[],
+                        help="run only cases whose name contains one of these")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"interleaved passes over the cases (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS,
+                        help=f"timed seconds per case (default: {DEFAULT_MIN_SECONDS})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown that counts as a regression, as a fraction "
+                             f"(default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--corpus-dir", default=str(DEFAULT_CORPUS_DIR),
+                        help="where the generated corpus is kept between runs")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the baseline instead of comparing")
+    parser.add_argument("--output", default="", help="also write this run's results as JSON")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES
+             if not args.cases or any(part in case.name for part in args.cases)]
+    results = run_cases(cases, args.corpus_dir, args.rounds, args.min_seconds)
+    run = {'environment': environment(), 'cases': results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(run, indent=2) + "\n", encoding='utf-8')
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline or not baseline_path.exists():
+        print_rows(compare(results, {}, args.threshold))
+    if args.save_baseline:
+        if baseline_path.exists() and args.cases:
+            # Keep the cases this run skipped
+            stored = json.loads(baseline_path.read_text(encoding='utf-8'))
+            run['cases'] = {**stored['cases'], **results}
+        baseline_path.write_text(json.dumps(run, indent=2) + "\n", encoding='utf-8')
+        print(f"Baseline saved to {baseline_path}")
+        return EXIT_OK
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline first")
+        return EXIT_OK
+
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    if baseline['environment'] != run['environment']:
+        print(f"Warning: baseline recorded on {baseline['environment']}, "
+              f"this run on {run['environment']}")
+    rows = compare(results, baseline['cases'], args.threshold)
+    print_rows(rows)
+    regressions = [row['case'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        return EXIT_REGRESSION
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
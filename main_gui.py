@@ -1,8 +1,23 @@
+import time
+_STARTED_AT = time.perf_counter()
+
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from src.gui.main_window_clean import MainWindowStyled as MainWindow
 
+# Same value as src.startup_profile.MEASURE_FLAG, kept literal so normal
+# launches don't import the profiling module
+MEASURE_FLAG = "--measure-startup"
+
+
+def _report_first_paint(app, shown_at):
+    """Print cold-start timings as JSON and quit (measurement mode)."""
+    import json
+    from src.startup_profile import first_paint_report
+    print(json.dumps(first_paint_report(_STARTED_AT, shown_at)), flush=True)
+    app.quit()
+
 
 def main():
     app = QApplication(sys.argv)
@@ -12,8 +27,16 @@ def main():
     window = MainWindow()
     window.show()
     
+    if MEASURE_FLAG in sys.argv:
+        # Fires once the event loop has processed the first paint
+        shown_at = time.perf_counter()
+        QTimer.singleShot(0, lambda: _report_first_paint(app, shown_at))
+    
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Required for process-pool batch splits in the frozen Windows build
+    import multiprocessing
+    multiprocessing.freeze_support()
+    main()
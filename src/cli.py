@@ -0,0 +1,460 @@
+"""Headless command-line entry point for batch splitting.
+
+Usage:
+    python -m src.cli split input.pdf --plan plan.json [--workers 4] [--journal job.jsonl]
+    python -m src.cli resume job.jsonl
+    python -m src.cli detect scan.pdf [--plan-out plan.json]
+    python -m src.cli pattern input.pdf "EXHIBIT [A-Z]+" [--plan-out plan.json]
+    python -m src.cli size input.pdf --max-mb 10 --document-code EXH
+    python -m src.cli every input.pdf --pages 500 --document-code VOL
+    python -m src.cli folder inbox/ --rule cover --output-folder out/ [--report report.json]
+    python -m src.cli watch inbox/ --output-folder out/ [--once]
+    python -m src.cli --trace chrome split input.pdf --plan plan.json
+
+Results are printed to stdout as JSON lines, one per split, followed by
+a summary line. With --journal, split records every finished output with
+its size and checksum, and resume finishes an interrupted batch. detect
+(blank pages and separator sheets) and pattern (page text matching a
+pattern) propose splits and can write them as a plan for split. size
+writes consecutive parts that each stay under a maximum file size, and
+every writes fixed-size chunks one at a time with flat memory use.
+folder applies one rule to every PDF in a folder and prints one line per
+file. watch keeps splitting files as they arrive in one or more inbox
+folders. --trace writes a Chrome trace or cProfile file for each batch
+(see split_trace). This module must never import PyQt6 so it starts
+quickly on machines without a display.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.services.fidelity_profiles import DEFAULT_FIDELITY, FIDELITY_PROFILES
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE, SAVE_PROFILES
+from src.services.source_staging import DEFAULT_STAGING, STAGING_MODES
+from src.services.split_trace import SPLIT_PHASES, TRACE_MODES, configure_tracing
+
+
+EXIT_OK = 0
+EXIT_SPLIT_FAILED = 1
+EXIT_USAGE = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one sub-command per operation."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Simple PDF Splitter - headless batch splitting"
+    )
+    parser.add_argument("--trace", default="", choices=[mode for mode in TRACE_MODES
+                                                        if mode != 'off'],
+                        help="write a Chrome trace (chrome) or profile (cprofile) of "
+                             "each batch")
+    parser.add_argument("--trace-dir", default="",
+                        help="folder for trace files (default: sps-traces in the temp folder)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    split = commands.add_parser("split", help="split one PDF according to a plan file")
+    split.add_argument("input", help="source PDF file")
+    split.add_argument("--plan", required=True, help="split plan (.json or .csv)")
+    split.add_argument("--output-folder", default="",
+                       help="folder for output files (overrides the plan)")
+    split.add_argument("--workers", type=int, default=1,
+                       help="worker processes; 0 = one per CPU (default: 1)")
+    split.add_argument("--save-profile", default=DEFAULT_SAVE_PROFILE,
+                       choices=list(SAVE_PROFILES),
+                       help=f"output save profile (default: {DEFAULT_SAVE_PROFILE})")
+    split.add_argument("--fidelity", default=DEFAULT_FIDELITY,
+                       choices=list(FIDELITY_PROFILES),
+                       help="what to copy besides page content (default: "
+                            f"{DEFAULT_FIDELITY})")
+    split.add_argument("--staging", default=DEFAULT_STAGING, choices=list(STAGING_MODES),
+                       help="read the source into memory or a local copy first; "
+                            f"auto does so for network shares (default: {DEFAULT_STAGING})")
+    split.add_argument("--journal", default="",
+                       help="record each finished output in this file so an interrupted "
+                            "batch can be finished with resume")
+    split.set_defaults(handler=run_split)
+
+    resume = commands.add_parser("resume",
+                                 help="finish an interrupted split --journal batch")
+    resume.add_argument("journal", help="journal file written by split --journal")
+    resume.add_argument("--workers", type=int, default=1,
+                        help="worker processes; 0 = one per CPU (default: 1)")
+    resume.set_defaults(handler=run_resume)
+
+    detect = commands.add_parser("detect",
+                                 help="propose splits at blank pages and separator sheets")
+    detect.add_argument("input", help="source PDF file, e.g. a scanned batch")
+    detect.add_argument("--keep-separators", action="store_true",
+                        help="keep separator pages at the start of the following document")
+    detect.add_argument("--workers", type=int, default=0,
+                        help="worker processes; 0 = one per CPU (default: 0)")
+    detect.add_argument("--plan-out", default="",
+                        help="also write the proposed splits as a JSON plan for split")
+    detect.set_defaults(handler=run_detect)
+
+    pattern = commands.add_parser("pattern",
+                                  help="propose splits at pages whose text matches a pattern")
+    pattern.add_argument("input", help="source PDF file")
+    pattern.add_argument("pattern", help="regular expression, e.g. 'EXHIBIT [A-Z]+'")
+    pattern.add_argument("--fts", action="store_true",
+                         help="treat the pattern as an SQLite FTS5 query instead")
+    pattern.add_argument("--whole-page", action="store_true",
+                         help="search all page text, not only the header")
+    pattern.add_argument("--ignore-case", action="store_true", help="case-insensitive regex")
+    pattern.add_argument("--keep-repeats", action="store_true",
+                         help="start a document at every match, even a repeat of the last one")
+    pattern.add_argument("--workers", type=int, default=0,
+                         help="text extraction processes; 0 = one per CPU (default: 0)")
+    pattern.add_argument("--plan-out", default="",
+                         help="also write the proposed splits as a JSON plan for split")
+    pattern.add_argument("--index-db", default="",
+                         help="keep the page text index in this SQLite file, so later runs "
+                              "on the same PDF skip text extraction (default: "
+                              "$SPS_TEXT_INDEX_DB, else memory only)")
+    pattern.set_defaults(handler=run_pattern)
+
+    size = commands.add_parser("size",
+                               help="split one PDF into parts under a maximum file size")
+    size.add_argument("input", help="source PDF file")
+    size.add_argument("--max-mb", type=float, required=True,
+                      help="maximum size of each output file in megabytes")
+    size.add_argument("--document-code", default="",
+                      help="parts are named <code>_Part01, <code>_Part02, ...")
+    size.add_argument("--output-name", default="", help="leading part of the output filenames (default: the input's name)")
+    size.add_argument("--output-folder", default="",
+                      help="folder for output files (default: Downloads)")
+    size.add_argument("--save-profile", default=DEFAULT_SAVE_PROFILE,
+                      choices=list(SAVE_PROFILES),
+                      help=f"output save profile (default: {DEFAULT_SAVE_PROFILE})")
+    size.add_argument("--fidelity", default=DEFAULT_FIDELITY,
+                      choices=list(FIDELITY_PROFILES),
+                      help=f"what to copy besides page content (default: {DEFAULT_FIDELITY})")
+    size.add_argument("--staging", default=DEFAULT_STAGING, choices=list(STAGING_MODES),
+                      help=f"source staging for network shares (default: {DEFAULT_STAGING})")
+    size.set_defaults(handler=run_size)
+
+    every = commands.add_parser("every",
+                                help="split one PDF into chunks of N pages, one at a time")
+    every.add_argument("input", help="source PDF file")
+    every.add_argument("--pages", type=int, required=True, help="pages per output file")
+    every.add_argument("--document-code", default="",
+                       help="parts are named <code>_Part01, <code>_Part02, ...")
+    every.add_argument("--output-name", default="",
+                       help="leading part of the output filenames (default: the input's name)")
+    every.add_argument("--output-folder", default="",
+                       help="folder for output files (default: Downloads)")
+    every.add_argument("--save-profile", default=DEFAULT_SAVE_PROFILE,
+                       choices=list(SAVE_PROFILES),
+                       help=f"output save profile (default: {DEFAULT_SAVE_PROFILE})")
+    every.add_argument("--fidelity", default=DEFAULT_FIDELITY,
+                       choices=list(FIDELITY_PROFILES),
+                       help=f"what to copy besides page content (default: {DEFAULT_FIDELITY})")
+    every.add_argument("--staging", default=DEFAULT_STAGING, choices=list(STAGING_MODES),
+                       help=f"source staging for network shares (default: {DEFAULT_STAGING})")
+    every.set_defaults(handler=run_every)
+
+    folder = commands.add_parser("folder", help="split every PDF in a folder with one rule")
+    folder.add_argument("folder", help="folder of source PDF files")
+    folder.add_argument("--rule", default="cover", choices=["cover", "every"],
+                        help="cover: first pages as a cover, the rest as the body; "
+                             "every: chunks of --pages pages (default: cover)")
+    folder.add_argument("--pages", type=int, default=1,
+                        help="cover pages, or pages per chunk for every (default: 1)")
+    folder.add_argument("--document-code", default="",
+                        help="code before the part number for every (<code>_Part01)")
+    folder.add_argument("--output-folder", default="",
+                        help="folder for all output files (default: Downloads)")
+    folder.add_argument("--recursive", action="store_true", help="also scan subfolders")
+    folder.add_argument("--workers", type=int, default=0,
+                        help="worker processes; 0 = one per CPU (default: 0)")
+    folder.add_argument("--max-pending", type=int, default=0,
+                        help="files queued for the workers at once (default: two per worker)")
+    folder.add_argument("--save-profile", default=DEFAULT_SAVE_PROFILE,
+                        choices=list(SAVE_PROFILES),
+                        help=f"output save profile (default: {DEFAULT_SAVE_PROFILE})")
+    folder.add_argument("--fidelity", default=DEFAULT_FIDELITY,
+                        choices=list(FIDELITY_PROFILES),
+                        help=f"what to copy besides page content (default: {DEFAULT_FIDELITY})")
+    folder.add_argument("--staging", default=DEFAULT_STAGING, choices=list(STAGING_MODES),
+                        help=f"source staging for network shares (default: {DEFAULT_STAGING})")
+    folder.add_argument("--report", default="",
+                        help="also write the consolidated report as JSON")
+    folder.set_defaults(handler=run_folder)
+
+    watch = commands.add_parser("watch", help="split PDFs as they arrive in inbox folders")
+    watch.add_argument("folders", nargs='+',
+                       help="inbox folders; a split_rule.json in a folder overrides the options")
+    watch.add_argument("--output-folder", required=True, help="folder for all output files")
+    watch.add_argument("--rule", default="cover", choices=["cover", "every"],
+                       help="cover: first pages as a cover, the rest as the body; "
+                            "every: chunks of --pages pages (default: cover)")
+    watch.add_argument("--pages", type=int, default=1,
+                       help="cover pages, or pages per chunk for every (default: 1)")
+    watch.add_argument("--document-code", default="",
+                       help="code before the part number for every (<code>_Part01)")
+    watch.add_argument("--workers", type=int, default=0,
+                       help="worker processes; 0 = one per CPU (default: 0)")
+    watch.add_argument("--max-pending", type=int, default=0,
+                       help="files in the workers at once (default: two per worker)")
+    watch.add_argument("--max-queued", type=int, default=200,
+                       help="files tracked at once; later arrivals wait on disk (default: 200)")
+    watch.add_argument("--settle-seconds", type=float, default=2.0,
+                       help="how long a file must stay unchanged before it is split (default: 2)")
+    watch.add_argument("--watch-mode", default="auto", choices=["auto", "inotify", "poll"],
+                       help="auto: inotify for local folders, polling for network shares")
+    watch.add_argument("--save-profile", default=DEFAULT_SAVE_PROFILE,
+                       choices=list(SAVE_PROFILES),
+                       help=f"output save profile (default: {DEFAULT_SAVE_PROFILE})")
+    watch.add_argument("--fidelity", default=DEFAULT_FIDELITY,
+                       choices=list(FIDELITY_PROFILES),
+                       help=f"what to copy besides page content (default: {DEFAULT_FIDELITY})")
+    watch.add_argument("--staging", default=DEFAULT_STAGING, choices=list(STAGING_MODES),
+                       help=f"source staging for network shares (default: {DEFAULT_STAGING})")
+    watch.add_argument("--once", action="store_true",
+                       help="exit once the inboxes are empty instead of watching")
+    watch.set_defaults(handler=run_watch)
+    return parser
+
+
+def run_split(args: argparse.Namespace) -> int:
+    """Run the split sub-command and print JSONL results."""
+    from src.services.pdf_service import PDFService
+    from src.services.split_plan import SplitPlanError, load_split_plan
+
+    try:
+        requests = load_split_plan(args.plan)
+    except SplitPlanError as e:
+        emit({'event': 'error', 'error': str(e)})
+        return EXIT_USAGE
+    if args.output_folder:
+        for request in requests:
+            request['output_folder'] = args.output_folder
+
+    if args.journal:
+        from src.services.job_journal import JournalError, start_job
+        try:
+            results = start_job(args.input, requests, args.journal, workers=args.workers,
+                                save_profile=args.save_profile, fidelity=args.fidelity,
+                                staging=args.staging)
+        except (JournalError, OSError) as e:
+            emit({'event': 'error', 'error': str(e)})
+            return EXIT_USAGE
+        return report(results)
+
+    results = PDFService.batch_split_pdf(args.input, requests, workers=args.workers,
+                                         save_profile=args.save_profile,
+                                         fidelity=args.fidelity,
+                                         staging=args.staging)
+    return report(results)
+
+
+def run_resume(args: argparse.Namespace) -> int:
+    """Run the resume sub-command: skip verified outputs, redo the rest."""
+    from src.services.job_journal import JournalError, resume_job
+
+    try:
+        results = resume_job(args.journal, workers=args.workers)
+    except (JournalError, OSError) as e:
+        emit({'event': 'error', 'error': str(e)})
+        return EXIT_USAGE
+    return report(results)
+
+
+def run_detect(args: argparse.Namespace) -> int:
+    """Run the detect sub-command and print the proposed splits as JSONL."""
+    import time
+    from src.services.blank_page_detector import classify_pages, propose_splits
+
+    started = time.perf_counter()
+    try:
+        verdicts = classify_pages(args.input, workers=args.workers)
+    except Exception as e:
+        emit({'event': 'error', 'error': f"Error reading PDF: {e}"})
+        return EXIT_SPLIT_FAILED
+    splits = propose_splits(verdicts, drop_separators=not args.keep_separators)
+    return report_proposals(splits, args.plan_out, pages=len(verdicts),
+                            blank_pages=[verdict.page for verdict in verdicts if verdict.blank],
+                            seconds=round(time.perf_counter() - started, 3))
+
+
+def run_pattern(args: argparse.Namespace) -> int:
+    """Run the pattern sub-command and print the proposed splits as JSONL."""
+    import sqlite3
+    import time
+    from src.services.metadata_cache import get_metadata_cache
+    from src.services.page_text_index import configure_page_text_index, get_page_text_index
+    from src.services.pattern_splitter import find_pattern_splits
+
+    started = time.perf_counter()
+    try:
+        if args.index_db:
+            configure_page_text_index(args.index_db)
+        metadata = get_metadata_cache().get(args.input)
+        reused = get_page_text_index().is_indexed(metadata.fingerprint)
+        splits = find_pattern_splits(
+            args.input, args.pattern, mode='fts' if args.fts else 'regex',
+            scope='page' if args.whole_page else 'header', ignore_case=args.ignore_case,
+            merge_repeats=not args.keep_repeats, workers=args.workers
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        emit({'event': 'error', 'error': str(e)})
+        return EXIT_SPLIT_FAILED
+    return report_proposals(splits, args.plan_out, pages=metadata.page_count,
+                            index_reused=reused,
+                            seconds=round(time.perf_counter() - started, 3))
+
+
+def run_size(args: argparse.Namespace) -> int:
+    """Run the size sub-command and print JSONL results."""
+    from src.services.pdf_service import PDFService
+    from pathlib import Path
+    from src.services.size_splitter import MEGABYTE
+
+    if args.max_mb <= 0:
+        emit({'event': 'error', 'error': "--max-mb must be positive"})
+        return EXIT_USAGE
+    results = PDFService.split_by_size(
+        args.input, int(args.max_mb * MEGABYTE),
+        args.output_name or Path(args.input.strip('"')).stem, args.document_code,
+        output_folder=args.output_folder, save_profile=args.save_profile,
+        fidelity=args.fidelity, staging=args.staging
+    )
+    return report(results)
+
+
+def run_every(args: argparse.Namespace) -> int:
+    """Run the every sub-command, printing each result as its chunk is written."""
+    from pathlib import Path
+    from src.services.pdf_service import PDFService
+
+    if args.pages < 1:
+        emit({'event': 'error', 'error': "--pages must be at least 1"})
+        return EXIT_USAGE
+    results = PDFService.split_every_n_pages(
+        args.input, args.pages,
+        args.output_name or Path(args.input.strip('"')).stem, args.document_code,
+        output_folder=args.output_folder, save_profile=args.save_profile,
+        fidelity=args.fidelity, staging=args.staging
+    )
+    return report(results)
+
+
+def run_folder(args: argparse.Namespace) -> int:
+    """Run the folder sub-command: one JSON line per file, then a summary."""
+    from src.services.folder_batch import SplitRule, run_folder_batch, write_report
+
+    try:
+        rule = SplitRule(args.rule, args.pages, document_code=args.document_code)
+        batch = run_folder_batch(
+            args.folder, rule, args.output_folder, workers=args.workers,
+            max_pending=args.max_pending, recursive=args.recursive,
+            save_profile=args.save_profile, fidelity=args.fidelity, staging=args.staging,
+            on_file=lambda entry: emit({'event': 'file', **entry})
+        )
+    except (OSError, ValueError) as e:
+        emit({'event': 'error', 'error': str(e)})
+        return EXIT_USAGE
+    emit({'event': 'summary', **batch['summary']})
+    if args.report:
+        try:
+            write_report(batch, args.report)
+        except OSError as e:
+            emit({'event': 'error', 'error': f"Cannot write report: {e}"})
+            return EXIT_USAGE
+    summary = batch['summary']
+    return EXIT_SPLIT_FAILED if summary['failed'] or summary['invalid'] else EXIT_OK
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    """Run the watch sub-command until interrupted: one JSON line per event."""
+    import signal
+    from src.services.folder_batch import SplitRule
+    from src.services.hot_folder import FolderConfig, HotFolderService
+
+    try:
+        defaults = FolderConfig(SplitRule(args.rule, args.pages, document_code=args.document_code),
+                                args.output_folder, args.save_profile, args.fidelity,
+                                args.staging)
+        service = HotFolderService(
+            args.folders, defaults, workers=args.workers, max_pending=args.max_pending,
+            max_queued=args.max_queued, settle_seconds=args.settle_seconds,
+            watch_mode=args.watch_mode, on_event=emit
+        )
+    except (OSError, ValueError) as e:
+        emit({'event': 'error', 'error': str(e)})
+        return EXIT_USAGE
+    # Ctrl+C and SIGTERM stop watching but let the workers finish their files
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda signum, frame: service.stop())
+    try:
+        counts = service.run(until_idle=args.once)
+    except OSError as e:
+        emit({'event': 'error', 'error': str(e)})
+        return EXIT_USAGE
+    emit({'event': 'summary', **counts})
+    return EXIT_SPLIT_FAILED if counts['failed'] or counts['invalid'] else EXIT_OK
+
+
+def report_proposals(splits: List[Any], plan_out: str, **summary: Any) -> int:
+    """Print proposed splits and a summary, optionally saving them as a plan."""
+    rows = [{'start_page': split.start_page, 'end_page': split.end_page,
+             'document_code': split.document_code} for split in splits]
+    for row in rows:
+        emit({'event': 'split', **row})
+    emit({'event': 'summary', 'splits': len(rows), **summary})
+
+    if plan_out:
+        try:
+            with open(plan_out, 'w', encoding='utf-8') as handle:
+                json.dump({'splits': rows}, handle, indent=2)
+        except OSError as e:
+            emit({'event': 'error', 'error': f"Cannot write split plan: {e}"})
+            return EXIT_USAGE
+    return EXIT_OK
+
+
+def report(results: Iterable[Dict[str, Any]]) -> int:
+    """Print each result as it arrives, then a summary; return the exit code."""
+    collected = []
+    for result in results:
+        emit({'event': 'result', **result})
+        collected.append(result)
+    results = collected
+    failed = sum(1 for result in results if not result.get('success'))
+    emit({'event': 'summary', 'total': len(results),
+          'succeeded': len(results) - failed, 'failed': failed,
+          **total_timings(results)})
+    return EXIT_SPLIT_FAILED if failed else EXIT_OK
+
+
+def total_timings(results: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Sum the staging, open, split and phase seconds reported by the results."""
+    totals = {'staging_seconds': 0.0, 'open_seconds': 0.0, 'split_seconds': 0.0,
+              **{f"{phase}_seconds": 0.0 for phase in SPLIT_PHASES}}
+    for result in results:
+        for key, seconds in result.get('timings', {}).items():
+            if key in totals:
+                totals[key] += seconds
+    return {key: round(seconds, 6) for key, seconds in totals.items()}
+
+
+def emit(record: Dict[str, Any]) -> None:
+    """Write one JSON line to stdout."""
+    sys.stdout.write(json.dumps(record, default=str) + "\n")
+    sys.stdout.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point. Returns the process exit code."""
+    args = build_parser().parse_args(argv)
+    if args.trace:
+        configure_tracing(args.trace, args.trace_dir,
+                          on_written=lambda path: emit({'event': 'trace', 'path': path}))
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -75,9 +75,15 @@ class DocumentationDialog(QDialog):
         <p>For each document you want to create:</p>
         <ul>
             <li><b>Start/End Page:</b> Select the page range</li>
+            <li><b>Pages (optional):</b> A page selection such as <code>1-50,75,odd,last-10</code> that replaces Start/End Page</li>
+            <li><b>Thumbnails:</b> Each row previews its first and last page; tick <i>Show page filmstrip</i> to see every page</li>
             <li><b>Doc Code:</b> Enter a document code (e.g., "Ex. A", "Deposition")</li>
             <li><b>Optional Name:</b> Add additional description if needed</li>
             <li>Click "+ Add Split" to add more documents</li>
+            <li>Or choose a bookmark level and click "Split by Bookmarks" for one document per bookmark</li>
+            <li>For scanned batches, "Detect Separators" creates one document per run of pages between blank pages or slip sheets</li>
+            <li>"Split by Pattern" starts a document at every page whose header matches a text pattern such as <code>EXHIBIT [A-Z]+</code></li>
+            <li>"Split by Size" creates consecutive documents whose estimated size stays under "Max MB per file"; "Split Every N Pages" creates documents of a fixed length</li>
         </ul>
         
         <h3>Step 4: Process</h3>
@@ -0,0 +1,109 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QProgressBar, QPushButton
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+import time
+
+
+class ThroughputMeter:
+    """Measures pages per second and estimates the time remaining."""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+
+    def pages_per_second(self, pages_done):
+        elapsed = time.monotonic() - self.started_at
+        if elapsed <= 0 or pages_done <= 0:
+            return 0.0
+        return pages_done / elapsed
+
+    def seconds_remaining(self, pages_done, pages_total):
+        rate = self.pages_per_second(pages_done)
+        if rate <= 0:
+            return None
+        return max(0.0, (pages_total - pages_done) / rate)
+
+
+def format_duration(seconds):
+    """Format seconds as m:ss (or h:mm:ss for long runs)."""
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+class ProgressDialog(QDialog):
+    """Shows split progress, throughput and ETA with a Cancel button."""
+
+    cancel_requested = pyqtSignal()
+
+    def __init__(self, parent, split_count):
+        super().__init__(parent)
+        self.split_count = split_count
+        self.meter = ThroughputMeter()
+        self._init_ui()
+
+    def _init_ui(self):
+        self.setWindowTitle("Splitting PDF...")
+        self.setMinimumWidth(450)
+        self.setModal(True)
+        # Closing via the title bar would leave the worker running
+        self.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, False)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        self.split_label = QLabel(f"Preparing {self.split_count} splits...")
+        self.split_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        layout.addWidget(self.split_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # Busy until the page total is known
+        layout.addWidget(self.progress_bar)
+
+        self.rate_label = QLabel("Measuring speed...")
+        self.rate_label.setStyleSheet("color: #555;")
+        layout.addWidget(self.rate_label)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("removeButton")
+        self.cancel_btn.clicked.connect(self._on_cancel)
+        button_layout.addWidget(self.cancel_btn)
+        layout.addLayout(button_layout)
+
+    def set_split(self, index, count):
+        self.split_label.setText(f"Creating split {index + 1} of {count}")
+
+    def set_pages(self, pages_done, pages_total):
+        if pages_total <= 0:
+            return
+        self.progress_bar.setRange(0, pages_total)
+        self.progress_bar.setValue(pages_done)
+        rate = self.meter.pages_per_second(pages_done)
+        remaining = self.meter.seconds_remaining(pages_done, pages_total)
+        if remaining is None:
+            return
+        self.rate_label.setText(
+            f"{pages_done} of {pages_total} pages · {rate:.0f} pages/s · "
+            f"about {format_duration(remaining)} remaining"
+        )
+
+    def _on_cancel(self):
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setText("Cancelling...")
+        self.split_label.setText("Cancelling and removing partial output...")
+        self.cancel_requested.emit()
+
+    def keyPressEvent(self, event):
+        # Escape cancels the batch instead of just hiding the dialog
+        if event.key() == Qt.Key.Key_Escape:
+            if self.cancel_btn.isEnabled():
+                self._on_cancel()
+            return
+        super().keyPressEvent(event)
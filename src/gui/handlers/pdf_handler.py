@@ -1,7 +1,10 @@
 """PDF file handling logic separated from main window."""
 
-import fitz
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import fitz
+    from src.services.metadata_cache import PDFMetadata
 
 
 class PDFHandler:
@@ -10,50 +13,78 @@ class PDFHandler:
     def __init__(self):
         """Initialize PDF handler with empty state."""
         self.pdf_path: Optional[str] = None
-        self.pdf_doc: Optional[fitz.Document] = None
+        self.metadata: Optional['PDFMetadata'] = None
         self.total_pages: int = 0
+        self._pdf_doc: Optional['fitz.Document'] = None
+    
+    @property
+    def pdf_doc(self) -> Optional['fitz.Document']:
+        """Open document, opened on first access rather than at load time."""
+        if self._pdf_doc is None and self.pdf_path:
+            import fitz
+            self._pdf_doc = fitz.open(self.pdf_path)
+        return self._pdf_doc
     
     def load_pdf(self, file_path: str) -> Tuple[bool, str]:
         """Load a PDF file and extract metadata.
         
+        Page count and the rest of the metadata come from the metadata
+        cache, so reloading an unchanged file does not parse it again.
+        
         Args:
             file_path: Path to the PDF file
             
         Returns:
             Tuple of (success, message)
         """
+        # The cache (and PyMuPDF) are imported on first use to keep them out of cold start
+        from src.services.metadata_cache import get_metadata_cache
+        
         try:
             # Close existing document if any
-            if self.pdf_doc:
-                self.pdf_doc.close()
+            self._close_document()
             
-            # Load new document
-            self.pdf_doc = fitz.open(file_path)
+            self.metadata = get_metadata_cache().get(file_path)
             self.pdf_path = file_path
-            self.total_pages = len(self.pdf_doc)
+            self.total_pages = self.metadata.page_count
             
             return True, f"Loaded: {file_path.split('/')[-1]} ({self.total_pages} pages)"
             
         except Exception as e:
-            self.pdf_path = None
-            self.pdf_doc = None
-            self.total_pages = 0
+            self.clear()
             return False, f"Error loading PDF: {str(e)}"
     
+    def get_outline(self) -> list:
+        """Get the outline as [level, title, page] entries.
+        
+        The metadata cache read it when the file was loaded; the document
+        is only asked again if that metadata is missing.
+        """
+        if self.metadata is not None:
+            return self.metadata.outline
+        if self.pdf_doc is not None and not self.pdf_doc.needs_pass:
+            return self.pdf_doc.get_toc(simple=True)
+        return []
+    
     def clear(self):
         """Clear the current PDF state."""
-        if self.pdf_doc:
-            self.pdf_doc.close()
+        self._close_document()
         self.pdf_path = None
-        self.pdf_doc = None
+        self.metadata = None
         self.total_pages = 0
     
     def is_loaded(self) -> bool:
         """Check if a PDF is currently loaded."""
-        return self.pdf_doc is not None
+        return self.pdf_path is not None
     
     def get_filename(self) -> str:
         """Get the filename of the loaded PDF."""
         if self.pdf_path:
             return self.pdf_path.split('/')[-1]
-        return ""
\ No newline at end of file
+        return ""
+    
+    def _close_document(self):
+        """Close the lazily opened document, if any."""
+        if self._pdf_doc is not None:
+            self._pdf_doc.close()
+            self._pdf_doc = None
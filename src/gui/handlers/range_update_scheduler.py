@@ -0,0 +1,57 @@
+"""Coalesces split-row edits into one range-gap refresh."""
+
+from typing import Callable, Set
+
+from PyQt6.QtCore import QObject, QTimer
+
+
+class RangeUpdateScheduler(QObject):
+    """Batches row changes and refreshes range gaps once per window.
+
+    Every spin-box step or keystroke marks its row dirty. The first change
+    starts a short single-shot timer; later changes inside that window
+    only join the dirty set. When the timer fires, the cached page runs of
+    the dirty rows are dropped and on_flush runs once, so holding a spin
+    arrow refreshes a few times per second instead of on every step.
+    """
+
+    DEFAULT_DELAY_MS = 80
+
+    def __init__(self, split_manager, on_flush: Callable[[], None],
+                 delay_ms: int = DEFAULT_DELAY_MS, parent=None):
+        """Initialize the scheduler.
+
+        Args:
+            split_manager: SplitManager whose row run cache is refreshed
+            on_flush: Called once per batch after the dirty rows are refreshed
+            delay_ms: Coalescing window in milliseconds
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self.split_manager = split_manager
+        self.on_flush = on_flush
+        self._dirty_rows: Set = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def mark_changed(self, row) -> None:
+        """Record that a row's values changed and schedule a refresh."""
+        self._dirty_rows.add(row)
+        # Don't restart a running timer: a held spin arrow must still refresh
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Refresh dirty rows and run the update callback now."""
+        self._timer.stop()
+        if self._dirty_rows:
+            self.split_manager.invalidate_rows(self._dirty_rows)
+            self._dirty_rows.clear()
+        self.on_flush()
+
+    def cancel(self) -> None:
+        """Drop pending changes without refreshing (e.g. when rows are cleared)."""
+        self._timer.stop()
+        self._dirty_rows.clear()
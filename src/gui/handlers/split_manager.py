@@ -1,20 +1,68 @@
 """Split row management logic separated from main window."""
 
-from typing import List, Set, Tuple, Optional
-from PyQt6.QtWidgets import QVBoxLayout
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Optional
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
+from src.models.page_coverage import PageCoverage
+from src.models.page_selection import PageRun
+
+
+# Above this many rows a bulk add asks first, and its rows get no thumbnails
+LARGE_SPLIT_COUNT = 1000
+# Rows a bulk add builds at a time; the rest are built as they scroll into view
+ROW_BATCH_SIZE = 100
+
+
+class _PendingRowsLabel(QLabel):
+    """Stands in for bulk-added rows not built yet; asks for them once painted.
+
+    Widgets scrolled out of the split list are not painted, so rows are
+    only built as the user scrolls down to them.
+    """
+
+    def __init__(self, build_more: Callable[[], None]):
+        super().__init__()
+        self._build_more = build_more
+        self._queued = False
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._queued:
+            # Change the layout after this paint, not during it
+            self._queued = True
+            QTimer.singleShot(0, self._on_timeout)
+
+    def _on_timeout(self):
+        self._queued = False
+        self._build_more()
 
 
 class SplitManager:
     """Manages split row operations and calculations."""
     
-    def __init__(self, splits_layout: QVBoxLayout):
+    def __init__(self, splits_layout: QVBoxLayout, thumbnails=None):
         """Initialize split manager with the layout container.
         
         Args:
             splits_layout: The QVBoxLayout where split rows are added
+            thumbnails: Optional ThumbnailLoader for row page previews
         """
         self.splits_layout = splits_layout
+        self.thumbnails = thumbnails
         self.split_rows: List = []
+        # Page runs per row, recomputed only for rows that changed
+        self._row_runs: Dict[object, List[PageRun]] = {}
+        # Widgets holding rows added by add_split_rows
+        self._batches: List[QWidget] = []
+        # Bulk-added (start, end, code) ranges whose rows are not built yet.
+        # They come before split_rows[_pending_at:] in row order.
+        self._pending: List[Tuple[int, int, str]] = []
+        self._pending_at = 0
+        self._pending_label: Optional[_PendingRowsLabel] = None
+        self._pending_thumbnails = None
+        self._total_pages = 0
+        self._on_rows_built: Optional[Callable[[List], None]] = None
     
     def add_split_row(self, total_pages: int) -> Optional[object]:
         """Add a new split row with smart page range calculation.
@@ -27,14 +75,13 @@ class SplitManager:
         """
         from src.gui.widgets.split_row_styled import SplitRowStyled
         
-        row_number = len(self.split_rows) + 1
+        row_number = self.count() + 1
         start = 1
         end = total_pages
         
         # Calculate smart ranges based on last row
-        if self.split_rows:
-            last_row = self.split_rows[-1]
-            last_end = last_row.end_spin.value()
+        last_end = self._last_end()
+        if last_end is not None:
             if last_end < total_pages:
                 start = last_end + 1
                 end = total_pages
@@ -42,12 +89,91 @@ class SplitManager:
                 start = total_pages
                 end = total_pages
         
-        row = SplitRowStyled(row_number, start, end, total_pages)
+        row = SplitRowStyled(row_number, start, end, total_pages, self.thumbnails)
         self.splits_layout.addWidget(row)
         self.split_rows.append(row)
         
         return row
     
+    def _last_end(self) -> Optional[int]:
+        """End page of the last row, built or not, or None without rows."""
+        if len(self.split_rows) > self._pending_at or not self._pending:
+            return self.split_rows[-1].end_spin.value() if self.split_rows else None
+        return self._pending[-1][1]
+    
+    def add_split_rows(self, ranges: List[Tuple[int, int, str]], total_pages: int,
+                       on_rows_built: Callable[[List], None]) -> None:
+        """Add many split rows at once (e.g. from bookmarks).
+        
+        Only the first ROW_BATCH_SIZE rows are built now. The rest wait
+        behind a placeholder at the end of the list and are built a batch
+        at a time as it scrolls into view, so thousands of bookmarks cost
+        no more to add or clear than the rows the user actually looks at.
+        Their ranges and codes still count in get_split_data(), coverage
+        and count(). Rows of an add above LARGE_SPLIT_COUNT get no
+        thumbnails.
+        
+        Args:
+            ranges: (start_page, end_page, document_code) per row
+            total_pages: Total pages in the PDF
+            on_rows_built: Called with each batch of row widgets once built
+        """
+        # Keep a single not-yet-built block: build what an earlier add left
+        while self._pending:
+            self.build_pending_rows()
+        self._pending = list(ranges)
+        self._pending_at = len(self.split_rows)
+        self._pending_thumbnails = self.thumbnails if len(ranges) <= LARGE_SPLIT_COUNT else None
+        self._total_pages = total_pages
+        self._on_rows_built = on_rows_built
+        self._pending_label = _PendingRowsLabel(self.build_pending_rows)
+        self.splits_layout.addWidget(self._pending_label)
+        self.build_pending_rows()
+    
+    def build_pending_rows(self) -> None:
+        """Build the next ROW_BATCH_SIZE rows left by add_split_rows.
+        
+        The rows are built inside one hidden widget that joins the layout
+        in one go, so the container lays out and shows once instead of once
+        per row (per-row showing is quadratic in the number of rows).
+        """
+        from src.gui.widgets.split_row_styled import SplitRowStyled
+        
+        if not self._pending:
+            return
+        ranges = self._pending[:ROW_BATCH_SIZE]
+        del self._pending[:ROW_BATCH_SIZE]
+        
+        batch = QWidget()
+        batch_layout = QVBoxLayout(batch)
+        batch_layout.setContentsMargins(0, 0, 0, 0)
+        batch_layout.setSpacing(self.splits_layout.spacing())
+        
+        rows = []
+        first_number = self._pending_at + 1
+        for offset, (start, end, code) in enumerate(ranges):
+            row = SplitRowStyled(first_number + offset, start, end, self._total_pages,
+                                 self._pending_thumbnails, doc_code=code)
+            batch_layout.addWidget(row)
+            rows.append(row)
+        
+        self.splits_layout.insertWidget(self.splits_layout.indexOf(self._pending_label), batch)
+        self._batches.append(batch)
+        self.split_rows[self._pending_at:self._pending_at] = rows
+        self._pending_at += len(rows)
+        on_rows_built = self._on_rows_built
+        self._update_pending_label()
+        on_rows_built(rows)
+    
+    def _update_pending_label(self) -> None:
+        """Show how many rows are still to build, or drop the placeholder."""
+        if self._pending:
+            self._pending_label.setText(f"Loading {len(self._pending)} more splits...")
+        elif self._pending_label is not None:
+            self._pending_label.deleteLater()
+            self._pending_label = None
+            self._on_rows_built = None
+    
     def remove_split(self, row) -> None:
         """Remove a split row and renumber remaining rows.
         
@@ -55,44 +181,84 @@ class SplitManager:
             row: The split row widget to remove
         """
         if row in self.split_rows:
+            if self.split_rows.index(row) < self._pending_at:
+                self._pending_at -= 1
             self.split_rows.remove(row)
+            self._row_runs.pop(row, None)
+            row.release_thumbnails()
+            batch = row.parentWidget()
+            if batch in self._batches and not any(
+                    other.parentWidget() is batch for other in self.split_rows):
+                # Last row of a bulk add; drop its now empty holder too
+                self._batches.remove(batch)
+                batch.deleteLater()
             row.deleteLater()
             self._renumber_rows()
     
     def _renumber_rows(self) -> None:
         """Renumber all rows after removal."""
         for i, row in enumerate(self.split_rows):
-            row.set_row_number(i + 1)
+            # Rows added after a bulk add come after its unbuilt rows
+            row.set_row_number(i + 1 + (len(self._pending) if i >= self._pending_at else 0))
     
-    def calculate_range_gaps(self, total_pages: int) -> Tuple[bool, List[int]]:
-        """Calculate missing page ranges.
+    def calculate_coverage(self, total_pages: int) -> PageCoverage:
+        """Build the interval coverage map of all split rows.
         
         Args:
             total_pages: Total pages in PDF
             
         Returns:
-            Tuple of (has_gaps, list_of_missing_pages)
+            PageCoverage with gaps, overlaps and page ownership
         """
-        if not self.split_rows:
-            return False, []
+        runs = [self._runs_for(row) for row in self.split_rows]
+        runs[self._pending_at:self._pending_at] = [[(start, end)]
+                                                   for start, end, _ in self._pending]
+        return PageCoverage(total_pages, runs)
+    
+    def invalidate_rows(self, rows: Iterable) -> None:
+        """Drop cached page runs for rows whose values changed.
         
-        covered = set()
-        for row in self.split_rows:
-            start = row.start_spin.value()
-            end = row.end_spin.value()
-            for page in range(start, end + 1):
-                covered.add(page)
+        Args:
+            rows: Split row widgets to recompute on the next calculation
+        """
+        for row in rows:
+            self._row_runs.pop(row, None)
+    
+    def _runs_for(self, row) -> List[PageRun]:
+        """Get a row's page runs, computing them only when not cached."""
+        runs = self._row_runs.get(row)
+        if runs is None:
+            runs = self._row_runs[row] = row.get_page_runs()
+        return runs
+    
+    def calculate_range_gaps(self, total_pages: int) -> Tuple[bool, List[PageRun]]:
+        """Calculate missing page ranges.
         
-        all_pages = set(range(1, total_pages + 1))
-        missing = sorted(all_pages - covered)
+        Args:
+            total_pages: Total pages in PDF
+            
+        Returns:
+            Tuple of (has_gaps, list of missing (start, end) runs)
+        """
+        if not self.has_splits():
+            return False, []
         
-        return bool(missing), missing
+        gaps = self.calculate_coverage(total_pages).gaps
+        return bool(gaps), gaps
     
     def clear_all_splits(self) -> None:
         """Remove all split rows."""
         for row in self.split_rows:
+            row.release_thumbnails()
             row.deleteLater()
+        for batch in self._batches:
+            batch.deleteLater()
         self.split_rows.clear()
+        self._row_runs.clear()
+        self._batches.clear()
+        self._pending.clear()
+        self._pending_at = 0
+        self._update_pending_label()
     
     def get_split_data(self) -> List[dict]:
         """Extract data from all split rows.
@@ -106,14 +272,25 @@ class SplitManager:
                 'start_page': row.start_spin.value(),
                 'end_page': row.end_spin.value(),
                 'document_code': row.code_input.text().strip(),
-                'optional_other': row.other_input.text().strip()
+                'optional_other': row.other_input.text().strip(),
+                'pages': row.pages_input.text().strip()
             })
+        splits[self._pending_at:self._pending_at] = [
+            {'start_page': start, 'end_page': end, 'document_code': code.strip(),
+             'optional_other': '', 'pages': ''}
+            for start, end, code in self._pending
+        ]
         return splits
     
     def has_splits(self) -> bool:
         """Check if there are any split rows."""
-        return bool(self.split_rows)
+        return bool(self.split_rows or self._pending)
+    
+    def has_codes(self) -> bool:
+        """Check if any split row, built or not, has a document code."""
+        return (any(row.code_input.text().strip() for row in self.split_rows)
+                or any(code.strip() for _, _, code in self._pending))
     
     def count(self) -> int:
         """Get the number of split rows."""
-        return len(self.split_rows)
\ No newline at end of file
+        return len(self.split_rows) + len(self._pending)
\ No newline at end of file
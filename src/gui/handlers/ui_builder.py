@@ -3,9 +3,9 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QGroupBox, QFrame,
-    QScrollArea, QLineEdit, QSpinBox
+    QScrollArea, QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from pathlib import Path
 
 
@@ -21,20 +21,32 @@ class UIBuilder:
         self.main_window = main_window
     
     def create_header(self, parent_layout):
-        """Create the application header with banner."""
-        from PyQt6.QtSvgWidgets import QSvgWidget
+        """Create the application header with banner.
         
+        The SVG banner is built after the window's first paint; until then a
+        fixed-size slot keeps the layout from jumping.
+        """
         banner_path = Path("src/assets/SPS_Banner.svg")
         
         if banner_path.exists():
-            svg_widget = QSvgWidget(str(banner_path))
-            svg_widget.setFixedSize(1160, 80)
-            parent_layout.addWidget(svg_widget, alignment=Qt.AlignmentFlag.AlignCenter)
+            banner_slot = QWidget()
+            banner_slot.setFixedSize(1160, 80)
+            QVBoxLayout(banner_slot).setContentsMargins(0, 0, 0, 0)
+            parent_layout.addWidget(banner_slot, alignment=Qt.AlignmentFlag.AlignCenter)
+            QTimer.singleShot(0, lambda: self._load_banner(banner_slot, banner_path))
         else:
             title = QLabel("Simple PDF Splitter - A Tool for Lawyers")
             title.setAlignment(Qt.AlignmentFlag.AlignCenter)
             parent_layout.addWidget(title)
     
+    def _load_banner(self, banner_slot, banner_path):
+        """Build the SVG banner into its placeholder slot."""
+        from PyQt6.QtSvgWidgets import QSvgWidget
+        
+        svg_widget = QSvgWidget(str(banner_path))
+        svg_widget.setFixedSize(1160, 80)
+        banner_slot.layout().addWidget(svg_widget)
+    
     def create_left_panel(self, parent_layout):
         """Create the left panel with client information."""
         left_group = QGroupBox("Client Information")
@@ -139,11 +151,22 @@ class UIBuilder:
     def create_split_section(self, parent_layout):
         """Create the split configuration section."""
         from src.gui.handlers.split_manager import SplitManager
+        from src.gui.widgets.page_thumbnail import PageFilmstrip
+        from src.gui.styles import SPLIT_ROW_STYLE
         
         split_group = QGroupBox("Split Instructions with example:")
         split_layout = QVBoxLayout()
         
+        # Optional strip of all pages for finding split boundaries
+        filmstrip_toggle = QCheckBox("Show page filmstrip")
+        self.main_window.filmstrip = PageFilmstrip(self.main_window.thumbnail_loader)
+        self.main_window.filmstrip.setVisible(False)
+        filmstrip_toggle.toggled.connect(self.main_window.filmstrip.setVisible)
+        split_layout.addWidget(filmstrip_toggle)
+        split_layout.addWidget(self.main_window.filmstrip)
+        
         self.main_window.splits_container = QWidget()
+        self.main_window.splits_container.setStyleSheet(SPLIT_ROW_STYLE)
         self.main_window.splits_layout = QVBoxLayout(self.main_window.splits_container)
         self.main_window.splits_layout.setSpacing(5)
         
@@ -174,15 +197,115 @@ class UIBuilder:
         add_btn.clicked.connect(self.main_window._add_split_row)
         split_layout.addWidget(add_btn)
         
+        # Split rows from the PDF outline, one per bookmark down to a level
+        bookmark_layout = QHBoxLayout()
+        bookmark_layout.addWidget(QLabel("Bookmark level:"))
+        self.main_window.bookmark_level_combo = QComboBox()
+        self.main_window.bookmark_level_combo.setMinimumWidth(220)
+        bookmark_layout.addWidget(self.main_window.bookmark_level_combo)
+        self.main_window.bookmark_btn = QPushButton("Split by Bookmarks")
+        self.main_window.bookmark_btn.setToolTip(
+            "Replace the splits with one per bookmark at or above the chosen level;\n"
+            "document codes are taken from the bookmark titles"
+        )
+        self.main_window.bookmark_btn.clicked.connect(self.main_window._split_by_bookmarks)
+        bookmark_layout.addWidget(self.main_window.bookmark_btn)
+        bookmark_layout.addSpacing(20)
+        
+        # Split rows between blank pages / slip sheets of scanned batches
+        self.main_window.separator_btn = QPushButton("Detect Separators")
+        self.main_window.separator_btn.setToolTip(
+            "Replace the splits with one per document, finding documents\n"
+            "between blank pages and separator sheets"
+        )
+        self.main_window.separator_btn.clicked.connect(self.main_window._detect_separators)
+        bookmark_layout.addWidget(self.main_window.separator_btn)
+        self.main_window.drop_separators_check = QCheckBox("Drop separator pages")
+        self.main_window.drop_separators_check.setChecked(True)
+        bookmark_layout.addWidget(self.main_window.drop_separators_check)
+        bookmark_layout.addStretch()
+        split_layout.addLayout(bookmark_layout)
+        
+        # Split rows where the page text matches a pattern
+        pattern_layout = QHBoxLayout()
+        pattern_layout.addWidget(QLabel("Text pattern:"))
+        self.main_window.pattern_input = QLineEdit()
+        self.main_window.pattern_input.setPlaceholderText("e.g. EXHIBIT [A-Z]+")
+        self.main_window.pattern_input.setToolTip(
+            "Regular expression; a new document starts at every page whose header\n"
+            "(top of the page) matches. Repeats of the same match are one document."
+        )
+        self.main_window.pattern_input.setMaximumWidth(300)
+        self.main_window.pattern_input.returnPressed.connect(self.main_window._split_by_pattern)
+        pattern_layout.addWidget(self.main_window.pattern_input)
+        self.main_window.pattern_page_check = QCheckBox("Search whole page")
+        pattern_layout.addWidget(self.main_window.pattern_page_check)
+        self.main_window.pattern_btn = QPushButton("Split by Pattern")
+        self.main_window.pattern_btn.clicked.connect(self.main_window._split_by_pattern)
+        pattern_layout.addWidget(self.main_window.pattern_btn)
+        pattern_layout.addStretch()
+        split_layout.addLayout(pattern_layout)
+        
+        # Consecutive split rows under a file size or of a fixed page count
+        parts_layout = QHBoxLayout()
+        parts_layout.addWidget(QLabel("Max MB per file:"))
+        self.main_window.max_size_spin = QDoubleSpinBox()
+        self.main_window.max_size_spin.setRange(0.1, 10000.0)
+        self.main_window.max_size_spin.setDecimals(1)
+        self.main_window.max_size_spin.setValue(10.0)
+        parts_layout.addWidget(self.main_window.max_size_spin)
+        self.main_window.size_btn = QPushButton("Split by Size")
+        self.main_window.size_btn.setToolTip(
+            "Replace the splits with consecutive parts whose estimated size stays\n"
+            "under the limit; fonts and images shared by pages are counted once per part"
+        )
+        self.main_window.size_btn.clicked.connect(self.main_window._split_by_size)
+        parts_layout.addWidget(self.main_window.size_btn)
+        parts_layout.addSpacing(20)
+        parts_layout.addWidget(QLabel("Pages per file:"))
+        self.main_window.chunk_pages_spin = QSpinBox()
+        self.main_window.chunk_pages_spin.setRange(1, 100000)
+        self.main_window.chunk_pages_spin.setValue(500)
+        parts_layout.addWidget(self.main_window.chunk_pages_spin)
+        self.main_window.chunk_btn = QPushButton("Split Every N Pages")
+        self.main_window.chunk_btn.setToolTip(
+            "Replace the splits with consecutive parts of this many pages"
+        )
+        self.main_window.chunk_btn.clicked.connect(self.main_window._split_every_n_pages)
+        parts_layout.addWidget(self.main_window.chunk_btn)
+        parts_layout.addStretch()
+        split_layout.addLayout(parts_layout)
+        self.main_window.bookmark_level_combo.setEnabled(False)
+        self.main_window.bookmark_btn.setEnabled(False)
+        
         split_group.setLayout(split_layout)
         parent_layout.addWidget(split_group)
         
         # Initialize split manager after UI is created
-        self.main_window.split_manager = SplitManager(self.main_window.splits_layout)
+        self.main_window.split_manager = SplitManager(
+            self.main_window.splits_layout, self.main_window.thumbnail_loader
+        )
     
     def create_action_buttons(self, parent_layout):
         """Create the action buttons at the bottom."""
+        from src.services.save_profiles import DEFAULT_SAVE_PROFILE, SAVE_PROFILE_LABELS
+        
         button_layout = QHBoxLayout()
+        
+        # Save profile for the output files
+        button_layout.addWidget(QLabel("Output Files:"))
+        self.main_window.save_profile_combo = QComboBox()
+        for name, label in SAVE_PROFILE_LABELS.items():
+            self.main_window.save_profile_combo.addItem(label, name)
+        self.main_window.save_profile_combo.setCurrentIndex(
+            self.main_window.save_profile_combo.findData(DEFAULT_SAVE_PROFILE)
+        )
+        self.main_window.save_profile_combo.setToolTip(
+            "Fast: quickest to create\n"
+            "Compact: smaller files (compressed, unused objects removed)\n"
+            "Web: linearized for quick first-page display in web viewers"
+        )
+        button_layout.addWidget(self.main_window.save_profile_combo)
         button_layout.addStretch()
         
         clear_btn = QPushButton("Clear All")
@@ -10,7 +10,20 @@ from src.gui.styles import MAIN_STYLE
 from src.gui.handlers.pdf_handler import PDFHandler
 from src.gui.handlers.split_manager import SplitManager
 from src.gui.handlers.ui_builder import UIBuilder
+from src.gui.handlers.range_update_scheduler import RangeUpdateScheduler
+from src.gui.workers.thumbnail_loader import ThumbnailLoader
+from src.models.page_selection import describe_runs
 import os
+import threading
+
+
+def _preload_heavy_modules():
+    """Import PyMuPDF and the service layer so the first PDF opens quickly."""
+    try:
+        import fitz  # noqa: F401
+        import src.services.pdf_service  # noqa: F401
+    except ImportError:
+        pass
 
 
 class DragDropFrame(QFrame):
@@ -74,12 +87,27 @@ class MainWindowStyled(QMainWindow):
         super().__init__()
         self.pdf_handler = PDFHandler()
         self.split_manager = None  # Will be initialized after UI creation
+        self.thumbnail_loader = ThumbnailLoader(parent=self)
         self.ui_builder = UIBuilder(self)
         
         self._init_ui()
+        self.range_scheduler = RangeUpdateScheduler(
+            self.split_manager, self._update_range_gaps, parent=self
+        )
+        self.filmstrip.page_activated.connect(
+            lambda page: self.status_bar.showMessage(f"Page {page}", 3000)
+        )
         self._setup_menu_bar()
         self._setup_status_bar()
         self.setStyleSheet(MAIN_STYLE)
+        self._preloaded = False
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Load heavy modules off the GUI thread once the window is up
+        if not self._preloaded:
+            self._preloaded = True
+            threading.Thread(target=_preload_heavy_modules, daemon=True).start()
         
     def _init_ui(self):
         self.setWindowTitle("Simple PDF Splitter v1.0")
@@ -159,10 +187,12 @@ class MainWindowStyled(QMainWindow):
             self.status_label.setText(f"✓ Loaded: {filename} ({self.pdf_handler.total_pages} pages)")
             self.status_label.setStyleSheet("QLabel { color: #28a745; font-weight: bold; }")
             # Start with green "no gaps" status
-            self.range_label.setText("Range Gaps: None")
-            self.range_label.setStyleSheet("QLabel { color: #28a745; font-weight: bold; }")
+            self._set_range_label("Range Gaps: None", "QLabel { color: #28a745; font-weight: bold; }")
             
             self._clear_splits()
+            self.thumbnail_loader.set_document(file_path, self.pdf_handler.metadata.fingerprint)
+            self.filmstrip.set_page_count(self.pdf_handler.total_pages)
+            self._update_bookmark_levels()
             self._add_split_row()
             
             self.status_bar.showMessage(f"[0] PDF loaded: {filename}")
@@ -176,13 +206,185 @@ class MainWindowStyled(QMainWindow):
         
         row = self.split_manager.add_split_row(self.pdf_handler.total_pages)
         if row:
-            row.remove_clicked.connect(lambda: self._remove_split(row))
-            row.values_changed.connect(self._update_range_gaps)
-        self._update_range_gaps()
+            self._connect_row(row)
+        self.range_scheduler.flush()
+        
+    def _connect_row(self, row):
+        row.remove_clicked.connect(lambda: self._remove_split(row))
+        row.values_changed.connect(lambda: self.range_scheduler.mark_changed(row))
+        
+    def _connect_rows(self, rows):
+        for row in rows:
+            self._connect_row(row)
+        
+    def _update_bookmark_levels(self):
+        from src.services.outline_splitter import outline_levels
+        
+        combo = self.bookmark_level_combo
+        combo.clear()
+        total = 0
+        for level, count in outline_levels(self.pdf_handler.get_outline()).items():
+            total += count
+            combo.addItem(f"Level {level} ({total} bookmarks)", level)
+        has_outline = combo.count() > 0
+        if not has_outline:
+            combo.addItem("No bookmarks in this PDF")
+        combo.setEnabled(has_outline)
+        self.bookmark_btn.setEnabled(has_outline)
+        
+    def _split_by_bookmarks(self):
+        from src.services.outline_splitter import outline_to_splits
+        
+        if not self.pdf_handler.is_loaded():
+            QMessageBox.warning(self, "Warning", "Please select a PDF first")
+            return
+        
+        total_pages = self.pdf_handler.total_pages
+        splits = outline_to_splits(self.pdf_handler.get_outline(), total_pages,
+                                   self.bookmark_level_combo.currentData())
+        if not splits:
+            QMessageBox.warning(self, "Warning", "No bookmarks point to pages in this PDF")
+            return
+        
+        self._replace_splits(
+            [(split.start_page, split.end_page, split.document_code) for split in splits],
+            "bookmarks", "A shallower bookmark level gives fewer, larger splits."
+        )
+        
+    def _detect_separators(self):
+        from src.services.blank_page_detector import classify_pages
+        
+        self._start_analysis(classify_pages, self._on_separators_detected,
+                             "Separator detection",
+                             "[1] Detecting blank pages and separator sheets...")
+        
+    def _on_separators_detected(self, verdicts):
+        from src.services.blank_page_detector import propose_splits
+        
+        splits = propose_splits(verdicts, self.drop_separators_check.isChecked())
+        blank_count = sum(1 for verdict in verdicts if verdict.blank)
+        if not blank_count or not splits:
+            self.status_bar.showMessage("[0] No documents found between separators", 5000)
+            QMessageBox.information(
+                self, "Detect Separators",
+                "No blank pages or separator sheets were found." if not blank_count
+                else "Every page of this PDF looks blank."
+            )
+            return
+        self._replace_splits(
+            [(split.start_page, split.end_page, split.document_code) for split in splits],
+            f"separators ({blank_count} blank pages)"
+        )
+        
+    def _split_by_pattern(self):
+        from src.services.pattern_splitter import find_pattern_splits
+        
+        pattern = self.pattern_input.text().strip()
+        if self.pdf_handler.is_loaded() and not pattern:
+            QMessageBox.warning(self, "Warning", "Please enter a text pattern, e.g. EXHIBIT [A-Z]+")
+            return
+        scope = 'page' if self.pattern_page_check.isChecked() else 'header'
+        self._start_analysis(find_pattern_splits, self._on_pattern_splits_found,
+                             "Pattern search", "[1] Searching page text...",
+                             pattern=pattern, scope=scope)
+        
+    def _on_pattern_splits_found(self, splits):
+        if not splits:
+            self.status_bar.showMessage("[0] No page matches the pattern", 5000)
+            QMessageBox.information(
+                self, "Split by Pattern",
+                "No page matches the pattern. Scanned pages without a text layer can't be searched."
+            )
+            return
+        self._replace_splits(
+            [(split.start_page, split.end_page, split.document_code) for split in splits],
+            "pattern matches"
+        )
+        
+    def _split_by_size(self):
+        from src.services.size_splitter import MEGABYTE, plan_size_splits
+        
+        self._start_analysis(plan_size_splits, self._on_size_splits_planned,
+                             "Size planning", "[1] Estimating page sizes...",
+                             max_bytes=int(self.max_size_spin.value() * MEGABYTE),
+                             save_profile=self.save_profile_combo.currentData())
+        
+    def _on_size_splits_planned(self, ranges):
+        self._replace_splits(
+            [(start, end, f"Part{i:02d}") for i, (start, end) in enumerate(ranges, 1)],
+            f"size estimates (max {self.max_size_spin.value():g} MB)",
+            "A larger size limit gives fewer splits."
+        )
+        
+    def _split_every_n_pages(self):
+        from src.models.page_selection import chunk_runs
+        
+        if not self.pdf_handler.is_loaded():
+            QMessageBox.warning(self, "Warning", "Please select a PDF first")
+            return
+        pages_per_chunk = self.chunk_pages_spin.value()
+        runs = chunk_runs(self.pdf_handler.total_pages, pages_per_chunk)
+        self._replace_splits(
+            [(start, end, f"Part{i:02d}") for i, (start, end) in enumerate(runs, 1)],
+            f"every {pages_per_chunk} pages", "More pages per file gives fewer splits."
+        )
+        
+    def _start_analysis(self, func, on_finished, name, message, **kwargs):
+        """Run func(pdf_path, **kwargs) on a worker thread, one analysis at a time."""
+        from src.gui.workers.analysis_worker import AnalysisWorker
+        
+        if not self.pdf_handler.is_loaded():
+            QMessageBox.warning(self, "Warning", "Please select a PDF first")
+            return
+        
+        worker = AnalysisWorker(self.pdf_handler.pdf_path, func, self, **kwargs)
+        
+        def finished(result):
+            # Ignore results for a PDF that was replaced meanwhile
+            if worker.input_path == self.pdf_handler.pdf_path:
+                on_finished(result)
+        
+        def failed(error):
+            QMessageBox.critical(self, "Error", f"{name} failed: {error}")
+            self.status_bar.showMessage(f"[E] {name} failed")
+        
+        worker.analysis_finished.connect(finished)
+        worker.analysis_failed.connect(failed)
+        worker.finished.connect(lambda: self._set_analysis_running(False))
+        self._analysis_worker = worker
+        self._set_analysis_running(True)
+        self.status_bar.showMessage(message)
+        worker.start()
+        
+    def _set_analysis_running(self, running):
+        for button in (self.separator_btn, self.pattern_btn, self.size_btn):
+            button.setEnabled(not running)
+        
+    def _replace_splits(self, ranges, source, large_hint=""):
+        """Replace all split rows with (start, end, code) ranges, asking first if needed."""
+        from src.gui.handlers.split_manager import LARGE_SPLIT_COUNT
+        
+        questions = []
+        if self.split_manager.has_codes():
+            questions.append(f"Replace the current splits with {len(ranges)} splits from {source}?")
+        if len(ranges) > LARGE_SPLIT_COUNT:
+            warning = (f"This creates {len(ranges)} split rows; they are built as you scroll "
+                       "and show no page thumbnails.")
+            questions.append(" ".join(filter(None, [warning, large_hint, "Continue?"])))
+        if questions:
+            answer = QMessageBox.question(self, "Replace Splits", "\n\n".join(questions))
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        
+        self._clear_splits()
+        self.split_manager.add_split_rows(ranges, self.pdf_handler.total_pages,
+                                          self._connect_rows)
+        self.range_scheduler.flush()
+        self.status_bar.showMessage(f"[0] Created {len(ranges)} splits from {source}")
         
     def _remove_split(self, row):
         self.split_manager.remove_split(row)
-        self._update_range_gaps()
+        self.range_scheduler.flush()
             
     def _update_range_gaps(self):
         if not self.pdf_handler.is_loaded():
@@ -192,14 +394,23 @@ class MainWindowStyled(QMainWindow):
         
         if has_gaps:
             # Red text for gaps with warning symbol
-            self.range_label.setText(f"⚠ Range Gaps: {missing}")
-            self.range_label.setStyleSheet("QLabel { color: #dc3545; font-weight: bold; }")
+            self._set_range_label(f"⚠ Range Gaps: {describe_runs(missing, limit=8)}",
+                                  "QLabel { color: #dc3545; font-weight: bold; }")
         else:
             # Green text for no gaps with checkmark
-            self.range_label.setText("✓ Range Gaps: None")
-            self.range_label.setStyleSheet("QLabel { color: #28a745; font-weight: bold; }")
+            self._set_range_label("✓ Range Gaps: None",
+                                  "QLabel { color: #28a745; font-weight: bold; }")
+            
+    def _set_range_label(self, text, style):
+        # Skip no-op updates; a stylesheet reset re-polishes the widget
+        if self.range_label.text() != text:
+            self.range_label.setText(text)
+        if self.range_label.styleSheet() != style:
+            self.range_label.setStyleSheet(style)
             
+
     def _clear_splits(self):
+        self.range_scheduler.cancel()
         self.split_manager.clear_all_splits()
         
     def _clear_all(self):
@@ -211,9 +422,11 @@ class MainWindowStyled(QMainWindow):
         self.file_input.clear()
         self.status_label.setText("No PDF loaded")
         self.status_label.setStyleSheet("")  # Reset to default style
-        self.range_label.setText("Range Gaps: N/A")
-        self.range_label.setStyleSheet("")  # Reset to default style
+        self._set_range_label("Range Gaps: N/A", "")  # Reset to default style
+        self.thumbnail_loader.set_document(None)
+        self.filmstrip.set_page_count(0)
         self.pdf_handler.clear()
+        self._update_bookmark_levels()
         self.status_bar.showMessage("[-1] Ready to split PDFs...")
         
     def _handle_process(self):
@@ -229,63 +442,97 @@ class MainWindowStyled(QMainWindow):
         self._process_pdf()
         
     def _process_pdf(self):
-        from src.services.pdf_service import PDFService
-        from src.gui.dialogs.success_dialog import SuccessDialog
+        from src.gui.workers.split_worker import SplitWorker
+        from src.gui.dialogs.progress_dialog import ProgressDialog
+        
+        jobs = self._build_split_jobs()
+        self._split_worker = SplitWorker(self.pdf_handler.pdf_path, jobs, self)
+        self._progress_dialog = ProgressDialog(self, len(jobs))
+        
+        worker = self._split_worker
+        dialog = self._progress_dialog
+        worker.split_started.connect(dialog.set_split)
+        worker.pages_progress.connect(dialog.set_pages)
+        worker.batch_finished.connect(self._on_split_finished)
+        worker.batch_failed.connect(self._on_split_failed)
+        worker.batch_cancelled.connect(self._on_split_cancelled)
+        worker.finished.connect(dialog.accept)
+        dialog.cancel_requested.connect(worker.cancel)
+        
+        worker.start()
+        dialog.open()
+        
+    def _build_split_jobs(self):
         from pathlib import Path
         import uuid
         from datetime import datetime
         
-        try:
-            service = PDFService()
-            results = []
-            output_folder = str(Path.home() / "Downloads")
-            
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_folder = str(Path.home() / "Downloads")
+        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        client_name = self.client_input.text().strip()
+        case_number = self.case_input.text().strip()
+        save_profile = self.save_profile_combo.currentData()
+        
+        jobs = []
+        for i, split_data in enumerate(self.split_manager.get_split_data()):
+            unique_id = str(uuid.uuid4())[:8]
+            name = client_name
+            doc_code = split_data['document_code']
+            other = split_data['optional_other']
             
-            splits = self.split_manager.get_split_data()
-            for i, split_data in enumerate(splits):
-                unique_id = str(uuid.uuid4())[:8]
-                
-                client_name = self.client_input.text().strip()
-                case_number = self.case_input.text().strip()
-                doc_code = split_data['document_code']
-                other = split_data['optional_other']
-                
-                if not client_name and not case_number and not doc_code and not other:
-                    client_name = f"Split_{session_id}"
-                    doc_code = f"Part{i+1:02d}"
-                elif not doc_code:
-                    doc_code = f"DOC{i+1:03d}"
-                
-                # Add unique ID to the optional_other field (at the end)
-                if other:
-                    other = f"{other}_{unique_id}"
-                else:
-                    other = unique_id
-                
-                output_path = service.split_pdf(
-                    input_path=self.pdf_handler.pdf_path,
-                    start_page=split_data['start_page'],
-                    end_page=split_data['end_page'],
-                    output_name=client_name or "Document",
-                    document_code=doc_code,
-                    case_number=case_number,
-                    optional_other=other,
-                    output_folder=output_folder
-                )
-                
-                results.append({
-                    'filename': os.path.basename(output_path),
-                    'path': output_path
-                })
+            if not name and not case_number and not doc_code and not other:
+                name = f"Split_{session_id}"
+                doc_code = f"Part{i+1:02d}"
+            elif not doc_code:
+                doc_code = f"DOC{i+1:03d}"
             
-            dialog = SuccessDialog(self, results, output_folder)
-            dialog.exec()
-            self.status_bar.showMessage(f"✓ Complete! Created {len(results)} files", 5000)
+            # Add unique ID to the optional_other field (at the end)
+            other = f"{other}_{unique_id}" if other else unique_id
             
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Processing failed: {str(e)}")
-            self.status_bar.showMessage("[E] Processing failed")
+            jobs.append({
+                'start_page': split_data['start_page'],
+                'end_page': split_data['end_page'],
+                'output_name': name or "Document",
+                'document_code': doc_code,
+                'case_number': case_number,
+                'optional_other': other,
+                'output_folder': output_folder,
+                'pages': split_data['pages'],
+                'save_profile': save_profile
+            })
+        return jobs
+        
+    def _on_split_finished(self, results):
+        from src.gui.dialogs.success_dialog import SuccessDialog
+        
+        self._progress_dialog.accept()
+        output_folder = self._split_worker.jobs[0]['output_folder']
+        dialog = SuccessDialog(self, results, output_folder)
+        dialog.exec()
+        self.status_bar.showMessage(f"✓ Complete! Created {len(results)} files", 5000)
+        
+    def _on_split_failed(self, message):
+        self._progress_dialog.accept()
+        QMessageBox.critical(self, "Error", f"Processing failed: {message}")
+        self.status_bar.showMessage("[E] Processing failed")
+        
+    def _on_split_cancelled(self):
+        self._progress_dialog.accept()
+        self.status_bar.showMessage("[-] Split cancelled; partial output removed", 5000)
+    
+    def closeEvent(self, event):
+        self.thumbnail_loader.shutdown()
+        worker = getattr(self, '_analysis_worker', None)
+        if worker is not None:
+            worker.wait()
+        split_worker = getattr(self, '_split_worker', None)
+        if split_worker is not None and split_worker.isRunning():
+            # Stop at the next page and let the worker remove its partial outputs;
+            # no result dialogs for a window that is closing
+            split_worker.blockSignals(True)
+            split_worker.cancel()
+            split_worker.wait()
+        super().closeEvent(event)
     
     def _show_documentation(self):
         from src.gui.dialogs.documentation_dialog import DocumentationDialog
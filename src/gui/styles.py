@@ -86,14 +86,14 @@ QLineEdit:focus {
     outline: none;
 }
 
-QSpinBox {
+QSpinBox, QDoubleSpinBox {
     padding: 6px;
     border: 1px solid #ddd;
     border-radius: 4px;
     font-size: 13px;
 }
 
-QSpinBox:focus {
+QSpinBox:focus, QDoubleSpinBox:focus {
     border-color: #4CAF50;
 }
 
@@ -168,4 +168,66 @@ QMenu::item {
 QMenu::item:selected {
     background-color: #f0f0f0;
 }
-"""
\ No newline at end of file
+"""
+
+# Split rows share one stylesheet on their container instead of each widget
+# parsing its own; validation states are switched with the "state" property.
+SPLIT_ROW_STYLE = """
+SplitRowStyled {
+    background-color: white;
+    border: 1px solid #dee2e6;
+    border-radius: 5px;
+    margin: 2px;
+}
+
+QLabel#rowNumber {
+    background-color: #f8f9fa;
+    padding: 8px 12px;
+    border: 1px solid #dee2e6;
+    border-radius: 4px;
+    font-weight: bold;
+}
+
+QLabel#pageCheck {
+    color: green;
+    font-size: 16px;
+}
+
+QLabel#pageCheck[state="invalid"] {
+    color: red;
+}
+
+QLineEdit#pagesInput, QLineEdit#otherInput {
+    border: 1px solid #ccc;
+}
+
+QLineEdit#docCode, QLineEdit#pagesInput[state="invalid"] {
+    border: 2px solid #dc3545;
+}
+
+QLineEdit#docCode[state="filled"], QLineEdit#pagesInput[state="valid"],
+QLineEdit#otherInput[state="filled"] {
+    border: 2px solid #28a745;
+}
+
+QPushButton#removeButton {
+    background-color: #dc3545;
+    color: white;
+    font-size: 13px;
+    font-weight: bold;
+    padding: 8px 16px;
+    border: none;
+    border-radius: 4px;
+}
+
+QPushButton#removeButton:hover {
+    background-color: #c82333;
+}
+
+PageThumbnail {
+    border: 1px solid #dee2e6;
+    background: #f8f9fa;
+    color: #6c757d;
+    font-size: 10px;
+}
+"""
@@ -0,0 +1,202 @@
+"""Page thumbnail widgets fed by a ThumbnailLoader."""
+
+from typing import Dict, Set, Tuple
+
+from PyQt6.QtWidgets import QLabel, QListWidget, QListWidgetItem, QListView
+from PyQt6.QtCore import QObject, Qt, QPoint, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon, QPixmap
+
+from src.services.page_renderer import THUMBNAIL_WIDTH
+
+
+ROW_THUMBNAIL_WIDTH = 36
+
+
+class ThumbnailDispatcher(QObject):
+    """Hands each finished thumbnail to the PageThumbnails waiting for it.
+
+    One connection to the loader serves every row thumbnail, so a render
+    costs one lookup instead of a call into each of thousands of widgets.
+    """
+
+    def __init__(self, loader):
+        super().__init__(loader)
+        self._waiting: Dict[Tuple[int, int], Set['PageThumbnail']] = {}
+        loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    @staticmethod
+    def for_loader(loader) -> 'ThumbnailDispatcher':
+        """The loader's dispatcher, created on first use."""
+        dispatcher = loader.findChild(ThumbnailDispatcher, "",
+                                      Qt.FindChildOption.FindDirectChildrenOnly)
+        return dispatcher or ThumbnailDispatcher(loader)
+
+    def wait(self, thumb: 'PageThumbnail', page: int, width: int) -> None:
+        self._waiting.setdefault((page, width), set()).add(thumb)
+
+    def stop_waiting(self, thumb: 'PageThumbnail', page: int, width: int) -> None:
+        waiting = self._waiting.get((page, width))
+        if waiting is not None:
+            waiting.discard(thumb)
+            if not waiting:
+                del self._waiting[(page, width)]
+
+    def _on_thumbnail_ready(self, page, width, pixmap):
+        for thumb in list(self._waiting.pop((page, width), ())):
+            thumb.show_pixmap(pixmap)
+
+
+class PageThumbnail(QLabel):
+    """Small preview of one page, e.g. a split row's start or end page."""
+
+    def __init__(self, loader, width=ROW_THUMBNAIL_WIDTH, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.thumb_width = width
+        self.page = None
+        self._requested = None
+        self.owner = loader.new_owner()
+        self.dispatcher = ThumbnailDispatcher.for_loader(loader)
+        self.setFixedSize(width, int(width * 1.3))
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def release(self):
+        """Stop wanting this thumbnail (call before the widget is deleted)."""
+        self.loader.release(self.owner)
+        self._stop_waiting()
+        self.page = self._requested = None
+
+    def set_page(self, page):
+        """Show page (1-indexed); renders in the background when not cached.
+
+        The render is requested on the next paint, so rows scrolled out of
+        view (e.g. after adding thousands of bookmark splits) request nothing.
+        """
+        if page == self.page:
+            return
+        self._stop_waiting()
+        self.page = page
+        self.setToolTip(f"Page {page}")
+        self.clear()
+        self.setText(str(page))
+        self.update()
+
+    def paintEvent(self, event):
+        if self.page != self._requested:
+            self._requested = self.page
+            cached = self.loader.want(self.owner, [self.page], self.thumb_width)
+            if self.page in cached:
+                self.show_pixmap(cached[self.page])
+            else:
+                self.dispatcher.wait(self, self.page, self.thumb_width)
+        super().paintEvent(event)
+
+    def _stop_waiting(self):
+        if self._requested is not None:
+            self.dispatcher.stop_waiting(self, self._requested, self.thumb_width)
+            self._requested = None
+
+    def show_pixmap(self, pixmap: QPixmap):
+        self.setPixmap(pixmap.scaled(
+            self.size(), Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        ))
+
+
+class PageFilmstrip(QListWidget):
+    """Horizontal strip of every page; only visible pages are rendered."""
+
+    page_activated = pyqtSignal(int)
+
+    def __init__(self, loader, width=THUMBNAIL_WIDTH, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.thumb_width = width
+        self.owner = loader.new_owner()
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(False)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setIconSize(QSize(width, int(width * 1.3)))
+        self.setFixedHeight(int(width * 1.3) + 50)
+        self.setHorizontalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+
+        # Scrolling requests visible pages at most every 50 ms
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(50)
+        self._visible_timer.timeout.connect(self._request_visible)
+        self.horizontalScrollBar().valueChanged.connect(self._schedule_visible)
+        self.itemActivated.connect(lambda item: self.page_activated.emit(item.data(Qt.ItemDataRole.UserRole)))
+        loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._page_count = 0
+
+    def set_page_count(self, page_count):
+        """Show a document with page_count pages (0 to empty the strip).
+
+        Items are only created while the strip is visible, so a hidden
+        strip costs nothing for large documents.
+        """
+        self._page_count = page_count
+        self.clear()
+        if self.isVisible():
+            self._populate()
+
+    def _populate(self):
+        self.setUpdatesEnabled(False)
+        item_size = QSize(self.thumb_width + 12, int(self.thumb_width * 1.3) + 28)
+        for page in range(1, self._page_count + 1):
+            item = QListWidgetItem(str(page))
+            item.setData(Qt.ItemDataRole.UserRole, page)
+            item.setSizeHint(item_size)
+            self.addItem(item)
+        self.setUpdatesEnabled(True)
+        self._schedule_visible()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.count() != self._page_count:
+            self.clear()
+            self._populate()
+        self._schedule_visible()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # A hidden strip should not keep renders queued
+        self.loader.want(self.owner, [], self.thumb_width)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_visible()
+
+    def _schedule_visible(self, *args):
+        if not self._visible_timer.isActive():
+            self._visible_timer.start()
+
+    def _request_visible(self):
+        if not self.isVisible() or not self.count():
+            return
+        pages = self._visible_pages()
+        cached = self.loader.want(self.owner, pages, self.thumb_width)
+        for page, pixmap in cached.items():
+            self.item(page - 1).setIcon(QIcon(pixmap))
+
+    def _visible_pages(self):
+        """Pages whose items intersect the viewport, plus a small margin."""
+        viewport = self.viewport().rect()
+        middle = viewport.center().y()
+        first = self.indexAt(QPoint(viewport.left() + 1, middle))
+        last = self.indexAt(QPoint(viewport.right() - 1, middle))
+        start = first.row() if first.isValid() else 0
+        if last.isValid():
+            end = last.row()
+        else:
+            # The right edge falls between items or past the last one
+            end = start + viewport.width() // (self.thumb_width + 12) + 1
+        start, end = max(0, start - 2), min(self.count() - 1, end + 2)
+        return range(start + 1, end + 2)
+
+    def _on_thumbnail_ready(self, page, width, pixmap):
+        if width == self.thumb_width and 1 <= page <= self.count():
+            self.item(page - 1).setIcon(QIcon(pixmap))
@@ -4,17 +4,38 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QIcon
+from src.models.page_selection import PageSelectionError, compile_selection
+
+
+def _set_state(widget, state):
+    """Switch the widget's style state (see SPLIT_ROW_STYLE) when it differs."""
+    if widget.property("state") != state:
+        widget.setProperty("state", state)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+def _set_text(widget, text):
+    """Set label text only when it differs."""
+    if widget.text() != text:
+        widget.setText(text)
 
 
 class SplitRowStyled(QWidget):
     remove_clicked = pyqtSignal()
     values_changed = pyqtSignal()
     
-    def __init__(self, row_number, start_page, end_page, max_pages):
+    def __init__(self, row_number, start_page, end_page, max_pages, thumbnails=None,
+                 doc_code=""):
         super().__init__()
         self.row_number = row_number
         self.max_pages = max_pages
+        self.thumbnails = thumbnails
+        self._compiled_pages = (None, None)
         self._init_ui(start_page, end_page)
+        if doc_code:
+            self.code_input.setText(doc_code)
+        self._update_thumbnails()
         
     def _init_ui(self, start, end):
         layout = QHBoxLayout()
@@ -22,13 +43,7 @@ class SplitRowStyled(QWidget):
         layout.setSpacing(10)
         
         self.row_label = QLabel(str(self.row_number))
-        self.row_label.setStyleSheet("""
-            background-color: #f8f9fa;
-            padding: 8px 12px;
-            border: 1px solid #dee2e6;
-            border-radius: 4px;
-            font-weight: bold;
-        """)
+        self.row_label.setObjectName("rowNumber")
         layout.addWidget(self.row_label)
         
         layout.addWidget(QLabel("Start Page"))
@@ -41,8 +56,10 @@ class SplitRowStyled(QWidget):
         self.start_spin.setMinimumWidth(80)
         layout.addWidget(self.start_spin)
         
+        self.start_thumb = self._add_thumbnail(layout)
+        
         self.start_check = QLabel("✓")
-        self.start_check.setStyleSheet("color: green; font-size: 16px;")
+        self.start_check.setObjectName("pageCheck")
         layout.addWidget(self.start_check)
         
         layout.addWidget(QLabel("End Page"))
@@ -55,97 +72,134 @@ class SplitRowStyled(QWidget):
         self.end_spin.setMinimumWidth(80)
         layout.addWidget(self.end_spin)
         
+        self.end_thumb = self._add_thumbnail(layout)
+        
         self.end_check = QLabel("✓")
-        self.end_check.setStyleSheet("color: green; font-size: 16px;")
+        self.end_check.setObjectName("pageCheck")
         layout.addWidget(self.end_check)
         
+        layout.addWidget(QLabel("Pages"))
+        
+        # Optional selection expression; overrides start/end when filled
+        self.pages_input = QLineEdit()
+        self.pages_input.setObjectName("pagesInput")
+        self.pages_input.setPlaceholderText("e.g. 1-5,9,odd")
+        self.pages_input.setToolTip(
+            "Optional page selection, e.g. 1-50,75,80-120,odd,last-10.\n"
+            "When filled it is used instead of Start/End Page."
+        )
+        self.pages_input.setMaximumWidth(140)
+        self.pages_input.textChanged.connect(self._on_values_changed)
+        layout.addWidget(self.pages_input)
+        
         layout.addWidget(QLabel("Doc Code"))
         
         self.code_input = QLineEdit()
+        self.code_input.setObjectName("docCode")
         self.code_input.setPlaceholderText("DOC001")
         self.code_input.setMaximumWidth(120)
         self.code_input.textChanged.connect(self._on_values_changed)
         # Add validation styling - green when filled, red when empty
         self.code_input.textChanged.connect(
-            lambda text: self.code_input.setStyleSheet(
-                "QLineEdit { border: 2px solid #28a745; }" if text.strip() 
-                else "QLineEdit { border: 2px solid #dc3545; }"
-            )
+            lambda text: _set_state(self.code_input, "filled" if text.strip() else None)
         )
-        # Start with red border (empty)
-        self.code_input.setStyleSheet("QLineEdit { border: 2px solid #dc3545; }")
         layout.addWidget(self.code_input)
         
         layout.addWidget(QLabel("Optional Name"))
         
         self.other_input = QLineEdit()
+        self.other_input.setObjectName("otherInput")
         self.other_input.setPlaceholderText("Enter name (optional)")
         self.other_input.textChanged.connect(self._on_values_changed)
         # Optional field - use softer colors (grey when empty, green when filled)
         self.other_input.textChanged.connect(
-            lambda text: self.other_input.setStyleSheet(
-                "QLineEdit { border: 2px solid #28a745; }" if text.strip() 
-                else "QLineEdit { border: 1px solid #ccc; }"
-            )
+            lambda text: _set_state(self.other_input, "filled" if text.strip() else None)
         )
         layout.addWidget(self.other_input, 1)
         
         self.remove_btn = QPushButton("Remove")
         self.remove_btn.setObjectName("removeButton")
         self.remove_btn.clicked.connect(self.remove_clicked.emit)
-        self.remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
         layout.addWidget(self.remove_btn)
         
         self.setLayout(layout)
-        self.setStyleSheet("""
-            SplitRowStyled {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 5px;
-                margin: 2px;
-            }
-        """)
+        
+    def _add_thumbnail(self, layout):
+        """Add a page preview when a thumbnail loader is available."""
+        if self.thumbnails is None:
+            return None
+        from src.gui.widgets.page_thumbnail import PageThumbnail
+        thumb = PageThumbnail(self.thumbnails)
+        layout.addWidget(thumb)
+        return thumb
         
     def _on_values_changed(self):
         if self.end_spin.value() < self.start_spin.value():
             self.end_spin.setValue(self.start_spin.value())
         
         self._update_validation()
+        self._update_thumbnails()
         self.values_changed.emit()
         
+    def _update_thumbnails(self):
+        """Preview the first and last page this row covers."""
+        if self.start_thumb is None:
+            return
+        runs = self.get_page_runs()
+        self.start_thumb.set_page(max(1, min(runs[0][0], self.max_pages)))
+        self.end_thumb.set_page(max(1, min(runs[-1][1], self.max_pages)))
+        
+    def release_thumbnails(self):
+        """Drop pending thumbnail renders before the row is deleted."""
+        for thumb in (self.start_thumb, self.end_thumb):
+            if thumb is not None:
+                thumb.release()
+        
     def _update_validation(self):
         start_valid = 1 <= self.start_spin.value() <= self.max_pages
         end_valid = self.start_spin.value() <= self.end_spin.value() <= self.max_pages
         
-        self.start_check.setText("✓" if start_valid else "✗")
-        self.start_check.setStyleSheet(
-            "color: green; font-size: 16px;" if start_valid else "color: red; font-size: 16px;"
-        )
-        
-        self.end_check.setText("✓" if end_valid else "✗")
-        self.end_check.setStyleSheet(
-            "color: green; font-size: 16px;" if end_valid else "color: red; font-size: 16px;"
-        )
+        _set_text(self.start_check, "✓" if start_valid else "✗")
+        _set_state(self.start_check, None if start_valid else "invalid")
+        
+        _set_text(self.end_check, "✓" if end_valid else "✗")
+        _set_state(self.end_check, None if end_valid else "invalid")
+        
+        if not self.pages_input.text().strip():
+            _set_state(self.pages_input, None)
+        elif self.get_page_selection() is None:
+            _set_state(self.pages_input, "invalid")
+        else:
+            _set_state(self.pages_input, "valid")
+        
+    def get_page_selection(self):
+        """Compile the Pages field, or None when it is empty or invalid."""
+        expression = self.pages_input.text().strip()
+        if not expression:
+            return None
+        # Spin-box edits don't touch the expression, so reuse the last compile
+        if self._compiled_pages[0] != expression:
+            try:
+                selection = compile_selection(expression, self.max_pages)
+            except PageSelectionError:
+                selection = None
+            self._compiled_pages = (expression, selection)
+        return self._compiled_pages[1]
+        
+    def get_page_runs(self):
+        """Get the (start, end) runs this row covers."""
+        selection = self.get_page_selection()
+        if selection is not None:
+            return list(selection.runs)
+        return [(self.start_spin.value(), self.end_spin.value())]
         
     def get_values(self):
         return {
             'start_page': self.start_spin.value(),
             'end_page': self.end_spin.value(),
             'doc_code': self.code_input.text(),
-            'other': self.other_input.text()
+            'other': self.other_input.text(),
+            'pages': self.pages_input.text()
         }
         
     def set_row_number(self, number):
@@ -153,4 +207,6 @@ class SplitRowStyled(QWidget):
         self.row_label.setText(str(number))
         
     def validate(self):
+        if self.pages_input.text().strip():
+            return self.get_page_selection() is not None
         return self.start_spin.value() <= self.end_spin.value()
\ No newline at end of file
@@ -0,0 +1 @@
+"""Background workers that keep long-running jobs off the GUI thread."""
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Runs a document analysis (separators, text patterns) on a background thread."""
+
+from typing import Any, Callable
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class AnalysisWorker(QThread):
+    """Calls func(input_path, **kwargs) off the GUI thread.
+
+    Used for analyses that scan every page, such as separator detection
+    or building the page-text index, so the window stays responsive on
+    large files. func must not touch widgets.
+    """
+
+    analysis_finished = pyqtSignal(object)    # func's return value
+    analysis_failed = pyqtSignal(str)         # error message
+
+    def __init__(self, input_path: str, func: Callable[..., Any], parent=None, **kwargs):
+        """Initialize the worker.
+
+        Args:
+            input_path: Source PDF path, passed as the first argument
+            func: Analysis function
+            parent: Optional QObject parent
+            **kwargs: Further keyword arguments for func
+        """
+        super().__init__(parent)
+        self.input_path = input_path
+        self.func = func
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        """Thread entry point: run the analysis."""
+        try:
+            self.analysis_finished.emit(self.func(self.input_path, **self.kwargs))
+        except Exception as e:
+            self.analysis_failed.emit(str(e))
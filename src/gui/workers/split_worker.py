@@ -0,0 +1,99 @@
+"""Runs a batch of splits on a background thread."""
+
+import os
+from typing import Any, Dict, List
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.services.pdf_service import PDFService
+from src.services.split_session import SplitCancelled, SplitSession
+from src.services.split_trace import trace_batch
+
+
+class SplitWorker(QThread):
+    """Runs split jobs off the GUI thread and reports progress.
+
+    Each job is a dict of PDFService.split_pdf keyword arguments (without
+    input_path/session). Signals carry per-split and per-page progress;
+    cancel() stops between pages and removes the outputs of this batch.
+    """
+
+    split_started = pyqtSignal(int, int)      # split index, split count
+    pages_progress = pyqtSignal(int, int)     # pages done, pages total
+    batch_finished = pyqtSignal(list)         # [{'filename', 'path'}, ...]
+    batch_failed = pyqtSignal(str)            # error message
+    batch_cancelled = pyqtSignal()
+
+    def __init__(self, input_path: str, jobs: List[Dict[str, Any]], parent=None):
+        """Initialize the worker.
+
+        Args:
+            input_path: Source PDF path
+            jobs: split_pdf keyword arguments for each split
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self.input_path = input_path
+        self.jobs = jobs
+        self._cancel_requested = False
+        self._job_pages: List[int] = []
+        self._pages_before = 0
+        self._pages_total = 0
+        self._created: List[str] = []
+
+    def cancel(self) -> None:
+        """Ask the worker to stop at the next page boundary."""
+        self._cancel_requested = True
+
+    def is_cancel_requested(self) -> bool:
+        """Check whether cancel() has been called."""
+        return self._cancel_requested
+
+    def run(self) -> None:
+        """Thread entry point: run every split against one session."""
+        session = SplitSession(self.input_path, self._on_pages, self.is_cancel_requested)
+        try:
+            with trace_batch(os.path.splitext(os.path.basename(self.input_path))[0]), session:
+                self._pages_total = self._count_pages(session)
+                results = [self._run_job(session, i) for i in range(len(self.jobs))]
+            self.batch_finished.emit(results)
+        except SplitCancelled:
+            self._remove_created_outputs()
+            self.batch_cancelled.emit()
+        except Exception as e:
+            self.batch_failed.emit(str(e))
+
+    def _run_job(self, session: SplitSession, index: int) -> Dict[str, str]:
+        """Run one split and record its output."""
+        self.split_started.emit(index, len(self.jobs))
+        output_path = PDFService.split_pdf(input_path=self.input_path, session=session,
+                                           **self.jobs[index])
+        self._created.append(output_path)
+        if self._cancel_requested:
+            raise SplitCancelled("Split cancelled")
+        self._pages_before += self._job_pages[index]
+        self.pages_progress.emit(self._pages_before, self._pages_total)
+        return {'filename': os.path.basename(output_path), 'path': output_path}
+
+    def _count_pages(self, session: SplitSession) -> int:
+        """Resolve every job's page count up front for overall progress."""
+        self._job_pages = [
+            session.select_pages(
+                job['start_page'], job['end_page'], job.get('pages', '')
+            ).page_count
+            for job in self.jobs
+        ]
+        return sum(self._job_pages)
+
+    def _on_pages(self, copied: int) -> None:
+        """Session hook: pages copied so far in the current split."""
+        self.pages_progress.emit(self._pages_before + copied, self._pages_total)
+
+    def _remove_created_outputs(self) -> None:
+        """Delete files written by this batch before it was cancelled."""
+        for path in self._created:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._created.clear()
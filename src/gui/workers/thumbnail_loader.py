@@ -0,0 +1,229 @@
+"""Renders page thumbnails on a thread pool with an LRU pixmap cache."""
+
+import itertools
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from src.services.page_renderer import TileCache, default_tile_cache_root
+
+# (page number, pixel width)
+TileKey = Tuple[int, int]
+
+
+class PixmapCache:
+    """LRU of thumbnails bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int = 48 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._pixmaps: "OrderedDict[TileKey, QPixmap]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: TileKey) -> Optional[QPixmap]:
+        """Cached pixmap for key, marking it recently used."""
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key: TileKey, pixmap: QPixmap) -> None:
+        """Store a pixmap and evict the least recently used beyond max_bytes."""
+        if key in self._pixmaps:
+            self._bytes -= self._size(self._pixmaps.pop(key))
+        self._pixmaps[key] = pixmap
+        self._bytes += self._size(pixmap)
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= self._size(evicted)
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    @staticmethod
+    def _size(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * 4
+
+
+class _RenderTask(QRunnable):
+    """One tile render; skipped if nobody wants the tile by the time it runs."""
+
+    def __init__(self, loader: 'ThumbnailLoader', generation: int, key: TileKey):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.loader = loader
+        self.generation = generation
+        self.key = key
+
+    def run(self) -> None:
+        self.loader._render(self)
+
+
+class ThumbnailLoader(QObject):
+    """Serves page thumbnails without blocking the GUI thread.
+
+    Widgets register the tiles they show with want() under an owner id;
+    cached pixmaps are returned at once and the rest are rendered on a
+    thread pool. When an owner moves on (e.g. a spin box steps past a
+    page) tiles nobody wants anymore are taken back out of the pool's
+    queue, and a task that starts for an unwanted tile returns without
+    rendering, so fast scrolling never piles up stale renders.
+
+    Each pool thread opens its own handle on the document, because a
+    fitz.Document must not be used from two threads at once.
+    """
+
+    thumbnail_ready = pyqtSignal(int, int, QPixmap)   # page, width, pixmap
+    _rendered = pyqtSignal(int, int, int, QImage)     # generation, page, width, image
+
+    def __init__(self, max_threads: int = 2, parent=None):
+        """Initialize the loader with no document.
+
+        Args:
+            max_threads: Render threads in the pool
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self.pixmaps = PixmapCache()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        # Idle threads exit soon, closing their handle on the old document
+        self._pool.setExpiryTimeout(5000)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._owner_ids = itertools.count(1)
+        self._wanted: Dict[int, Set[TileKey]] = {}
+        self._want_counts: Counter = Counter()
+        self._queued: Dict[TileKey, _RenderTask] = {}
+        self._generation = 0
+        self._path: Optional[str] = None
+        self._tiles: Optional[TileCache] = None
+        self._rendered.connect(self._on_rendered)
+
+    def set_document(self, path: Optional[str], fingerprint: str = "") -> None:
+        """Switch to a new document (None to clear) and drop all pending work."""
+        self._pool.clear()
+        with self._lock:
+            self._generation += 1
+            self._path = path
+            self._wanted.clear()
+            self._want_counts.clear()
+            self._queued.clear()
+        self.pixmaps.clear()
+        root = default_tile_cache_root()
+        self._tiles = TileCache(root, fingerprint) if root and fingerprint and path else None
+
+    def new_owner(self) -> int:
+        """Get an id for a widget that will request thumbnails."""
+        return next(self._owner_ids)
+
+    def want(self, owner: int, pages: Iterable[int], width: int) -> Dict[int, QPixmap]:
+        """Set the pages an owner shows and queue the missing renders.
+
+        Args:
+            owner: Id from new_owner()
+            pages: Pages (1-indexed) the owner currently displays
+            width: Thumbnail width in pixels
+
+        Returns:
+            Pixmaps already cached, by page; the others arrive through
+            thumbnail_ready
+        """
+        keys = {(page, width) for page in pages}
+        cached = {}
+        with self._lock:
+            if self._path is None:
+                return cached
+            self._set_wanted(owner, keys)
+            for key in sorted(keys):
+                pixmap = self.pixmaps.get(key)
+                if pixmap is not None:
+                    cached[key[0]] = pixmap
+                elif key not in self._queued:
+                    task = _RenderTask(self, self._generation, key)
+                    self._queued[key] = task
+                    self._pool.start(task)
+        return cached
+
+    def release(self, owner: int) -> None:
+        """Forget an owner's tiles (e.g. when its widget is destroyed)."""
+        with self._lock:
+            self._set_wanted(owner, set())
+            self._wanted.pop(owner, None)
+
+    def _set_wanted(self, owner: int, keys: Set[TileKey]) -> None:
+        """Replace an owner's wanted tiles; unqueue tiles nobody wants. Needs _lock."""
+        old = self._wanted.get(owner, set())
+        self._wanted[owner] = keys
+        self._want_counts.update(keys - old)
+        for key in old - keys:
+            self._want_counts[key] -= 1
+            if self._want_counts[key] <= 0:
+                del self._want_counts[key]
+                task = self._queued.get(key)
+                if task is not None and self._pool.tryTake(task):
+                    del self._queued[key]
+
+    def _still_wanted(self, task: _RenderTask) -> Optional[str]:
+        """Path to render from if task is current and wanted, else None."""
+        with self._lock:
+            if task.generation != self._generation or task.key not in self._want_counts:
+                if self._queued.get(task.key) is task:
+                    del self._queued[task.key]
+                return None
+            return self._path
+
+    def _render(self, task: _RenderTask) -> None:
+        """Pool thread: load a tile from the disk cache or render it."""
+        path = self._still_wanted(task)
+        if path is None:
+            return
+        page, width = task.key
+        tiles = self._tiles
+        image = QImage()
+        png = tiles.get(page, width) if tiles else None
+        if png is not None:
+            image.loadFromData(png, "PNG")
+        if image.isNull():
+            try:
+                pixmap = self._render_pixmap(path, page, width)
+            except Exception:
+                self._rendered.emit(task.generation, page, width, QImage())
+                return
+            image = QImage(pixmap.samples, pixmap.width, pixmap.height,
+                           pixmap.stride, QImage.Format.Format_RGB888).copy()
+            if tiles:
+                tiles.put(page, width, pixmap.tobytes("png"))
+        self._rendered.emit(task.generation, page, width, image)
+
+    def _render_pixmap(self, path: str, page: int, width: int):
+        """Render with this thread's own document handle."""
+        import fitz
+        from src.services.page_renderer import render_page
+
+        if getattr(self._local, 'path', None) != path:
+            if getattr(self._local, 'doc', None) is not None:
+                self._local.doc.close()
+            self._local.doc = fitz.open(path)
+            self._local.path = path
+        return render_page(self._local.doc, page, width)
+
+    def _on_rendered(self, generation: int, page: int, width: int, image: QImage) -> None:
+        """GUI thread: cache the finished tile and notify widgets."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._queued.pop((page, width), None)
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        self.pixmaps.put((page, width), pixmap)
+        self.thumbnail_ready.emit(page, width, pixmap)
+
+    def shutdown(self) -> None:
+        """Drop queued renders and wait for the running ones."""
+        self.set_document(None)
+        self._pool.waitForDone(2000)
@@ -0,0 +1,109 @@
+"""Interval-based page coverage for a set of splits."""
+
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from src.models.page_selection import PageRun, merge_runs
+
+
+class PageCoverage:
+    """Gaps, overlaps and ownership of pages across splits.
+
+    Every split is a list of inclusive page runs. All queries work on
+    sorted, merged intervals, so cost depends on the number of runs k
+    (O(k log k) to build, O(log k) per owner lookup), never on the number
+    of pages in the document.
+    """
+
+    def __init__(self, total_pages: int, splits: Iterable[Sequence[PageRun]]):
+        """Build the coverage map.
+
+        Args:
+            total_pages: Number of pages in the document
+            splits: Page runs for each split, in split order
+        """
+        self.total_pages = total_pages
+        intervals = []
+        for owner, runs in enumerate(splits):
+            for start, end in runs:
+                start, end = max(start, 1), min(end, total_pages)
+                if start <= end:
+                    intervals.append((start, end, owner))
+        intervals.sort()
+        self.covered = merge_runs([(start, end) for start, end, _ in intervals])
+        self.gaps = self._find_gaps()
+        self._segment_starts, self._segments = self._build_segments(intervals)
+        self.overlaps = self._find_overlaps()
+
+    @property
+    def covered_pages(self) -> int:
+        """Number of distinct pages covered by at least one split."""
+        return sum(end - start + 1 for start, end in self.covered)
+
+    @property
+    def gap_pages(self) -> int:
+        """Number of pages not covered by any split."""
+        return self.total_pages - self.covered_pages
+
+    def has_gaps(self) -> bool:
+        """Check if any page is not covered."""
+        return bool(self.gaps)
+
+    def coverage_percentage(self) -> float:
+        """Percentage of pages covered, rounded to one decimal."""
+        if self.total_pages <= 0:
+            return 0.0
+        return round(self.covered_pages / self.total_pages * 100, 1)
+
+    def owners_of(self, page: int) -> Tuple[int, ...]:
+        """Indexes of every split that includes page (1-indexed)."""
+        position = bisect_right(self._segment_starts, page) - 1
+        if position < 0:
+            return ()
+        end, owners = self._segments[position]
+        return owners if page <= end else ()
+
+    def owner_of(self, page: int) -> Optional[int]:
+        """Index of the first split that includes page, or None."""
+        owners = self.owners_of(page)
+        return owners[0] if owners else None
+
+    def _find_gaps(self) -> List[PageRun]:
+        """Complement of the covered runs within the document."""
+        gaps = []
+        next_page = 1
+        for start, end in self.covered:
+            if start > next_page:
+                gaps.append((next_page, start - 1))
+            next_page = end + 1
+        if next_page <= self.total_pages:
+            gaps.append((next_page, self.total_pages))
+        return gaps
+
+    def _find_overlaps(self) -> List[PageRun]:
+        """Runs of pages that belong to two or more splits."""
+        overlaps = [
+            (start, end)
+            for start, (end, owners) in zip(self._segment_starts, self._segments)
+            if len(owners) > 1
+        ]
+        return merge_runs(overlaps)
+
+    @staticmethod
+    def _build_segments(intervals: List[Tuple[int, int, int]]):
+        """Sweep interval boundaries into disjoint segments with their owners."""
+        events = sorted(
+            [(start, 1, owner) for start, _, owner in intervals] +
+            [(end + 1, -1, owner) for _, end, owner in intervals]
+        )
+        starts, segments = [], []
+        active = {}
+        for i, (page, delta, owner) in enumerate(events):
+            active[owner] = active.get(owner, 0) + delta
+            if not active[owner]:
+                del active[owner]
+            next_page = events[i + 1][0] if i + 1 < len(events) else None
+            if active and next_page is not None and next_page > page:
+                starts.append(page)
+                segments.append((next_page - 1, tuple(sorted(active))))
+        return starts, segments
@@ -0,0 +1,168 @@
+"""Page selection expressions compiled into contiguous page runs."""
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+
+# A run is an inclusive, 1-indexed (first_page, last_page) pair
+PageRun = Tuple[int, int]
+
+KEYWORDS = ('all', 'odd', 'even', 'last')
+
+
+class PageSelectionError(ValueError):
+    """Raised when a page selection expression is malformed or out of range."""
+
+
+@dataclass(frozen=True)
+class PageSelection:
+    """Compiled page selection: sorted, merged, non-overlapping page runs."""
+    expression: str
+    runs: Tuple[PageRun, ...]
+
+    @property
+    def page_count(self) -> int:
+        """Total number of selected pages."""
+        return sum(end - start + 1 for start, end in self.runs)
+
+    @property
+    def first_page(self) -> int:
+        """First selected page (1-indexed)."""
+        return self.runs[0][0]
+
+    @property
+    def last_page(self) -> int:
+        """Last selected page (1-indexed)."""
+        return self.runs[-1][1]
+
+    def pages(self) -> List[int]:
+        """Expand the runs into individual page numbers."""
+        return [page for start, end in self.runs for page in range(start, end + 1)]
+
+
+def parse_selection(expression: str) -> List[str]:
+    """Split an expression into validated terms without resolving pages.
+
+    Args:
+        expression: Comma separated terms such as "1-50,75,odd,last-10"
+
+    Returns:
+        List of normalized terms
+    """
+    terms = [term.strip().lower().replace(' ', '') for term in expression.split(',')]
+    terms = [term for term in terms if term]
+    if not terms:
+        raise PageSelectionError("Page selection is empty")
+    for term in terms:
+        _check_term(term)
+    return terms
+
+
+def compile_selection(expression: str, total_pages: int) -> PageSelection:
+    """Compile an expression into the fewest contiguous runs.
+
+    Supported terms: "N", "N-M", "N-last", "last", "last-K" (final K
+    pages), "odd", "even" and "all". Overlapping and adjacent terms are
+    merged, so "1-50,51-60" compiles to a single run.
+
+    Args:
+        expression: Page selection expression
+        total_pages: Number of pages in the source document
+
+    Returns:
+        Compiled PageSelection
+    """
+    runs: List[PageRun] = []
+    for term in parse_selection(expression):
+        runs.extend(_resolve_term(term, total_pages))
+    if not runs:
+        raise PageSelectionError(f"Page selection '{expression}' matches no pages")
+    return PageSelection(expression=expression.strip(), runs=tuple(merge_runs(runs)))
+
+
+def range_selection(start_page: int, end_page: int, total_pages: int) -> PageSelection:
+    """Build a selection for a plain start/end range, clamped to the document."""
+    last_page = min(end_page, total_pages)
+    runs = ((start_page, last_page),) if start_page <= last_page else ()
+    return PageSelection(expression=f"{start_page}-{end_page}", runs=runs)
+
+
+def chunk_runs(total_pages: int, pages_per_chunk: int) -> Iterator[PageRun]:
+    """Yield consecutive runs of pages_per_chunk pages; the last may be shorter."""
+    if pages_per_chunk < 1:
+        raise PageSelectionError("Pages per chunk must be at least 1")
+    for start in range(1, total_pages + 1, pages_per_chunk):
+        yield start, min(start + pages_per_chunk - 1, total_pages)
+
+
+def merge_runs(runs: List[PageRun]) -> List[PageRun]:
+    """Sort runs and merge any that overlap or touch."""
+    merged: List[PageRun] = []
+    for start, end in sorted(runs):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _check_term(term: str) -> None:
+    """Raise PageSelectionError if a term is not valid syntax."""
+    if term in KEYWORDS:
+        return
+    low, sep, high = term.partition('-')
+    if low == 'last' and sep and high.isdigit() and int(high) > 0:
+        return
+    if not low.isdigit() or (sep and not (high.isdigit() or high == 'last')):
+        raise PageSelectionError(f"Invalid page selection term: '{term}'")
+    if int(low) < 1 or (high.isdigit() and int(high) < int(low)):
+        raise PageSelectionError(f"Invalid page range: '{term}'")
+
+
+def _resolve_term(term: str, total_pages: int) -> List[PageRun]:
+    """Resolve one validated term against the document length."""
+    if term == 'all':
+        return [(1, total_pages)]
+    if term in ('odd', 'even'):
+        first = 1 if term == 'odd' else 2
+        return [(page, page) for page in range(first, total_pages + 1, 2)]
+    low, sep, high = term.partition('-')
+    if low == 'last':
+        count = int(high) if sep else 1
+        return [(max(1, total_pages - count + 1), total_pages)]
+    start = int(low)
+    end = _resolve_bound(high, total_pages) if sep else start
+    if start > end or end > total_pages:
+        raise PageSelectionError(
+            f"Page selection '{term}' is outside the document ({total_pages} pages)"
+        )
+    return [(start, end)]
+
+
+def _resolve_bound(value: str, total_pages: int) -> int:
+    """Resolve the upper bound of a range term."""
+    return total_pages if value == 'last' else int(value)
+
+
+def describe_runs(runs: List[PageRun], separator: str = ', ',
+                  limit: Optional[int] = None) -> Optional[str]:
+    """Format runs compactly, e.g. [(1, 3), (7, 7)] -> "1-3, 7".
+
+    Args:
+        runs: Inclusive page runs
+        separator: Text placed between runs
+        limit: Show at most this many runs, then "(+N more)"
+
+    Returns:
+        Formatted text, or None when there are no runs
+    """
+    if not runs:
+        return None
+    shown = runs if limit is None else runs[:limit]
+    text = separator.join(
+        str(start) if start == end else f"{start}-{end}" for start, end in shown
+    )
+    if len(runs) > len(shown):
+        text += f" (+{len(runs) - len(shown)} more)"
+    return text
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, List
+from src.models.page_coverage import PageCoverage
+from src.models.page_selection import PageRun, compile_selection, parse_selection
 
 
 @dataclass
@@ -9,6 +11,7 @@ class SplitRequest:
     end_page: int
     document_code: str
     output_name: Optional[str] = None
+    page_selection: Optional[str] = None
     
     def __post_init__(self):
         """Validate the split request after initialization"""
@@ -25,6 +28,13 @@ class SplitRequest:
         self.document_code = self.document_code.strip()
         if self.output_name:
             self.output_name = self.output_name.strip()
+        
+        # Syntax check now; page bounds are checked against the document later
+        if self.page_selection and self.page_selection.strip():
+            self.page_selection = self.page_selection.strip()
+            parse_selection(self.page_selection)
+        else:
+            self.page_selection = None
     
     def to_dict(self) -> dict:
         """Convert to dictionary for service layer"""
@@ -32,7 +42,8 @@ class SplitRequest:
             'start_page': self.start_page,
             'end_page': self.end_page,
             'document_code': self.document_code,
-            'output_name': self.output_name or f"pages_{self.start_page}-{self.end_page}"
+            'output_name': self.output_name or f"pages_{self.start_page}-{self.end_page}",
+            'pages': self.page_selection or ''
         }
     
     @classmethod
@@ -42,11 +53,20 @@ class SplitRequest:
             start_page=data['start_page'],
             end_page=data['end_page'],
             document_code=data['document_code'],
-            output_name=data.get('output_name')
+            output_name=data.get('output_name'),
+            page_selection=data.get('pages') or None
         )
     
+    def get_page_runs(self, total_pages: int) -> List[PageRun]:
+        """Get the page runs this request covers in a document"""
+        if self.page_selection:
+            return list(compile_selection(self.page_selection, total_pages).runs)
+        return [(self.start_page, self.end_page)]
+    
     def get_page_range_str(self) -> str:
         """Get human-readable page range"""
+        if self.page_selection:
+            return f"Pages {self.page_selection}"
         if self.start_page == self.end_page:
             return f"Page {self.start_page}"
         return f"Pages {self.start_page}-{self.end_page}"
@@ -69,27 +89,20 @@ class PDFDocument:
         if self.case_number:
             self.case_number = self.case_number.strip()
     
+    def get_coverage(self, split_requests: List[SplitRequest]) -> PageCoverage:
+        """Build the interval coverage map of split requests over this document"""
+        return PageCoverage(
+            self.page_count,
+            [request.get_page_runs(self.page_count) for request in split_requests]
+        )
+    
     def get_unsplit_pages(self, split_requests: List[SplitRequest]) -> int:
         """Calculate number of pages not covered by split requests"""
-        covered_pages = set()
-        
-        for request in split_requests:
-            for page in range(request.start_page, request.end_page + 1):
-                covered_pages.add(page)
-        
-        return self.page_count - len(covered_pages)
+        return self.get_coverage(split_requests).gap_pages
     
     def get_split_percentage(self, split_requests: List[SplitRequest]) -> float:
         """Calculate percentage of pages covered by splits"""
-        if self.page_count == 0:
-            return 0.0
-        
-        covered_pages = set()
-        for request in split_requests:
-            for page in range(request.start_page, request.end_page + 1):
-                covered_pages.add(page)
-        
-        return round((len(covered_pages) / self.page_count) * 100, 1)
+        return self.get_coverage(split_requests).coverage_percentage()
     
     def validate_split_request(self, request: SplitRequest) -> bool:
         """Validate that a split request is valid for this document"""
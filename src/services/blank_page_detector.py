@@ -0,0 +1,167 @@
+"""Find blank pages and separator sheets to propose automatic splits.
+
+Pages whose content streams paint nothing are classified without
+rendering, and so are pages with a text layer, which are never blank:
+at detection size a single short line is too few pixels to tell from
+scanner noise. Every other page is rendered as a small grayscale image and
+counted as blank when almost no pixels differ clearly from the page's
+own background shade; comparing with the background rather than white
+also catches coloured slip sheets. Rendering runs in worker processes
+(see parallel_split.map_page_ranges).
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from src.models.split_request import SplitRequest
+from src.services.parallel_split import map_page_ranges, resolve_worker_count
+
+if TYPE_CHECKING:
+    import fitz
+
+
+DETECTION_WIDTH = 64          # Pixel width pages are rendered at
+MARGIN_RATIO = 0.06           # Border ignored on each side (scanner edges, punch holes)
+INK_CONTRAST = 48             # Gray levels off the background that count as ink
+MAX_INK_RATIO = 0.002         # Share of ink pixels a blank page may still have
+INLINE_PAGE_LIMIT = 64        # Smaller documents are classified in-process
+
+# Classification methods
+EMPTY_STREAM = 'empty_stream'
+TEXT_LAYER = 'text_layer'
+RENDERED = 'rendered'
+
+# Whitespace and the save/restore operators q/Q never paint anything
+_NON_PAINTING_BYTES = b' \t\r\n\f\x00qQ'
+
+
+@dataclass(frozen=True)
+class PageVerdict:
+    """Blank-page classification of one page (1-indexed)."""
+    page: int
+    blank: bool
+    method: str
+    ink_ratio: float = 0.0
+
+
+def classify_pages(input_path: str, workers: int = 0,
+                   chunk_size: Optional[int] = None) -> List[PageVerdict]:
+    """Classify every page of a PDF as blank or not.
+
+    Args:
+        input_path: Source PDF path
+        workers: Worker processes (0 = one per CPU, 1 = in-process)
+        chunk_size: Pages per task; defaults to about four chunks per worker
+
+    Returns:
+        One verdict per page, in page order
+    """
+    import fitz
+
+    with fitz.open(input_path) as doc:
+        page_count = doc.page_count
+        if page_count <= INLINE_PAGE_LIMIT or resolve_worker_count(workers, page_count) == 1:
+            return classify_range(doc, 1, page_count)
+    return map_page_ranges(input_path, page_count, classify_range, workers, chunk_size)
+
+
+def classify_range(doc: 'fitz.Document', start_page: int, end_page: int) -> List[PageVerdict]:
+    """Classify pages start_page..end_page (1-indexed) of an open document."""
+    import fitz
+    import numpy as np
+
+    verdicts = []
+    for number in range(start_page, end_page + 1):
+        page = doc.load_page(number - 1)
+        if has_empty_content(doc, page):
+            verdicts.append(PageVerdict(number, True, EMPTY_STREAM))
+            continue
+        if page.get_text().strip():
+            verdicts.append(PageVerdict(number, False, TEXT_LAYER))
+            continue
+        zoom = DETECTION_WIDTH / page.rect.width if page.rect.width else 1.0
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom),
+                                 colorspace=fitz.csGRAY, alpha=False)
+        pixels = np.frombuffer(pixmap.samples_mv, dtype=np.uint8)
+        pixels = pixels.reshape(pixmap.height, pixmap.stride)[:, :pixmap.width]
+        ink_ratio = ink_ratio_of(pixels)
+        verdicts.append(PageVerdict(number, bool(ink_ratio <= MAX_INK_RATIO), RENDERED,
+                                    round(float(ink_ratio), 6)))
+    return verdicts
+
+
+def has_empty_content(doc: 'fitz.Document', page: 'fitz.Page') -> bool:
+    """True when the page has no annotations and its streams paint nothing."""
+    if page.first_annot is not None or page.first_widget is not None:
+        return False
+    for xref in page.get_contents():
+        if (doc.xref_stream(xref) or b'').translate(None, _NON_PAINTING_BYTES):
+            return False
+    return True
+
+
+def ink_ratio_of(pixels) -> float:
+    """Share of pixels clearly off the background shade, margins excluded.
+
+    Args:
+        pixels: 2-D uint8 grayscale array
+
+    Returns:
+        Ink ratio between 0.0 and 1.0
+    """
+    import numpy as np
+
+    height, width = pixels.shape
+    dy, dx = int(height * MARGIN_RATIO), int(width * MARGIN_RATIO)
+    body = pixels[dy:height - dy, dx:width - dx]
+    if body.size == 0:
+        return 0.0
+    background = np.median(body)
+    return float(np.count_nonzero(np.abs(body - background) > INK_CONTRAST) / body.size)
+
+
+def propose_splits(verdicts: Sequence[PageVerdict], drop_separators: bool = True,
+                   code_prefix: str = "DOC") -> List[SplitRequest]:
+    """Turn blank-page verdicts into one split per document.
+
+    Runs of blank pages separate documents. When they are kept, a
+    separator goes with the document it introduces (leading blanks with the
+    first document, trailing blanks with the last).
+
+    Args:
+        verdicts: Verdicts for every page, in page order
+        drop_separators: Leave the blank pages out of the splits
+        code_prefix: Document codes are prefix + 001, 002, ...
+
+    Returns:
+        Proposed splits; empty when every page is blank
+    """
+    documents = _content_runs(verdicts)
+    if not drop_separators and documents:
+        total_pages = len(verdicts)
+        starts = [1] + [_separator_start(verdicts, start) for start, _ in documents[1:]]
+        ends = [start - 1 for start in starts[1:]] + [total_pages]
+        documents = list(zip(starts, ends))
+    return [SplitRequest(start, end, f"{code_prefix}{i:03d}")
+            for i, (start, end) in enumerate(documents, 1)]
+
+
+def _content_runs(verdicts: Sequence[PageVerdict]) -> List[Tuple[int, int]]:
+    """(start, end) runs of non-blank pages."""
+    runs: List[Tuple[int, int]] = []
+    for verdict in verdicts:
+        if verdict.blank:
+            continue
+        if runs and runs[-1][1] == verdict.page - 1:
+            runs[-1] = (runs[-1][0], verdict.page)
+        else:
+            runs.append((verdict.page, verdict.page))
+    return runs
+
+
+def _separator_start(verdicts: Sequence[PageVerdict], document_start: int) -> int:
+    """First page of the blank run right before document_start."""
+    page = document_start
+    while page > 1 and verdicts[page - 2].blank:
+        page -= 1
+    return page
@@ -0,0 +1,64 @@
+"""Copy-fidelity profiles: which page extras insert_pdf carries over.
+
+Links, annotations and form widgets are copied (and link targets
+resolved) by default. High-volume splits of scanned documents rarely need
+them, and skipping them avoids most of the per-page graft work on heavily
+annotated files. Like save_profiles, this module only imports PyMuPDF when
+it is actually needed.
+"""
+
+import inspect
+from functools import lru_cache
+from typing import Any, Dict
+
+
+# Options passed to fitz.Document.insert_pdf for each profile
+FIDELITY_PROFILES: Dict[str, Dict[str, Any]] = {
+    'full': {},
+    # Drop link annotations and their target resolution
+    'no-links': {'links': False},
+    # Drop annotations and form widgets, keep links
+    'no-annots': {'annots': False, 'widgets': False},
+    # Page content only
+    'bare': {'links': False, 'annots': False, 'widgets': False},
+}
+
+FIDELITY_PROFILE_LABELS = {
+    'full': "Full (links, annotations, forms)",
+    'no-links': "No links",
+    'no-annots': "No annotations or forms",
+    'bare': "Bare pages",
+}
+
+DEFAULT_FIDELITY = 'full'
+
+
+def get_copy_options(profile: str) -> Dict[str, Any]:
+    """Get the insert_pdf options for a fidelity profile.
+
+    Options this PyMuPDF build does not know (widgets only became a
+    separate switch in later releases) are dropped.
+
+    Args:
+        profile: One of FIDELITY_PROFILES
+
+    Returns:
+        Keyword arguments for fitz.Document.insert_pdf
+    """
+    if profile not in FIDELITY_PROFILES:
+        raise ValueError(
+            f"Unknown fidelity profile '{profile}'. "
+            f"Choose from: {', '.join(FIDELITY_PROFILES)}"
+        )
+    supported = _supported_copy_options()
+    return {key: value for key, value in FIDELITY_PROFILES[profile].items() if key in supported}
+
+
+@lru_cache(maxsize=1)
+def _supported_copy_options() -> frozenset:
+    """Names of the keyword arguments fitz.Document.insert_pdf accepts."""
+    import fitz
+    try:
+        return frozenset(inspect.signature(fitz.Document.insert_pdf).parameters)
+    except (TypeError, ValueError):
+        return frozenset(('links', 'annots'))
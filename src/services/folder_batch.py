@@ -0,0 +1,329 @@
+"""Split every PDF in a folder with one rule.
+
+Intake lists the folder, then validates every file and reads its page
+count, in worker processes for larger folders. Each valid file gets a
+split plan from the rule (a cover and the body, or every N pages), and
+the plans run through a bounded job queue: at most max_pending files are
+handed to the pool at once and the next one is queued only when one
+finishes, so a folder of thousands of files never has thousands of
+pending jobs. The outcome is one consolidated report with per-file
+timings and failures.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.models.page_selection import chunk_runs
+from src.services.fidelity_profiles import DEFAULT_FIDELITY
+from src.services.metadata_cache import get_metadata_cache
+from src.services.output_names import part_code
+from src.services.parallel_split import resolve_worker_count
+from src.services.pdf_prevalidator import INVALID, prevalidate_pdf
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE
+from src.services.source_staging import DEFAULT_STAGING
+
+
+RULE_KINDS = ('cover', 'every')
+INLINE_FILE_LIMIT = 8         # Smaller folders are taken in without worker processes
+
+# File statuses in the report
+SPLIT = 'split'
+FAILED = 'failed'
+INVALID_FILE = 'invalid'
+
+
+@dataclass(frozen=True)
+class SplitRule:
+    """How each file of a folder is split.
+
+    'cover' makes the first `pages` pages one document and the rest
+    another; 'every' cuts the file into documents of `pages` pages.
+    """
+    kind: str = 'cover'
+    pages: int = 1
+    cover_code: str = 'COVER'
+    body_code: str = 'BODY'
+    document_code: str = ''
+
+    def __post_init__(self):
+        if self.kind not in RULE_KINDS:
+            raise ValueError(f"Unknown rule '{self.kind}'. Choose from: {', '.join(RULE_KINDS)}")
+        if self.pages < 1:
+            raise ValueError("Rule pages must be at least 1")
+
+    def plan(self, page_count: int) -> List[Dict[str, Any]]:
+        """Split requests (start_page, end_page, document_code) for a file."""
+        if self.kind == 'cover':
+            cover_end = min(self.pages, page_count)
+            plan = [{'start_page': 1, 'end_page': cover_end, 'document_code': self.cover_code}]
+            if page_count > cover_end:
+                plan.append({'start_page': cover_end + 1, 'end_page': page_count,
+                             'document_code': self.body_code})
+            return plan
+        runs = list(chunk_runs(page_count, self.pages))
+        width = max(2, len(str(len(runs))))
+        return [{'start_page': start, 'end_page': end,
+                 'document_code': part_code(self.document_code, number, width)}
+                for number, (start, end) in enumerate(runs, 1)]
+
+
+@dataclass(frozen=True)
+class FileIntake:
+    """Validation outcome and page count of one file."""
+    path: str
+    page_count: int = 0
+    error: str = ''
+    seconds: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return not self.error
+
+
+def find_pdfs(folder: str, recursive: bool = False) -> List[str]:
+    """PDF files in a folder, sorted by path.
+
+    Raises:
+        NotADirectoryError: If folder is not a directory
+    """
+    root = Path(folder.strip().strip('"').strip("'"))
+    if not root.is_dir():
+        raise NotADirectoryError(f"Folder not found: {folder}")
+    entries = root.rglob('*') if recursive else root.iterdir()
+    return sorted(str(path) for path in entries
+                  if path.suffix.lower() == '.pdf' and path.is_file())
+
+
+def intake_file(path: str) -> FileIntake:
+    """Validate one file and read its page count."""
+    started = time.perf_counter()
+    error, page_count = '', 0
+    check = prevalidate_pdf(path)
+    if check.verdict == INVALID:
+        error = f"Not a valid PDF: {check.reason}"
+    else:
+        try:
+            metadata = get_metadata_cache().get(path)
+            page_count = metadata.page_count
+            if metadata.needs_pass:
+                error = "PDF is password protected"
+            elif not page_count:
+                error = "PDF has no pages"
+        except (OSError, ValueError) as e:
+            error = str(e)
+    return FileIntake(path, page_count, error, round(time.perf_counter() - started, 6))
+
+
+def intake_files(paths: List[str], workers: int = 0) -> List[FileIntake]:
+    """Validate and count the pages of every file, in worker processes if many."""
+    workers = resolve_worker_count(workers, len(paths))
+    if len(paths) <= INLINE_FILE_LIMIT or workers == 1:
+        return [intake_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(intake_file, paths,
+                             chunksize=max(1, len(paths) // (workers * 4))))
+
+
+def run_bounded(func: Callable[..., Any], jobs: Iterable[Tuple], workers: int = 0,
+                max_pending: int = 0,
+                on_crash: Optional[Callable[[Tuple, str], Any]] = None
+                ) -> Iterator[Tuple[Tuple, Any]]:
+    """Run func(*job) in worker processes, yielding (job, result) as jobs finish.
+
+    At most max_pending jobs (default: two per worker) are submitted at
+    once; jobs is only consumed as slots free up, so it may be a generator
+    that blocks or grows while the queue drains. If a worker process dies,
+    the jobs the pool held are retried one at a time, those that crash
+    again get on_crash(job, error) as their result, and a new pool takes
+    the rest. func must be importable by name.
+    """
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    if workers == 1:
+        for job in jobs:
+            yield job, func(*job)
+        return
+    max_pending = max_pending or workers * 2
+    pending_jobs = iter(jobs)
+    exhausted = False
+    while not exhausted:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight: Dict[Any, Tuple] = {}
+            while True:
+                while not exhausted and len(in_flight) < max_pending:
+                    job = next(pending_jobs, None)
+                    if job is None:
+                        exhausted = True
+                    else:
+                        in_flight[pool.submit(func, *job)] = job
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                crashed = []
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        crashed.append(job)
+                        continue
+                    yield job, result
+                if crashed:
+                    # The pool is gone: retry every job it held on its own
+                    for job in crashed + list(in_flight.values()):
+                        yield job, _run_isolated(func, job, on_crash)
+                    break
+
+
+def _run_isolated(func: Callable[..., Any], job: Tuple,
+                  on_crash: Optional[Callable[[Tuple, str], Any]]) -> Any:
+    """Run one job in a fresh single-worker pool."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(func, *job).result()
+        except BrokenProcessPool:
+            return on_crash(job, "Worker process crashed") if on_crash else None
+
+
+def split_file(path: str, requests: List[Dict[str, Any]], save_profile: str,
+               fidelity: str, staging: str) -> Dict[str, Any]:
+    """Run one file's split plan; returns its results and split seconds."""
+    from src.services.pdf_service import PDFService
+
+    started = time.perf_counter()
+    results = PDFService.batch_split_pdf(path, requests, workers=1, save_profile=save_profile,
+                                         fidelity=fidelity, staging=staging)
+    return {'results': results, 'seconds': round(time.perf_counter() - started, 6)}
+
+
+def process_file(path: str, rule: SplitRule, output_folder: str,
+                 save_profile: str = DEFAULT_SAVE_PROFILE,
+                 fidelity: str = DEFAULT_FIDELITY,
+                 staging: str = DEFAULT_STAGING) -> Dict[str, Any]:
+    """Take in, plan and split one file in this process; returns its report entry."""
+    intake = intake_file(path)
+    entry = _file_entry(intake)
+    if intake.valid:
+        _record_results(entry, split_file(path, _file_requests(intake, rule, output_folder),
+                                          save_profile, fidelity, staging))
+    return entry
+
+
+def run_folder_batch(folder: str, rule: SplitRule, output_folder: str = "",
+                     workers: int = 0, max_pending: int = 0, recursive: bool = False,
+                     save_profile: str = DEFAULT_SAVE_PROFILE,
+                     fidelity: str = DEFAULT_FIDELITY,
+                     staging: str = DEFAULT_STAGING,
+                     on_file: Optional[Callable[[Dict[str, Any]], None]] = None
+                     ) -> Dict[str, Any]:
+    """Split every PDF in a folder with one rule.
+
+    Outputs are named after their source file, e.g. Scan01_COVER.pdf.
+
+    Args:
+        folder: Folder to scan
+        rule: Split rule applied to every file
+        output_folder: Folder for all outputs (default: Downloads)
+        workers: Worker processes for intake and splitting (0 = one per CPU)
+        max_pending: Files queued for the pool at once (default: two per worker)
+        recursive: Also scan subfolders
+        save_profile: Save profile (see save_profiles)
+        fidelity: Copy-fidelity profile (see fidelity_profiles)
+        staging: Source staging mode (see source_staging)
+        on_file: Called with each file's report entry as soon as it is final
+
+    Returns:
+        Report with 'files' (one entry per file, in path order) and 'summary'
+
+    Raises:
+        NotADirectoryError: If folder is not a directory
+    """
+    started = time.perf_counter()
+    paths = find_pdfs(folder, recursive)
+    intakes = intake_files(paths, workers)
+    intake_seconds = time.perf_counter() - started
+
+    entries = {intake.path: _file_entry(intake) for intake in intakes}
+    for intake in intakes:
+        if not intake.valid and on_file:
+            on_file(entries[intake.path])
+    jobs = (
+        (intake.path, _file_requests(intake, rule, output_folder), save_profile, fidelity, staging)
+        for intake in intakes if intake.valid
+    )
+    for job, outcome in run_bounded(split_file, jobs, workers, max_pending, _crashed_file):
+        entry = entries[job[0]]
+        _record_results(entry, outcome)
+        if on_file:
+            on_file(entry)
+
+    files = [entries[path] for path in paths]
+    return {
+        'folder': str(Path(folder).resolve()),
+        'rule': asdict(rule),
+        'files': files,
+        'summary': _summary(files, intake_seconds, time.perf_counter() - started),
+    }
+
+
+def write_report(report: Dict[str, Any], report_path: str) -> None:
+    """Save a folder batch report as JSON."""
+    with open(report_path, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+
+
+def _file_requests(intake: FileIntake, rule: SplitRule,
+                   output_folder: str) -> List[Dict[str, Any]]:
+    stem = Path(intake.path).stem
+    return [{**request, 'client_name': stem, 'output_folder': output_folder}
+            for request in rule.plan(intake.page_count)]
+
+
+def _file_entry(intake: FileIntake) -> Dict[str, Any]:
+    return {
+        'path': intake.path,
+        'pages': intake.page_count,
+        'status': SPLIT if intake.valid else INVALID_FILE,
+        'intake_seconds': intake.seconds,
+        'split_seconds': 0.0,
+        'outputs': [],
+        'errors': [] if intake.valid else [intake.error],
+    }
+
+
+def _record_results(entry: Dict[str, Any], outcome: Dict[str, Any]) -> None:
+    entry['split_seconds'] = outcome['seconds']
+    for result in outcome['results']:
+        if result.get('success'):
+            entry['outputs'].append(result['output_path'])
+        else:
+            entry['errors'].append(result['error'])
+    if entry['errors']:
+        entry['status'] = FAILED
+
+
+def _crashed_file(job: Tuple, error: str) -> Dict[str, Any]:
+    return {'results': [{'success': False, 'error': error}], 'seconds': 0.0}
+
+
+def _summary(files: List[Dict[str, Any]], intake_seconds: float,
+             total_seconds: float) -> Dict[str, Any]:
+    def count(status: str) -> int:
+        return sum(1 for entry in files if entry['status'] == status)
+
+    return {
+        'files': len(files),
+        'split': count(SPLIT),
+        'failed': count(FAILED),
+        'invalid': count(INVALID_FILE),
+        'outputs': sum(len(entry['outputs']) for entry in files),
+        'pages': sum(entry['pages'] for entry in files),
+        'intake_seconds': round(intake_seconds, 6),
+        'split_seconds': round(sum(entry['split_seconds'] for entry in files), 6),
+        'total_seconds': round(total_seconds, 6),
+    }
@@ -0,0 +1,533 @@
+"""Hot-folder watcher that splits PDFs as they arrive in an inbox.
+
+New files are noticed through inotify on Linux and by polling elsewhere,
+or on network shares, whose remote writes inotify never sees. A file is
+taken only once it has stopped changing for settle_seconds and its
+trailer is complete. It is then split in a worker process according to
+the inbox's rule file (split_rule.json) and moved to processed/ or
+failed/ inside the inbox.
+
+Memory stays bounded during a burst: at most max_pending files are in the
+worker pool, and at most max_queued are tracked in total. Beyond that
+new arrivals are left on disk untracked and picked up by a rescan once
+the backlog has drained.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from src.services.fidelity_profiles import DEFAULT_FIDELITY, FIDELITY_PROFILES
+from src.services.folder_batch import FAILED, SPLIT, SplitRule, find_pdfs, process_file
+from src.services.output_names import OutputNameIndex
+from src.services.pdf_prevalidator import INCONCLUSIVE, prevalidate_pdf
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE, SAVE_PROFILES
+from src.services.source_staging import DEFAULT_STAGING, STAGING_MODES, is_network_path
+
+
+RULE_FILE = 'split_rule.json'
+PROCESSED_FOLDER = 'processed'
+FAILED_FOLDER = 'failed'
+WATCH_MODES = ('auto', 'inotify', 'poll')
+
+DEFAULT_SETTLE_SECONDS = 2.0        # Unchanged this long before a file is taken
+DEFAULT_INCOMPLETE_SECONDS = 60.0   # Taken anyway if its trailer is still missing
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_MAX_QUEUED = 200            # Files tracked at once, waiting or in the pool
+RESCAN_SECONDS = 30.0               # Full rescan interval, a safety net for missed events
+MAX_ATTEMPTS = 2                    # Runs of a file whose worker process crashed
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+@dataclass(frozen=True)
+class FolderConfig:
+    """How files arriving in one inbox are split, from its rule file."""
+    rule: SplitRule = field(default_factory=SplitRule)
+    output_folder: str = ''
+    save_profile: str = DEFAULT_SAVE_PROFILE
+    fidelity: str = DEFAULT_FIDELITY
+    staging: str = DEFAULT_STAGING
+
+
+def load_folder_config(inbox: str, defaults: FolderConfig) -> FolderConfig:
+    """Read inbox/split_rule.json over the defaults.
+
+    The file is a JSON object with any of: rule ("cover" or "every"),
+    pages, cover_code, body_code, document_code, output_folder (relative
+    to the inbox), save_profile, fidelity and staging.
+
+    Raises:
+        ValueError: If the rule file is malformed
+    """
+    path = Path(inbox) / RULE_FILE
+    if not path.is_file():
+        return defaults
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Cannot read {path}: {e}")
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a JSON object")
+    rule_keys = {'rule': 'kind', 'pages': 'pages', 'cover_code': 'cover_code',
+                 'body_code': 'body_code', 'document_code': 'document_code'}
+    unknown = set(data) - set(rule_keys) - {'output_folder', 'save_profile', 'fidelity', 'staging'}
+    if unknown:
+        raise ValueError(f"Unknown keys in {path}: {', '.join(sorted(unknown))}")
+    try:
+        rule = replace(defaults.rule, **{rule_keys[key]: data[key]
+                                         for key in rule_keys if key in data})
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid rule in {path}: {e}")
+    config = FolderConfig(
+        rule=rule,
+        output_folder=str(Path(inbox) / data['output_folder']) if data.get('output_folder')
+        else defaults.output_folder,
+        save_profile=data.get('save_profile', defaults.save_profile),
+        fidelity=data.get('fidelity', defaults.fidelity),
+        staging=data.get('staging', defaults.staging),
+    )
+    if (config.save_profile not in SAVE_PROFILES or config.fidelity not in FIDELITY_PROFILES
+            or config.staging not in STAGING_MODES):
+        raise ValueError(f"Unknown save_profile, fidelity or staging in {path}")
+    return config
+
+
+class PollingWatcher:
+    """Reports PDFs in a folder that are new or changed since the last scan."""
+
+    def __init__(self, folder: str, interval: float = DEFAULT_POLL_SECONDS):
+        self.folder = folder
+        self.interval = interval
+        self._seen: Dict[str, Tuple[int, int]] = {}
+        self._next_scan = 0.0
+
+    def changes(self, timeout: float) -> Set[str]:
+        """Wait up to timeout for the next scan; return changed paths."""
+        delay = self._next_scan - time.monotonic()
+        if delay > 0:
+            time.sleep(min(delay, timeout))
+            if delay > timeout:
+                return set()
+        self._next_scan = time.monotonic() + self.interval
+        current = _stat_pdfs(self.folder)
+        changed = {path for path, stat in current.items() if self._seen.get(path) != stat}
+        self._seen = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Reports PDFs created, written or moved into a folder, via inotify(7)."""
+
+    def __init__(self, folder: str):
+        libc = _libc()
+        if libc is None:
+            raise OSError("inotify is not available")
+        self.folder = folder
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CREATE | _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO
+        if libc.inotify_add_watch(self._fd, os.fsencode(folder), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, f"Cannot watch {folder}")
+
+    @staticmethod
+    def available() -> bool:
+        return _libc() is not None
+
+    def changes(self, timeout: float) -> Set[str]:
+        """Wait up to timeout for events; return the PDFs they name."""
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        changed: Set[str] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped: report everything
+                return set(find_pdfs(self.folder))
+            if name.lower().endswith(b'.pdf'):
+                changed.add(os.path.join(self.folder, os.fsdecode(name)))
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def create_watcher(folder: str, mode: str = 'auto',
+                   poll_interval: float = DEFAULT_POLL_SECONDS):
+    """inotify for local folders where available, polling otherwise."""
+    if mode not in WATCH_MODES:
+        raise ValueError(f"Unknown watch mode '{mode}'. Choose from: {', '.join(WATCH_MODES)}")
+    if mode == 'inotify' or (mode == 'auto' and InotifyWatcher.available()
+                             and not is_network_path(folder)):
+        return InotifyWatcher(folder)
+    return PollingWatcher(folder, poll_interval)
+
+
+class StabilityTracker:
+    """Tracks arriving files until they have stopped changing."""
+
+    def __init__(self, settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+                 incomplete_seconds: float = DEFAULT_INCOMPLETE_SECONDS):
+        self.settle_seconds = settle_seconds
+        self.incomplete_seconds = incomplete_seconds
+        # path -> (size, mtime_ns, monotonic time of the last change)
+        self._files: Dict[str, Tuple[int, int, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._files
+
+    def observe(self, path: str) -> None:
+        """Start tracking a file, or note that it changed."""
+        self._update(path, time.monotonic())
+
+    def ready(self) -> List[str]:
+        """Stop tracking and return the files that are complete.
+
+        A file is complete when its size and mtime have not changed for
+        settle_seconds, it can be opened for reading, and it is not empty
+        or missing its trailer. One that still is after incomplete_seconds
+        is returned anyway, so the split can report it.
+        """
+        now = time.monotonic()
+        complete = []
+        for path in list(self._files):
+            changed_at = self._update(path, now)
+            if changed_at is None or now - changed_at < self.settle_seconds:
+                continue
+            if not _readable(path):
+                continue
+            if (now - changed_at < self.incomplete_seconds
+                    and (not self._files[path][0]
+                         or prevalidate_pdf(path).verdict == INCONCLUSIVE)):
+                continue
+            del self._files[path]
+            complete.append(path)
+        return complete
+
+    def _update(self, path: str, now: float) -> Optional[float]:
+        """Re-stat a file; returns when it last changed, None once it is gone."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._files.pop(path, None)
+            return None
+        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        known = self._files.get(path)
+        if known and known[:2] == (size, mtime_ns):
+            return known[2]
+        self._files[path] = (size, mtime_ns, now)
+        return now
+
+
+class HotFolderService:
+    """Watches inboxes and splits every PDF that arrives in them."""
+
+    def __init__(self, folders: List[str], defaults: FolderConfig, workers: int = 0,
+                 max_pending: int = 0, max_queued: int = DEFAULT_MAX_QUEUED,
+                 settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+                 incomplete_seconds: float = DEFAULT_INCOMPLETE_SECONDS,
+                 watch_mode: str = 'auto', poll_interval: float = DEFAULT_POLL_SECONDS,
+                 on_event: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """Initialize the service without starting to watch.
+
+        Args:
+            folders: Inbox folders; each may hold its own split_rule.json
+            defaults: Rule and output settings for inboxes without a rule file
+            workers: Worker processes (0 = one per CPU)
+            max_pending: Files in the worker pool at once (default: two per worker)
+            max_queued: Files tracked at once, waiting or in the pool
+            settle_seconds: How long a file must stay unchanged
+            incomplete_seconds: How long to wait for a missing trailer
+            watch_mode: "auto", "inotify" or "poll"
+            poll_interval: Seconds between scans when polling
+            on_event: Called with one dict per event (watching, queued,
+                file, backpressure, error)
+        """
+        self.folders = [str(Path(folder).resolve()) for folder in folders]
+        for folder in self.folders:
+            if not Path(folder).is_dir():
+                raise NotADirectoryError(f"Folder not found: {folder}")
+        self._check_output_folder(defaults)
+        self.defaults = defaults
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.max_pending = max_pending or self.workers * 2
+        self.max_queued = max(max_queued, self.max_pending)
+        self.watch_mode = watch_mode
+        self.poll_interval = poll_interval
+        self.on_event = on_event or (lambda event: None)
+        self.tracker = StabilityTracker(settle_seconds, incomplete_seconds)
+        self.counts = {SPLIT: 0, FAILED: 0, 'invalid': 0}
+        self._stop = threading.Event()
+        self._ready: Deque[str] = deque()
+        self._in_flight: Dict[Any, str] = {}
+        self._attempts: Dict[str, int] = {}
+        self._configs: Dict[str, Tuple[Optional[int], Optional[FolderConfig]]] = {}
+        self._archives: Dict[str, OutputNameIndex] = {}
+        self._finished: Set[str] = set()   # Split, but the source could not be moved
+        self._parked: Set[str] = set()     # Waiting for a broken rule file to be fixed
+        self._overflowed = False   # Arrivals were left on disk since the last rescan
+        self._throttled = False    # Backpressure reported and not yet relieved
+
+    def stop(self) -> None:
+        """Ask run() to return after the files in the pool are finished."""
+        self._stop.set()
+
+    def run(self, until_idle: bool = False) -> Dict[str, int]:
+        """Watch and split until stop() is called.
+
+        Args:
+            until_idle: Return once the inboxes are empty and nothing is
+                pending, e.g. to drain an inbox from a scheduled job
+
+        Returns:
+            Counts of files split, failed and invalid
+        """
+        watchers = [create_watcher(folder, self.watch_mode, self.poll_interval)
+                    for folder in self.folders]
+        for folder, watcher in zip(self.folders, watchers):
+            self.on_event({'event': 'watching', 'folder': folder,
+                           'mode': type(watcher).__name__})
+        tick = min(0.5, self.poll_interval) / len(watchers)
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        next_rescan = 0.0
+        try:
+            while not self._stop.is_set():
+                if time.monotonic() >= next_rescan or self._drained():
+                    self._rescan()
+                    next_rescan = time.monotonic() + RESCAN_SECONDS
+                # While workers are busy, wait on them rather than on the folders
+                wait_seconds = 0 if self._in_flight else tick
+                for watcher in watchers:
+                    for path in watcher.changes(wait_seconds):
+                        self._admit(path)
+                self._ready.extend(self.tracker.ready())
+                pool = self._submit(pool)
+                pool = self._collect(pool, timeout=tick)
+                if until_idle and self._idle():
+                    break
+            while self._in_flight:
+                pool = self._collect(pool, timeout=None)
+        finally:
+            pool.shutdown(wait=True)
+            for watcher in watchers:
+                watcher.close()
+        return dict(self.counts)
+
+    def _backlog(self) -> int:
+        return len(self.tracker) + len(self._ready) + len(self._in_flight)
+
+    def _full(self) -> bool:
+        return self._backlog() >= self.max_queued
+
+    def _drained(self) -> bool:
+        """Files were left on disk and the backlog has since halved."""
+        return self._overflowed and self._backlog() <= self.max_queued // 2
+
+    def _idle(self) -> bool:
+        if self._backlog():
+            return False
+        waiting = self._finished | self._parked
+        return all(path in waiting for folder in self.folders for path in find_pdfs(folder))
+
+    def _admit(self, path: str) -> None:
+        """Track an arriving file unless it is known or the backlog is full."""
+        if path in self._finished:
+            return
+        if path in self.tracker:
+            self.tracker.observe(path)
+            return
+        if path in self._ready or path in self._in_flight.values():
+            return
+        if self._full():
+            if not self._throttled:
+                self.on_event({'event': 'backpressure', 'backlog': self._backlog()})
+                self._throttled = True
+            # Left on disk; the rescan after the backlog drains finds it
+            self._overflowed = True
+            return
+        self.tracker.observe(path)
+
+    def _rescan(self) -> None:
+        self._overflowed = False
+        for folder in self.folders:
+            for path in find_pdfs(folder):
+                self._admit(path)
+        self._throttled = self._overflowed
+
+    def _submit(self, pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Hand ready files to the pool while it has room."""
+        while self._ready and len(self._in_flight) < self.max_pending:
+            path = self._ready.popleft()
+            config = self._config_for(str(Path(path).parent))
+            if config is None:
+                # Broken rule file: leave the file until the rule is fixed
+                self._parked.add(path)
+                continue
+            self._parked.discard(path)
+            self._attempts[path] = self._attempts.get(path, 0) + 1
+            self.on_event({'event': 'queued', 'path': path})
+            future = pool.submit(process_file, path, config.rule, config.output_folder,
+                                 config.save_profile, config.fidelity, config.staging)
+            self._in_flight[future] = path
+        return pool
+
+    def _collect(self, pool: ProcessPoolExecutor,
+                 timeout: Optional[float]) -> ProcessPoolExecutor:
+        """Report finished files; rebuild the pool if a worker died."""
+        if not self._in_flight:
+            return pool
+        done, _ = wait(self._in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+        crashed = False
+        for future in done:
+            path = self._in_flight.pop(future)
+            try:
+                entry = future.result()
+            except BrokenProcessPool:
+                crashed = True
+                if self._attempts[path] < MAX_ATTEMPTS:
+                    self._ready.appendleft(path)
+                    continue
+                entry = {'path': path, 'status': FAILED, 'outputs': [],
+                         'errors': ["Worker process crashed"]}
+            self._finish(entry)
+        if crashed:
+            for path in self._in_flight.values():
+                self._ready.appendleft(path)
+            self._in_flight.clear()
+            pool.shutdown(wait=False)
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+        return pool
+
+    def _finish(self, entry: Dict[str, Any]) -> None:
+        """Archive the source and report the file's outcome."""
+        path = entry['path']
+        self._attempts.pop(path, None)
+        self.counts[entry['status']] = self.counts.get(entry['status'], 0) + 1
+        archive = PROCESSED_FOLDER if entry['status'] == SPLIT else FAILED_FOLDER
+        try:
+            entry['archived_to'] = self._archive(path, archive)
+        except OSError as e:
+            self._finished.add(path)
+            entry['errors'].append(f"Cannot move source to {archive}/: {e}")
+        self.on_event({'event': 'file', **entry})
+
+    def _archive(self, path: str, archive: str) -> str:
+        """Move a source into a subfolder of its inbox without overwriting."""
+        folder = Path(path).parent / archive
+        key = str(folder)
+        if key not in self._archives:
+            folder.mkdir(exist_ok=True)
+            self._archives[key] = OutputNameIndex(folder)
+        target = self._archives[key].reserve(Path(path).name)
+        try:
+            os.replace(path, target)
+        except OSError:
+            self._archives[key].release(target)
+            raise
+        return str(target)
+
+    def _config_for(self, folder: str) -> Optional[FolderConfig]:
+        """The folder's config, re-read when its rule file changes."""
+        try:
+            version = (Path(folder) / RULE_FILE).stat().st_mtime_ns
+        except OSError:
+            version = None
+        cached = self._configs.get(folder)
+        if cached and cached[0] == version:
+            return cached[1]
+        config = None
+        try:
+            config = load_folder_config(folder, self.defaults)
+            self._check_output_folder(config)
+            if config.output_folder:
+                Path(config.output_folder).mkdir(parents=True, exist_ok=True)
+        except (OSError, ValueError) as e:
+            config = None
+            self.on_event({'event': 'error', 'folder': folder, 'error': str(e)})
+        self._configs[folder] = (version, config)
+        return config
+
+    def _check_output_folder(self, config: FolderConfig) -> None:
+        """Raise ValueError if config writes into a watched inbox.
+
+        Outputs written there would be picked up and split again, and
+        their outputs after them, without end.
+        """
+        output = (Path(config.output_folder) if config.output_folder
+                  else Path.home() / "Downloads").resolve()
+        if str(output) in self.folders:
+            raise ValueError(f"Output folder {output} is a watched inbox; "
+                             "outputs would be split again")
+
+
+def _stat_pdfs(folder: str) -> Dict[str, Tuple[int, int]]:
+    """(size, mtime_ns) of every PDF in a folder."""
+    stats = {}
+    for path in find_pdfs(folder):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        stats[path] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+def _readable(path: str) -> bool:
+    """False while another process holds the file locked (Windows)."""
+    try:
+        with open(path, 'rb'):
+            return True
+    except OSError:
+        return False
+
+
+_libc_handle: Any = False
+
+
+def _libc():
+    """The C library if it has inotify, else None."""
+    global _libc_handle
+    if _libc_handle is False:
+        _libc_handle = None
+        name = ctypes.util.find_library('c')
+        if name:
+            libc = ctypes.CDLL(name, use_errno=True)
+            if hasattr(libc, 'inotify_init1'):
+                _libc_handle = libc
+    return _libc_handle
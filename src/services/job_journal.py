@@ -0,0 +1,299 @@
+"""Resumable batch splits recorded in an append-only JSONL journal.
+
+A journaled batch first reserves every output name and records the
+reservations, then writes each split into its reserved path and records
+the finished file's size and SHA-256 as soon as it is known. If the
+process dies partway, resume_job() re-reads the journal, checks each
+recorded output against its size and checksum, and redoes only the
+missing or partial ones, into the same names. So an interrupted batch
+never leaves " (1)" duplicates behind.
+
+Each journal line is one JSON record:
+
+    {"event": "job", "input_path": ..., "fingerprint": ..., "staging": ..., "requests": [...]}
+    {"event": "reserved", "outputs": {"0": "/out/A_EXH1.pdf", ...}}
+    {"event": "output", "request_index": 0, "output_path": ..., "size_bytes": ..., "sha256": ...}
+    {"event": "failed", "request_index": 3, "error": ...}
+    {"event": "resumed", "verified": 120, "redo": 180}
+
+Lines are appended and flushed one at a time, so a crash can at most
+leave a torn last line, which is ignored on reading.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.services.fidelity_profiles import DEFAULT_FIDELITY
+from src.services.metadata_cache import cache_key, source_fingerprint
+from src.services.output_names import OutputNameIndex
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE
+from src.services.source_staging import DEFAULT_STAGING
+
+
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+class JournalError(Exception):
+    """Raised when a journal cannot be started or resumed."""
+
+
+@dataclass
+class JobState:
+    """Everything a journal records about one batch."""
+    input_path: str
+    fingerprint: str
+    staging: str
+    requests: List[Dict[str, Any]]
+    reserved: Dict[int, str] = field(default_factory=dict)
+    completed: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+
+class JobJournal:
+    """Appends records to a journal file, flushing and syncing each one."""
+
+    def __init__(self, journal_path: str):
+        self.path = Path(journal_path)
+        self._handle = open(self.path, 'a', encoding='utf-8')
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._handle.write(json.dumps(record) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> 'JobJournal':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_journal(journal_path: str) -> JobState:
+    """Replay a journal into the state of its batch.
+
+    Raises:
+        JournalError: If the file is missing or has no job record
+    """
+    state: Optional[JobState] = None
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as handle:
+            lines = handle.read().splitlines()
+    except OSError as e:
+        raise JournalError(f"Cannot read journal {journal_path}: {e}")
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue    # Torn line from a crash mid-write
+        event = record.get('event')
+        if event == 'job':
+            state = JobState(record['input_path'], record['fingerprint'],
+                             record.get('staging', DEFAULT_STAGING), record['requests'])
+        elif state is None:
+            continue
+        elif event == 'reserved':
+            state.reserved.update({int(index): path
+                                   for index, path in record['outputs'].items()})
+        elif event == 'output':
+            state.completed[record['request_index']] = record
+        elif event == 'failed':
+            state.completed.pop(record['request_index'], None)
+    if state is None:
+        raise JournalError(f"{journal_path} is not a job journal")
+    return state
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def verify_output(record: Dict[str, Any]) -> bool:
+    """True if a recorded output is on disk with its recorded size and checksum."""
+    try:
+        if os.path.getsize(record['output_path']) != record['size_bytes']:
+            return False
+        return file_digest(record['output_path']) == record['sha256']
+    except OSError:
+        return False
+
+
+def start_job(input_path: str, split_requests: List[Dict[str, Any]], journal_path: str,
+              workers: int = 1, save_profile: str = DEFAULT_SAVE_PROFILE,
+              fidelity: str = DEFAULT_FIDELITY, staging: str = DEFAULT_STAGING,
+              on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+              ) -> List[Dict[str, Any]]:
+    """Run batch_split_pdf with every output recorded in a new journal.
+
+    Args:
+        input_path: Source PDF path
+        split_requests: Split requests as for batch_split_pdf
+        journal_path: Journal file to create
+        workers: Worker processes (see batch_split_pdf)
+        save_profile: Save profile for requests that don't set their own
+        fidelity: Copy-fidelity profile for requests that don't set their own
+        staging: Source staging mode (see source_staging)
+        on_result: Called with each result as soon as it is known
+
+    Returns:
+        Results in request order
+
+    Raises:
+        JournalError: If the journal already exists or cannot be created,
+            the source is missing or an output name cannot be reserved
+    """
+    if Path(journal_path).exists() and Path(journal_path).stat().st_size:
+        raise JournalError(f"Journal {journal_path} already exists; resume it instead")
+    requests = [{'save_profile': save_profile, 'fidelity': fidelity, **request}
+                for request in split_requests]
+    state = JobState(input_path, _fingerprint(input_path), staging, requests)
+    # Reserve before the journal exists, so a bad output folder leaves no journal
+    state.reserved = _reserve_outputs(state, list(range(len(requests))))
+    try:
+        journal = JobJournal(journal_path)
+    except OSError as e:
+        _discard_placeholders(state.reserved.values())
+        raise JournalError(f"Cannot create journal {journal_path}: {e}")
+    with journal:
+        journal.append({'event': 'job', 'input_path': input_path,
+                        'fingerprint': state.fingerprint, 'staging': staging,
+                        'requests': requests})
+        journal.append({'event': 'reserved',
+                        'outputs': {str(index): path for index, path in state.reserved.items()}})
+        return _run(state, journal, list(range(len(requests))), workers, on_result)
+
+
+def resume_job(journal_path: str, workers: int = 1,
+               on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+               ) -> List[Dict[str, Any]]:
+    """Finish a journaled batch, redoing only outputs that don't verify.
+
+    Outputs whose file matches the recorded size and SHA-256 are reported
+    with 'resumed': True and not rewritten. The rest are written again
+    into the names reserved when the batch started.
+
+    Raises:
+        JournalError: If the journal is unreadable or the source has changed
+    """
+    state = read_journal(journal_path)
+    if _fingerprint(state.input_path) != state.fingerprint:
+        raise JournalError(f"{state.input_path} has changed since the batch started")
+    verified: Dict[int, Dict[str, Any]] = {}
+    for index, record in state.completed.items():
+        if verify_output(record):
+            verified[index] = {
+                'success': True,
+                'output_path': record['output_path'],
+                'request_index': index,
+                'resumed': True,
+                'message': f"Already complete: {Path(record['output_path']).name}",
+            }
+    redo = [index for index in range(len(state.requests)) if index not in verified]
+    for index in redo:
+        # A name whose file is gone may have been taken since; reserve it again
+        if not os.path.exists(state.reserved.get(index, '')):
+            state.reserved.pop(index, None)
+    with JobJournal(journal_path) as journal:
+        journal.append({'event': 'resumed', 'verified': len(verified), 'redo': len(redo)})
+        for result in verified.values():
+            if on_result:
+                on_result(result)
+        redone = _run(state, journal, redo, workers, on_result)
+    results = {**verified, **{result['request_index']: result for result in redone}}
+    return [results[index] for index in range(len(state.requests))]
+
+
+def _run(state: JobState, journal: JobJournal, indexes: List[int], workers: int,
+         on_result: Optional[Callable[[Dict[str, Any]], None]]) -> List[Dict[str, Any]]:
+    """Reserve missing names, then split the given requests, journaling each result."""
+    from src.services.pdf_service import PDFService
+
+    new_names = _reserve_outputs(state, [index for index in indexes
+                                         if index not in state.reserved])
+    if new_names:
+        state.reserved.update(new_names)
+        journal.append({'event': 'reserved',
+                        'outputs': {str(index): path for index, path in new_names.items()}})
+    jobs = [{**state.requests[index], 'output_path': state.reserved[index]}
+            for index in indexes]
+
+    def record(result: Dict[str, Any]) -> None:
+        # Results come back indexed by position in jobs
+        result['request_index'] = indexes[result['request_index']]
+        index = result['request_index']
+        if result.get('success'):
+            path = result['output_path']
+            result['size_bytes'] = os.path.getsize(path)
+            result['sha256'] = file_digest(path)
+            journal.append({'event': 'output', 'request_index': index, 'output_path': path,
+                            'size_bytes': result['size_bytes'], 'sha256': result['sha256']})
+        else:
+            _discard_placeholder(state.reserved[index])
+            journal.append({'event': 'failed', 'request_index': index,
+                            'error': result.get('error', '')})
+        if on_result:
+            on_result(result)
+
+    return PDFService.batch_split_pdf(state.input_path, jobs, workers=workers,
+                                      staging=state.staging, on_result=record)
+
+
+def _reserve_outputs(state: JobState, indexes: List[int]) -> Dict[int, str]:
+    """Reserve a unique output path for each request, as the split itself would.
+
+    Raises:
+        JournalError: If a name cannot be reserved (e.g. a missing output
+            folder); the names reserved so far are released again
+    """
+    from src.services.pdf_service import PDFService
+
+    names_by_folder: Dict[Path, OutputNameIndex] = {}
+    reserved: Dict[int, str] = {}
+    try:
+        for index in indexes:
+            request = state.requests[index]
+            output_dir = PDFService._prepare_output_directory(
+                request.get('output_folder', '')).resolve()
+            if output_dir not in names_by_folder:
+                names_by_folder[output_dir] = OutputNameIndex(output_dir)
+            filename = PDFService._build_output_filename(
+                request.get('client_name', ''), request['document_code'],
+                request.get('case_number', ''), request.get('output_name', '')
+            )
+            reserved[index] = str(names_by_folder[output_dir].reserve(filename))
+    except OSError as e:
+        _discard_placeholders(reserved.values())
+        raise JournalError(f"Cannot reserve output names: {e}")
+    return reserved
+
+
+def _discard_placeholders(paths: Iterable[str]) -> None:
+    for path in paths:
+        _discard_placeholder(path)
+
+
+def _discard_placeholder(path: str) -> None:
+    """Remove a reserved name's empty placeholder; a resume re-creates it."""
+    try:
+        if os.path.getsize(path) == 0:
+            os.remove(path)
+    except OSError:
+        pass
+
+
+def _fingerprint(input_path: str) -> str:
+    try:
+        path, size, _ = cache_key(input_path)
+        return source_fingerprint(path, size)
+    except OSError as e:
+        raise JournalError(str(e))
@@ -0,0 +1,230 @@
+"""PDF metadata cache keyed by resolved path, file size and mtime.
+
+Validating a file, showing its info and loading it in the GUI all need
+the page count, and each used to open the document again. The cache
+keeps an in-memory LRU of PDFMetadata. It can also persist entries in a
+SQLite file, so a document read once (e.g. from a slow share) is not
+parsed again until it changes on disk. The disk store is off by default
+because it records outline titles.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+
+@dataclass
+class PDFMetadata:
+    """Facts about a PDF that are expensive to read and rarely change."""
+    path: str
+    size: int
+    mtime_ns: int
+    page_count: int
+    fingerprint: str
+    # None until MetadataCache.page_sizes() reads them: loading every page
+    # object costs far more than the rest of the metadata on large files
+    page_sizes: Optional[List[Tuple[float, float]]] = None
+    outline: List[list] = field(default_factory=list)
+    is_encrypted: bool = False
+    needs_pass: bool = False
+    is_repaired: bool = False
+
+    @property
+    def cache_key(self) -> Tuple[str, int, int]:
+        """(resolved path, size, mtime_ns) this entry is valid for."""
+        return (self.path, self.size, self.mtime_ns)
+
+
+class MetadataCache:
+    """In-memory LRU of PDFMetadata with an optional SQLite store."""
+
+    def __init__(self, max_entries: int = 64, db_path: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in memory before the least recently
+                used is evicted
+            db_path: Optional SQLite file for a persistent store
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._entries: "OrderedDict[Tuple[str, int, int], PDFMetadata]" = OrderedDict()
+        self._lock = threading.RLock()
+        if db_path:
+            self._init_db()
+
+    def get(self, file_path: str) -> PDFMetadata:
+        """Get metadata for file_path, reading the PDF only on a cache miss.
+
+        The PDF is read without holding the lock, so a slow cold read
+        does not block callers asking for other files. Two threads
+        missing the same file at once both read it; the results are equal.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as a PDF
+        """
+        key = cache_key(file_path)
+        with self._lock:
+            metadata = self._entries.get(key) or self._db_get(key)
+            if metadata is not None:
+                self._remember(metadata)
+                return metadata
+        metadata = read_metadata(file_path, key)
+        with self._lock:
+            self._db_put(metadata)
+            self._remember(metadata)
+        return metadata
+
+    def page_sizes(self, file_path: str) -> List[Tuple[float, float]]:
+        """Get the (width, height) of every page, reading them on first use.
+
+        The sizes are kept on the cached entry (and in the disk store).
+        Like get(), the PDF is read without holding the lock.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as a PDF
+        """
+        metadata = self.get(file_path)
+        if metadata.page_sizes is None:
+            sizes = read_page_sizes(metadata.path)
+            with self._lock:
+                metadata.page_sizes = sizes
+                self._db_put(metadata)
+        return metadata.page_sizes
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk store is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, metadata: PDFMetadata) -> None:
+        """Insert or refresh an entry and evict beyond max_entries."""
+        self._entries[metadata.cache_key] = metadata
+        self._entries.move_to_end(metadata.cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS pdf_metadata ("
+                " path TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+                " data TEXT NOT NULL, PRIMARY KEY (path, size, mtime_ns))"
+            )
+
+    def _db_get(self, key: Tuple[str, int, int]) -> Optional[PDFMetadata]:
+        if not self.db_path:
+            return None
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT data FROM pdf_metadata WHERE path = ? AND size = ? AND mtime_ns = ?", key
+            ).fetchone()
+        return _from_json(row[0]) if row else None
+
+    def _db_put(self, metadata: PDFMetadata) -> None:
+        if not self.db_path:
+            return
+        with self._connect() as db:
+            # One row per path: older versions of the file are stale
+            db.execute("DELETE FROM pdf_metadata WHERE path = ?", (metadata.path,))
+            db.execute("INSERT INTO pdf_metadata VALUES (?, ?, ?, ?)",
+                       (*metadata.cache_key, json.dumps(asdict(metadata))))
+
+
+def cache_key(file_path: str) -> Tuple[str, int, int]:
+    """Build the (resolved path, size, mtime_ns) key for a file."""
+    path = Path(file_path.strip().strip('"').strip("'")).resolve()
+    if not path.is_file():
+        raise FileNotFoundError(f"PDF file not found: {file_path}")
+    stat = path.stat()
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def source_fingerprint(file_path: str, size: int) -> str:
+    """Fingerprint a file from its size and its first and last 64 KiB."""
+    digest = hashlib.sha256(str(size).encode())
+    with open(file_path, 'rb') as handle:
+        digest.update(handle.read(FINGERPRINT_SAMPLE_BYTES))
+        if size > FINGERPRINT_SAMPLE_BYTES:
+            handle.seek(max(FINGERPRINT_SAMPLE_BYTES, size - FINGERPRINT_SAMPLE_BYTES))
+            digest.update(handle.read(FINGERPRINT_SAMPLE_BYTES))
+    return digest.hexdigest()[:32]
+
+
+def read_metadata(file_path: str, key: Optional[Tuple[str, int, int]] = None) -> PDFMetadata:
+    """Open the PDF once and collect everything the cache stores but page sizes."""
+    import fitz
+
+    path, size, mtime_ns = key or cache_key(file_path)
+    try:
+        doc = fitz.open(path)
+    except Exception as e:
+        raise ValueError(f"Error reading PDF: {e}")
+    try:
+        # Pages and outline of a password-protected file can't be read yet
+        locked = bool(doc.needs_pass)
+        return PDFMetadata(
+            path=path, size=size, mtime_ns=mtime_ns,
+            page_count=len(doc),
+            fingerprint=source_fingerprint(path, size),
+            page_sizes=[] if locked else None,
+            outline=[] if locked else doc.get_toc(simple=True),
+            is_encrypted=bool(doc.is_encrypted),
+            needs_pass=locked,
+            is_repaired=bool(getattr(doc, 'is_repaired', False)),
+        )
+    finally:
+        doc.close()
+
+
+def read_page_sizes(file_path: str) -> List[Tuple[float, float]]:
+    """Open the PDF and read the (width, height) of every page."""
+    import fitz
+
+    try:
+        doc = fitz.open(file_path)
+    except Exception as e:
+        raise ValueError(f"Error reading PDF: {e}")
+    try:
+        if doc.needs_pass:
+            return []
+        return [(page.rect.width, page.rect.height) for page in doc]
+    finally:
+        doc.close()
+
+
+def _from_json(text: str) -> PDFMetadata:
+    data: Any = json.loads(text)
+    if data.get('page_sizes') is not None:
+        data['page_sizes'] = [tuple(size) for size in data['page_sizes']]
+    return PDFMetadata(**data)
+
+
+_default_cache = MetadataCache(db_path=os.environ.get('SPS_METADATA_DB') or None)
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get the process-wide metadata cache."""
+    return _default_cache
+
+
+def configure_metadata_cache(max_entries: int = 64, db_path: Optional[str] = None) -> MetadataCache:
+    """Replace the process-wide cache, e.g. to enable the SQLite store."""
+    global _default_cache
+    _default_cache = MetadataCache(max_entries=max_entries, db_path=db_path)
+    return _default_cache
@@ -0,0 +1,104 @@
+"""Turn a PDF outline (bookmarks) into page-range splits."""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+FRONT_MATTER_TITLE = "Front Matter"
+MAX_CODE_LENGTH = 60
+
+# Characters that are not allowed in Windows filenames, plus controls
+_INVALID_CODE_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+@dataclass(frozen=True)
+class OutlineSplit:
+    """One split derived from a bookmark."""
+    title: str
+    start_page: int
+    end_page: int
+    level: int
+    document_code: str
+
+    @property
+    def page_count(self) -> int:
+        return self.end_page - self.start_page + 1
+
+
+def outline_levels(toc: Sequence[Sequence]) -> Dict[int, int]:
+    """Count bookmarks per outline level, e.g. {1: 12, 2: 140}."""
+    return dict(sorted(Counter(entry[0] for entry in toc).items()))
+
+
+def outline_to_splits(toc: Sequence[Sequence], total_pages: int, level: int = 1,
+                      include_front_matter: bool = True) -> List[OutlineSplit]:
+    """Build one split per bookmark at or above level.
+
+    Each split runs from its bookmark's page to the page before the next
+    bookmark's page (the last one to the end of the document). Bookmarks
+    without a destination are skipped; when several land on the same page
+    the first in outline order names the split. Cost is O(n log n) in the
+    number of bookmarks.
+
+    Args:
+        toc: Outline as returned by fitz.Document.get_toc(simple=True):
+            [level, title, page] entries with 1-indexed pages
+        total_pages: Number of pages in the document
+        level: Deepest outline level that starts a new split
+        include_front_matter: Add a split for pages before the first bookmark
+
+    Returns:
+        Splits in page order
+    """
+    return splits_from_starts(
+        [(entry[2], str(entry[1]), entry[0]) for entry in toc if entry[0] <= level],
+        total_pages, include_front_matter
+    )
+
+
+def splits_from_starts(starts: Iterable[Tuple[int, str, int]], total_pages: int,
+                       include_front_matter: bool = True,
+                       fallback_prefix: str = "BM") -> List[OutlineSplit]:
+    """Build splits from (page, title, level) start points.
+
+    Each split runs to the page before the next start. Starts outside the
+    document are skipped, and the first title given for a page wins.
+
+    Args:
+        starts: Start points in any order
+        total_pages: Number of pages in the document
+        include_front_matter: Add a split for pages before the first start
+        fallback_prefix: Code prefix for titles with no usable characters
+
+    Returns:
+        Splits in page order
+    """
+    by_page: Dict[int, tuple] = {}
+    for page, title, level in starts:
+        if 1 <= page <= total_pages and page not in by_page:
+            by_page[page] = (title, level)
+    if not by_page:
+        return []
+    pages = sorted(by_page)
+    if include_front_matter and pages[0] > 1:
+        by_page[1] = (FRONT_MATTER_TITLE, 0)
+        pages.insert(0, 1)
+
+    splits = []
+    for i, start in enumerate(pages):
+        end = pages[i + 1] - 1 if i + 1 < len(pages) else total_pages
+        title, level = by_page[start]
+        splits.append(OutlineSplit(title, start, end, level,
+                                   document_code_from_title(title, i + 1, fallback_prefix)))
+    return splits
+
+
+def document_code_from_title(title: str, index: int, fallback_prefix: str = "BM") -> str:
+    """Make a filename-safe document code from a bookmark title."""
+    code = _INVALID_CODE_CHARS.sub(' ', title)
+    code = _WHITESPACE.sub(' ', code).strip(' .')[:MAX_CODE_LENGTH].rstrip(' .')
+    return code or f"{fallback_prefix}{index:03d}"
+
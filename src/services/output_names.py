@@ -0,0 +1,103 @@
+"""Unique output filename reservation for a batch of splits."""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Set
+
+
+# "Name (3).pdf" -> stem "Name", counter 3
+_COUNTER_PATTERN = re.compile(r'^(?P<stem>.*) \((?P<counter>\d+)\)$')
+
+
+def part_code(document_code: str, number: int, width: int = 2) -> str:
+    """Document code of a numbered part, e.g. EXH_Part03, or Part03 without a code."""
+    part = f"Part{number:0{width}d}"
+    return f"{document_code}_{part}" if document_code else part
+
+
+class OutputNameIndex:
+    """Reserves unique filenames in one output directory.
+
+    The directory is listed once. Names taken on disk or reserved earlier
+    in the batch are tracked in memory. The next " (N)" counter for each
+    base name is also kept, so a reservation doesn't probe the disk name
+    by name. Each reservation creates an empty placeholder with exclusive
+    create (O_EXCL). If another writer claims the same name first, the
+    create fails and the next counter is tried, so concurrent batches
+    never pick the same file.
+    """
+
+    def __init__(self, output_dir: Path):
+        """Scan the output directory once.
+
+        Args:
+            output_dir: Directory the outputs are written to
+        """
+        self.output_dir = Path(output_dir)
+        self._taken: Set[str] = set()
+        self._next_counter: Dict[str, int] = {}
+        self._scan()
+
+    def reserve(self, filename: str) -> Path:
+        """Reserve a unique path for filename, adding " (N)" if needed.
+
+        Args:
+            filename: Desired filename, e.g. "Client_EXH001.pdf"
+
+        Returns:
+            Path of a newly created, empty placeholder file
+        """
+        stem, extension = os.path.splitext(filename)
+        if self._try_create(filename):
+            return self.output_dir / filename
+        base_key = self._key(filename)
+        counter = self._next_counter.get(base_key, 1)
+        while True:
+            candidate = f"{stem} ({counter}){extension}"
+            counter += 1
+            if self._try_create(candidate):
+                self._next_counter[base_key] = counter
+                return self.output_dir / candidate
+
+    def release(self, path: Path) -> None:
+        """Remove a reserved placeholder that was never written."""
+        try:
+            if Path(path).stat().st_size == 0:
+                os.remove(path)
+        except OSError:
+            pass
+
+    def _scan(self) -> None:
+        """Record existing names and the highest counter per base name."""
+        try:
+            entries = list(os.scandir(self.output_dir))
+        except OSError:
+            return
+        for entry in entries:
+            self._taken.add(self._key(entry.name))
+            stem, extension = os.path.splitext(entry.name)
+            match = _COUNTER_PATTERN.match(stem)
+            if match:
+                base_key = self._key(match.group('stem') + extension)
+                counter = int(match.group('counter')) + 1
+                if counter > self._next_counter.get(base_key, 1):
+                    self._next_counter[base_key] = counter
+
+    def _try_create(self, filename: str) -> bool:
+        """Claim filename with an exclusive create; False if it is taken."""
+        key = self._key(filename)
+        if key in self._taken:
+            return False
+        self._taken.add(key)
+        try:
+            fd = os.open(self.output_dir / filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    @staticmethod
+    def _key(filename: str) -> str:
+        """Comparison key; case-insensitive where the filesystem is (Windows)."""
+        return os.path.normcase(filename)
@@ -0,0 +1,70 @@
+"""Low-resolution page rendering and an on-disk thumbnail tile cache.
+
+Thumbnails are rendered at a fixed pixel width, so a tile is identified
+by (document fingerprint, page, width). The tile cache is off unless a
+directory is configured (SPS_THUMBNAIL_CACHE), because it writes page
+images of the documents to disk.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import fitz
+
+
+THUMBNAIL_WIDTH = 96
+
+
+def render_page(doc: 'fitz.Document', page_number: int,
+                width: int = THUMBNAIL_WIDTH) -> 'fitz.Pixmap':
+    """Render a 1-indexed page as an RGB pixmap width pixels wide."""
+    import fitz
+
+    page = doc.load_page(page_number - 1)
+    zoom = width / page.rect.width if page.rect.width else 1.0
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+
+class TileCache:
+    """PNG thumbnails of one document stored under its fingerprint."""
+
+    def __init__(self, root: str, fingerprint: str):
+        """Initialize the cache directory for one document.
+
+        Args:
+            root: Directory holding the tiles of all documents
+            fingerprint: Source fingerprint from the metadata cache
+        """
+        self.directory = Path(root) / fingerprint
+
+    def path_for(self, page_number: int, width: int) -> Path:
+        """File a tile is stored in."""
+        return self.directory / f"p{page_number:05d}_w{width}.png"
+
+    def get(self, page_number: int, width: int) -> Optional[bytes]:
+        """PNG bytes of a cached tile, or None."""
+        try:
+            return self.path_for(page_number, width).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, page_number: int, width: int, png: bytes) -> None:
+        """Store a tile; failures are ignored since the cache is optional."""
+        import tempfile
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial tile
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(png)
+            os.replace(temp_path, self.path_for(page_number, width))
+        except OSError:
+            pass
+
+
+def default_tile_cache_root() -> Optional[str]:
+    """Tile cache directory from SPS_THUMBNAIL_CACHE, or None when disabled."""
+    return os.environ.get('SPS_THUMBNAIL_CACHE') or None
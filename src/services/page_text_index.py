@@ -0,0 +1,278 @@
+"""SQLite FTS5 index of page text, keyed by document fingerprint.
+
+Text is extracted once per document, in worker processes for large
+files, and stored per page as two columns: the header (text in the top
+part of the page) and the full page text. Pattern queries then run
+against the index, either as regular expressions through a REGEXP
+function or as FTS5 MATCH expressions, so trying another pattern on the
+same file does not extract anything again.
+
+The index lives in memory for the session unless SPS_TEXT_INDEX_DB (or
+the CLI's --index-db, through configure_page_text_index()) names a file;
+like the metadata store it stays off disk by default because it holds
+document text.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from src.services.metadata_cache import get_metadata_cache
+from src.services.parallel_split import map_page_ranges, resolve_worker_count
+
+if TYPE_CHECKING:
+    import fitz
+
+
+HEADER_FRACTION = 0.15        # Top share of the page that counts as the header
+INLINE_PAGE_LIMIT = 64        # Smaller documents are extracted in-process
+MAX_DOCUMENTS = 16            # Documents kept before the least recently used is dropped
+SCOPES = ('header', 'page')
+
+# Page rows of document n use rowids n * _ROWID_STRIDE + page, so one
+# document is a rowid range and needs no scan of the others
+_ROWID_STRIDE = 10_000_000
+# Marks the start of FTS hits in highlighted text
+_HIT = '\x02'
+
+
+@dataclass(frozen=True)
+class PageMatch:
+    """A page whose text matched a pattern."""
+    page: int
+    text: str
+
+
+class PageTextIndex:
+    """Page text of recently used documents in one SQLite FTS5 table."""
+
+    def __init__(self, db_path: Optional[str] = None, max_documents: int = MAX_DOCUMENTS):
+        """Initialize the index.
+
+        Args:
+            db_path: SQLite file to keep the index in; in memory when None
+            max_documents: Documents kept before the least recently used
+                is dropped
+        """
+        self.db_path = db_path
+        self.max_documents = max_documents
+        self._lock = threading.RLock()
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path or ':memory:', timeout=5, check_same_thread=False)
+        self._db.create_function('regexp', 2, _regexp, deterministic=True)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " fingerprint TEXT PRIMARY KEY, doc_id INTEGER UNIQUE NOT NULL,"
+                " page_count INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(header, page)"
+            )
+
+    def ensure_indexed(self, file_path: str, workers: int = 0) -> str:
+        """Index a PDF unless its fingerprint is already indexed.
+
+        Args:
+            file_path: Path to the PDF
+            workers: Extraction processes for large files (0 = one per CPU)
+
+        Returns:
+            The document fingerprint to query with
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file cannot be read as a PDF
+        """
+        metadata = get_metadata_cache().get(file_path)
+        if metadata.needs_pass:
+            raise ValueError("PDF is password protected")
+        with self._lock:
+            if self._touch(metadata.fingerprint):
+                return metadata.fingerprint
+        pages = extract_page_text(metadata.path, metadata.page_count, workers)
+        with self._lock:
+            if not self._touch(metadata.fingerprint):
+                self._store(metadata.fingerprint, pages)
+        return metadata.fingerprint
+
+    def is_indexed(self, fingerprint: str) -> bool:
+        """Check whether a document's text is in the index."""
+        with self._lock:
+            return self._doc_id(fingerprint) is not None
+
+    def search_regex(self, fingerprint: str, pattern: str, scope: str = 'header',
+                     ignore_case: bool = False) -> List[PageMatch]:
+        """Pages whose scope text matches a regular expression.
+
+        ^ and $ match at line breaks. The match text is the first group
+        when the pattern has groups, otherwise the whole match.
+
+        Raises:
+            re.error: If the pattern is invalid
+        """
+        expression = f"(?i){pattern}" if ignore_case else pattern
+        regex = _compile(expression)
+        rows = self._query(fingerprint, f"{_column(scope)} REGEXP ?", (expression,),
+                           _column(scope))
+        matches = []
+        for page, text in rows:
+            found = regex.search(text)
+            if found:
+                matched = found.group(1) if regex.groups and found.group(1) else found.group(0)
+                matches.append(PageMatch(page, matched))
+        return matches
+
+    def search_fts(self, fingerprint: str, query: str, scope: str = 'header') -> List[PageMatch]:
+        """Pages matching an FTS5 query such as 'EXHIBIT NEAR(A B)'.
+
+        The match text is the line holding the first hit.
+
+        Raises:
+            sqlite3.OperationalError: If the query syntax is invalid
+        """
+        column = _column(scope)
+        rows = self._query(
+            fingerprint, "page_text MATCH ?", (f"{{{column}}} : ({query})",),
+            f"highlight(page_text, {SCOPES.index(scope)}, '{_HIT}', '')"
+        )
+        return [PageMatch(page, _hit_line(text)) for page, text in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def _query(self, fingerprint: str, condition: str, params: Tuple,
+               text_expr: str) -> List[Tuple[int, str]]:
+        with self._lock:
+            doc_id = self._doc_id(fingerprint)
+            if doc_id is None:
+                raise KeyError(f"Document is not indexed: {fingerprint}")
+            first = doc_id * _ROWID_STRIDE
+            rows = self._db.execute(
+                f"SELECT rowid, {text_expr} FROM page_text"
+                f" WHERE rowid BETWEEN ? AND ? AND {condition} ORDER BY rowid",
+                (first, first + _ROWID_STRIDE - 1, *params)
+            ).fetchall()
+        return [(rowid - first, text) for rowid, text in rows]
+
+    def _doc_id(self, fingerprint: str) -> Optional[int]:
+        row = self._db.execute(
+            "SELECT doc_id FROM documents WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _touch(self, fingerprint: str) -> bool:
+        """Mark a document as used; False when it is not indexed."""
+        with self._db:
+            updated = self._db.execute(
+                "UPDATE documents SET last_used = ? WHERE fingerprint = ?",
+                (time.time(), fingerprint)
+            ).rowcount
+        return bool(updated)
+
+    def _store(self, fingerprint: str, pages: List[Tuple[str, str]]) -> None:
+        """Insert a document's pages and drop documents beyond max_documents."""
+        with self._db:
+            doc_id = self._db.execute(
+                "SELECT COALESCE(MAX(doc_id), 0) + 1 FROM documents"
+            ).fetchone()[0]
+            self._db.execute("INSERT INTO documents VALUES (?, ?, ?, ?)",
+                             (fingerprint, doc_id, len(pages), time.time()))
+            first = doc_id * _ROWID_STRIDE
+            self._db.executemany(
+                "INSERT INTO page_text (rowid, header, page) VALUES (?, ?, ?)",
+                ((first + number, header, text) for number, (header, text) in enumerate(pages, 1))
+            )
+            stale = self._db.execute(
+                "SELECT doc_id FROM documents ORDER BY last_used DESC LIMIT -1 OFFSET ?",
+                (self.max_documents,)
+            ).fetchall()
+            for (stale_id,) in stale:
+                self._db.execute("DELETE FROM page_text WHERE rowid BETWEEN ? AND ?",
+                                 (stale_id * _ROWID_STRIDE, (stale_id + 1) * _ROWID_STRIDE - 1))
+                self._db.execute("DELETE FROM documents WHERE doc_id = ?", (stale_id,))
+
+
+def extract_page_text(file_path: str, page_count: int, workers: int = 0) -> List[Tuple[str, str]]:
+    """(header, page text) for every page, in page order."""
+    if page_count <= INLINE_PAGE_LIMIT or resolve_worker_count(workers, page_count) == 1:
+        import fitz
+
+        with fitz.open(file_path) as doc:
+            return extract_range(doc, 1, page_count)
+    return map_page_ranges(file_path, page_count, extract_range, workers)
+
+
+def extract_range(doc: 'fitz.Document', start_page: int,
+                  end_page: int) -> List[Tuple[str, str]]:
+    """(header, page text) of pages start_page..end_page (1-indexed).
+
+    Blocks are taken in content-stream order; sorting text by position is
+    much slower and only the header needs it, which is ordered by top edge.
+    """
+    pages = []
+    for number in range(start_page, end_page + 1):
+        page = doc.load_page(number - 1)
+        header_bottom = page.rect.y0 + page.rect.height * HEADER_FRACTION
+        blocks = [block for block in page.get_text("blocks") if block[6] == 0]
+        header = sorted((block[1], block[0], block[4]) for block in blocks
+                        if block[1] < header_bottom)
+        pages.append(("\n".join(text.strip() for _, _, text in header),
+                      "\n".join(block[4].strip() for block in blocks)))
+    return pages
+
+
+def _hit_line(highlighted: str) -> str:
+    """The line of highlighted text holding the first hit, without markers."""
+    hit = max(highlighted.find(_HIT), 0)
+    start = highlighted.rfind('\n', 0, hit) + 1
+    end = highlighted.find('\n', hit)
+    return highlighted[start:end if end >= 0 else None].replace(_HIT, '')
+
+
+def _column(scope: str) -> str:
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown scope: {scope}")
+    return scope
+
+
+@lru_cache(maxsize=32)
+def _compile(pattern: str) -> 're.Pattern':
+    return re.compile(pattern, re.MULTILINE)
+
+
+def _regexp(pattern: str, text: Optional[str]) -> bool:
+    """SQLite REGEXP: SQL's "text REGEXP pattern" calls regexp(pattern, text)."""
+    return text is not None and _compile(pattern).search(text) is not None
+
+
+_default_index: Optional[PageTextIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_page_text_index() -> PageTextIndex:
+    """Get the process-wide index, created on first use."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = PageTextIndex(os.environ.get('SPS_TEXT_INDEX_DB') or None)
+        return _default_index
+
+
+def configure_page_text_index(db_path: Optional[str] = None) -> PageTextIndex:
+    """Replace the process-wide index, e.g. to keep it in a SQLite file."""
+    global _default_index
+    with _default_lock:
+        if _default_index is not None:
+            _default_index.close()
+        _default_index = PageTextIndex(db_path)
+        return _default_index
@@ -0,0 +1,222 @@
+"""Process-pool execution of batch splits and page scans against one source PDF."""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.services.source_staging import DEFAULT_STAGING, StagedSource, resolve_staging_mode
+from src.services.split_session import SplitSession
+from src.services.split_trace import merge_worker_trace, traced_call
+
+if TYPE_CHECKING:
+    import fitz
+
+
+# Runs one job against an open session: (session, job, index) -> result
+SplitFunc = Callable[[SplitSession, Dict[str, Any], int], Dict[str, Any]]
+# Builds the failure result for a job that never ran: (index, error) -> result
+FailureFunc = Callable[[int, str], Dict[str, Any]]
+Chunk = List[Tuple[int, Dict[str, Any]]]
+# Scans pages start..end (1-indexed, inclusive) of an open document
+PageRangeFunc = Callable[['fitz.Document', int, int], List[Any]]
+
+# Per-process state set up by the pool initializers
+_worker_session: Optional[SplitSession] = None
+_worker_error: Optional[str] = None
+_worker_doc: Optional['fitz.Document'] = None
+
+
+def resolve_worker_count(workers: int, job_count: int) -> int:
+    """Clamp the requested worker count; 0 means one worker per CPU."""
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, job_count))
+
+
+def run_parallel(input_path: str, jobs: List[Dict[str, Any]], split_func: SplitFunc,
+                 failure_func: FailureFunc, workers: int = 0,
+                 chunk_size: Optional[int] = None,
+                 staging: str = DEFAULT_STAGING,
+                 on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+                 ) -> List[Dict[str, Any]]:
+    """Run split jobs over a process pool and return results in job order.
+
+    The source is staged once, here: a file on a network share is copied
+    to a local temp file (memory staging becomes a copy too, since the
+    workers need a path), which is removed when the pool has exited. Every
+    worker process opens that copy directly, once, and then takes jobs in
+    chunks; results report this process's staging, not the workers'. If a worker dies, the pool is rebuilt and each unfinished
+    chunk is retried on its own, so one crashing chunk only fails its own
+    jobs. split_func and failure_func must be importable by name
+    (module-level or staticmethods) so they can be sent to the workers.
+
+    Args:
+        input_path: Source PDF path
+        jobs: Split job dictionaries passed to split_func
+        split_func: Function that runs one job against an open session
+        failure_func: Function that builds a failure result
+        workers: Number of worker processes (0 = one per CPU)
+        chunk_size: Jobs per task; defaults to about four chunks per worker
+        staging: Source staging mode, applied once for all workers
+        on_result: Called in this process with each result as its chunk
+            finishes, so callers can record progress before the batch ends
+
+    Returns:
+        One result per job, in the order of jobs
+    """
+    if not jobs:
+        return []
+    workers = resolve_worker_count(workers, len(jobs))
+    chunks = _make_chunks(jobs, chunk_size or math.ceil(len(jobs) / (workers * 4)))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    try:
+        source = StagedSource(input_path, _shared_staging_mode(input_path, staging)).stage()
+    except Exception as e:
+        for index in range(len(jobs)):
+            results[index] = failure_func(index, str(e))
+            if on_result:
+                on_result(results[index])
+        return results
+
+    report = _parent_staging_reporter(source, on_result or (lambda result: None))
+    local_path = source.local_path
+    try:
+        unfinished = _run_chunks(local_path, chunks, split_func, failure_func, workers,
+                                 results, report)
+        for chunk in unfinished:
+            if _run_chunks(local_path, [chunk], split_func, failure_func, 1, results, report):
+                for index, _ in chunk:
+                    results[index] = failure_func(index, "Worker process crashed")
+                    report(results[index])
+    finally:
+        source.close()
+    return results
+
+
+def _shared_staging_mode(input_path: str, staging: str) -> str:
+    """Staging mode for a source shared by worker processes: direct or copy."""
+    return 'direct' if resolve_staging_mode(input_path, staging) == 'direct' else 'copy'
+
+
+def _parent_staging_reporter(source: StagedSource, report: Callable[[Dict[str, Any]], None]
+                             ) -> Callable[[Dict[str, Any]], None]:
+    """Wrap report so results carry the parent's staging instead of the workers'.
+
+    The staging time goes on the first result with timings, as for a
+    batch run in one process, so the batch's results still sum to its totals.
+    """
+    pending = [source.seconds]
+
+    def staged_report(result: Dict[str, Any]) -> None:
+        timings = result.get('timings')
+        if timings is not None:
+            timings['staging_mode'] = source.mode
+            timings['staging_seconds'] = round(pending.pop(), 6) if pending else 0.0
+        report(result)
+    return staged_report
+
+
+def _make_chunks(jobs: List[Dict[str, Any]], chunk_size: int) -> List[Chunk]:
+    """Split jobs into index-tagged chunks of at most chunk_size."""
+    indexed = list(enumerate(jobs))
+    size = max(1, chunk_size)
+    return [indexed[i:i + size] for i in range(0, len(indexed), size)]
+
+
+def _run_chunks(input_path: str, chunks: List[Chunk], split_func: SplitFunc,
+                failure_func: FailureFunc, workers: int,
+                results: List[Optional[Dict[str, Any]]],
+                report: Callable[[Dict[str, Any]], None]) -> List[Chunk]:
+    """Run chunks in one pool, filling results. Returns chunks lost to a crash."""
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker_session,
+                             initargs=(input_path,)) as pool:
+        futures = {
+            pool.submit(_split_chunk, split_func, failure_func, chunk): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                chunk_results, trace = future.result()
+            except BrokenProcessPool:
+                unfinished.append(futures[future])
+                continue
+            merge_worker_trace(trace)
+            for index, result in chunk_results:
+                results[index] = result
+                report(result)
+    return unfinished
+
+
+def _open_worker_session(input_path: str) -> None:
+    """Pool initializer: open the already staged source once for this worker process."""
+    global _worker_session, _worker_error
+    try:
+        _worker_session = SplitSession(input_path, staging='direct').open()
+    except Exception as e:
+        _worker_error = str(e)
+
+
+def _split_chunk(split_func: SplitFunc, failure_func: FailureFunc,
+                 chunk: Chunk) -> Tuple[List[Tuple[int, Dict[str, Any]]], Any]:
+    """Run one chunk of jobs against this worker's session.
+
+    Returns the indexed results and the chunk's trace payload (None
+    unless tracing is on, see split_trace).
+    """
+    if _worker_session is None:
+        error = _worker_error or "Source PDF is not open"
+        return [(index, failure_func(index, error)) for index, _ in chunk], None
+    return traced_call(lambda: [(index, split_func(_worker_session, job, index))
+                                for index, job in chunk])
+
+
+def map_page_ranges(input_path: str, page_count: int, range_func: PageRangeFunc,
+                    workers: int = 0, chunk_size: Optional[int] = None) -> List[Any]:
+    """Run range_func over every page in worker processes, in page order.
+
+    Pages are cut into contiguous ranges; each worker opens the source
+    once and range_func(doc, start, end) returns one item per page.
+    range_func must be importable by name so it can be sent to the workers.
+
+    Args:
+        input_path: Source PDF path
+        page_count: Number of pages in the source
+        range_func: Function that scans one range of an open document
+        workers: Number of worker processes (0 = one per CPU)
+        chunk_size: Pages per task; defaults to about four chunks per worker
+
+    Returns:
+        The items of all ranges, concatenated in page order
+    """
+    if page_count <= 0:
+        return []
+    workers = resolve_worker_count(workers, page_count)
+    size = max(1, chunk_size or math.ceil(page_count / (workers * 4)))
+    ranges = [(start, min(start + size - 1, page_count))
+              for start in range(1, page_count + 1, size)]
+
+    results: Dict[int, List[Any]] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker_doc,
+                             initargs=(input_path,)) as pool:
+        futures = {pool.submit(_scan_range, range_func, start, end): start
+                   for start, end in ranges}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [item for start in sorted(results) for item in results[start]]
+
+
+def _open_worker_doc(input_path: str) -> None:
+    """Pool initializer: open the source document once for this worker."""
+    global _worker_doc
+    import fitz
+
+    _worker_doc = fitz.open(input_path)
+
+
+def _scan_range(range_func: PageRangeFunc, start_page: int, end_page: int) -> List[Any]:
+    """Run one page range against this worker's document."""
+    return range_func(_worker_doc, start_page, end_page)
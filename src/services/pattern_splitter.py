@@ -0,0 +1,77 @@
+"""Propose splits at pages whose text matches a pattern."""
+
+import re
+import sqlite3
+from typing import List, Optional, Sequence
+
+from src.services.metadata_cache import get_metadata_cache
+from src.services.outline_splitter import OutlineSplit, splits_from_starts
+from src.services.page_text_index import PageMatch, PageTextIndex, get_page_text_index
+
+
+PATTERN_MODES = ('regex', 'fts')
+
+
+def find_pattern_splits(file_path: str, pattern: str, mode: str = 'regex',
+                        scope: str = 'header', ignore_case: bool = False,
+                        merge_repeats: bool = True, include_front_matter: bool = True,
+                        workers: int = 0,
+                        index: Optional[PageTextIndex] = None) -> List[OutlineSplit]:
+    """Start a new document at every page whose text matches pattern.
+
+    The page text is indexed on first use and reused for later patterns
+    on the same file.
+
+    Args:
+        file_path: Path to the PDF
+        pattern: Regular expression, or FTS5 query when mode is 'fts'
+        mode: 'regex' or 'fts'
+        scope: 'header' (top of the page) or 'page' (all text)
+        ignore_case: Case-insensitive regex matching
+        merge_repeats: Don't start a new document when the matched text
+            equals the previous match, e.g. a header repeated on every page
+        include_front_matter: Add a split for pages before the first match
+        workers: Extraction processes when indexing (0 = one per CPU)
+        index: Index to use; defaults to the process-wide one
+
+    Returns:
+        Splits in page order, codes taken from the matched text
+
+    Raises:
+        ValueError: If the pattern or mode is invalid or the PDF can't be read
+        FileNotFoundError: If the file does not exist
+    """
+    if mode not in PATTERN_MODES:
+        raise ValueError(f"Unknown pattern mode: {mode}")
+    if mode == 'regex':
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern: {e}")
+
+    index = index or get_page_text_index()
+    fingerprint = index.ensure_indexed(file_path, workers)
+    try:
+        if mode == 'regex':
+            matches = index.search_regex(fingerprint, pattern, scope, ignore_case)
+        else:
+            matches = index.search_fts(fingerprint, pattern, scope)
+    except sqlite3.OperationalError as e:
+        raise ValueError(f"Invalid search query: {e}")
+    return matches_to_splits(matches, get_metadata_cache().get(file_path).page_count,
+                             merge_repeats, include_front_matter)
+
+
+def matches_to_splits(matches: Sequence[PageMatch], total_pages: int,
+                      merge_repeats: bool = True,
+                      include_front_matter: bool = True) -> List[OutlineSplit]:
+    """Turn page matches (in page order) into one split per match."""
+    starts = []
+    previous = None
+    for match in matches:
+        title = " ".join(match.text.split())
+        if merge_repeats and title == previous:
+            continue
+        starts.append((match.page, title, 1))
+        previous = title
+    return splits_from_starts(starts, total_pages, include_front_matter, fallback_prefix="DOC")
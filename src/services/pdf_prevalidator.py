@@ -0,0 +1,107 @@
+"""Structural PDF pre-validation that reads only the head and tail of a file.
+
+A full open parses the cross-reference table and page tree, which is
+slow for multi-GB scans and wasted on files that are plainly not PDFs.
+The pre-validator memory-maps the file and checks:
+
+- the %PDF- header in the first KiB,
+- startxref and %%EOF in the last few KiB,
+- that startxref points at an xref table or an xref stream object,
+- that the trailer (or xref stream dictionary) names a /Root, and
+  whether it has an /Encrypt entry.
+
+The verdict is "valid", "invalid" or "inconclusive". Inconclusive files
+(damaged trailers MuPDF may repair, encrypted files) need a full open.
+"""
+
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+
+HEAD_BYTES = 1024
+TAIL_BYTES = 4096
+XREF_OBJECT_BYTES = 4096
+
+VALID = 'valid'
+INVALID = 'invalid'
+INCONCLUSIVE = 'inconclusive'
+
+_HEADER = re.compile(rb'%PDF-(\d\.\d)')
+_STARTXREF = re.compile(rb'startxref\s+(\d+)\s+%%EOF', re.DOTALL)
+_XREF_OBJECT = re.compile(rb'\s*\d+\s+\d+\s+obj\b')
+_XREF_STREAM_TYPE = re.compile(rb'/Type\s*/XRef\b')
+
+
+@dataclass(frozen=True)
+class PrevalidationResult:
+    """Outcome of the fast structural check."""
+    verdict: str
+    reason: str
+    version: Optional[str] = None
+    encrypted: bool = False
+
+    @property
+    def conclusive(self) -> bool:
+        """True when no full open is needed to decide."""
+        return self.verdict != INCONCLUSIVE
+
+
+def prevalidate_pdf(file_path: Union[str, Path]) -> PrevalidationResult:
+    """Check a file's PDF structure from its first and last few KiB.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        PrevalidationResult with verdict valid, invalid or inconclusive
+    """
+    try:
+        with open(file_path, 'rb') as handle:
+            size = Path(file_path).stat().st_size
+            if size == 0:
+                return PrevalidationResult(INVALID, "file is empty")
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _check_structure(data, size)
+    except OSError as e:
+        return PrevalidationResult(INVALID, f"cannot read file: {e}")
+
+
+def _check_structure(data: mmap.mmap, size: int) -> PrevalidationResult:
+    """Run the header, trailer and xref checks on a mapped file."""
+    header = _HEADER.search(data[:HEAD_BYTES])
+    if not header:
+        return PrevalidationResult(INVALID, "missing %PDF- header")
+    version = header.group(1).decode()
+
+    tail = data[max(0, size - TAIL_BYTES):]
+    matches = list(_STARTXREF.finditer(tail))
+    if not matches:
+        return PrevalidationResult(INCONCLUSIVE, "missing startxref/%%EOF", version)
+    xref_offset = int(matches[-1].group(1))
+    if not 0 < xref_offset < size:
+        return PrevalidationResult(INCONCLUSIVE, "startxref points outside the file", version)
+
+    if data[xref_offset:xref_offset + 4] == b'xref':
+        # Classic table: the last trailer dictionary sits just before startxref
+        trailer_at = tail.rfind(b'trailer', 0, matches[-1].start())
+        if trailer_at < 0:
+            return PrevalidationResult(INCONCLUSIVE, "trailer not in the last "
+                                       f"{TAIL_BYTES} bytes", version)
+        dictionary = tail[trailer_at:matches[-1].start()]
+    else:
+        xref_object = data[xref_offset:xref_offset + XREF_OBJECT_BYTES]
+        if not _XREF_OBJECT.match(xref_object):
+            return PrevalidationResult(INCONCLUSIVE, "startxref does not point at an xref", version)
+        dictionary = xref_object.split(b'stream', 1)[0]
+        if not _XREF_STREAM_TYPE.search(dictionary):
+            return PrevalidationResult(INCONCLUSIVE, "startxref object is not an xref stream", version)
+
+    if b'/Root' not in dictionary:
+        return PrevalidationResult(INCONCLUSIVE, "trailer has no /Root", version)
+    if b'/Encrypt' in dictionary:
+        # Whether pages can be read depends on the password; let a full open decide
+        return PrevalidationResult(INCONCLUSIVE, "document is encrypted", version, encrypted=True)
+    return PrevalidationResult(VALID, "header, xref and trailer look sound", version)
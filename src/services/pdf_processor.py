@@ -1,9 +1,16 @@
 """Enterprise-compliant PDF processing service."""
 
+import time
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-import fitz  # PyMuPDF
 from datetime import datetime
+from src.models.page_selection import compile_selection, range_selection
+from src.services.split_session import SplitSession
+from src.services.parallel_split import run_parallel
+from src.services.fidelity_profiles import DEFAULT_FIDELITY
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE
+from src.services.source_staging import DEFAULT_STAGING
+from src.services.split_trace import span, trace_batch
 
 
 class PDFProcessor:
@@ -11,36 +18,70 @@ class PDFProcessor:
     
     @staticmethod
     def split_single(
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        session: Optional[SplitSession] = None
     ) -> Dict[str, Any]:
         """
         Split a single PDF section.
         
         Args:
             config: Split configuration
+            session: Open batch session for config['input_path']; a
+                temporary one is opened when omitted
             
         Returns:
-            Result dictionary with success status
+            Result dictionary with success status; once the source is
+            open it carries 'timings', including the seconds of each
+            phase (see split_trace)
         """
         validator = PDFValidator()
         generator = OutputNameGenerator()
         
-        # Validate input
-        validation = validator.validate_split_config(config)
-        if not validation['valid']:
-            return {'success': False, 'error': validation['error']}
+        # Validate input before opening, so a missing file is reported as such
+        if session is None:
+            validation = validator.validate_split_config(config)
+            if not validation['valid']:
+                return {'success': False, 'error': validation['error']}
+            try:
+                with SplitSession(config['input_path']) as single_session:
+                    return PDFProcessor.split_single(config, single_session)
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
         
+        started = time.perf_counter()
+        timings = session.timings
+        with span('split', document_code=config.get('document_code', '')):
+            with timings.phase('validate'):
+                validation = validator.validate_split_config(config)
+            if not validation['valid']:
+                result = {'success': False, 'error': validation['error']}
+            else:
+                result = PDFProcessor._run_split(session, config, generator)
+        result['timings'] = timings.for_result(time.perf_counter() - started)
+        return result
+    
+    @staticmethod
+    def _run_split(
+        session: SplitSession,
+        config: Dict[str, Any],
+        generator: 'OutputNameGenerator'
+    ) -> Dict[str, Any]:
+        """Name and write one validated split."""
         # Generate output name
-        output_name = generator.generate_name(config)
-        output_path = Path(config['output_folder']) / output_name
+        with session.timings.phase('names'):
+            output_name = generator.generate_name(config)
+            output_path = Path(config['output_folder']) / output_name
         
         # Execute split
         try:
             _execute_split(
-                config['input_path'],
+                session,
                 config['start_page'],
                 config['end_page'],
-                str(output_path)
+                str(output_path),
+                config.get('pages', ''),
+                config.get('save_profile', DEFAULT_SAVE_PROFILE),
+                config.get('fidelity', DEFAULT_FIDELITY)
             )
             return {
                 'success': True,
@@ -53,31 +94,88 @@ class PDFProcessor:
     @staticmethod
     def batch_split(
         input_path: str,
-        splits: List[Dict[str, Any]]
+        splits: List[Dict[str, Any]],
+        workers: int = 1,
+        save_profile: str = DEFAULT_SAVE_PROFILE,
+        fidelity: str = DEFAULT_FIDELITY,
+        staging: str = DEFAULT_STAGING
     ) -> List[Dict[str, Any]]:
         """
         Process multiple PDF splits.
         
+        The source is opened once and every split runs against that handle.
+        With workers other than 1 the splits run on a process pool where
+        each worker opens the source once.
+        
         Args:
             input_path: Source PDF path
             splits: List of split configurations
+            workers: Worker processes; 1 runs in-process, 0 uses one per CPU
+            save_profile: Save profile for splits without their own
+                'save_profile' ("fast", "compact" or "web")
+            fidelity: Copy-fidelity profile for splits without their own
+                'fidelity' ("full", "no-links", "no-annots" or "bare")
+            staging: Source staging mode ("auto", "direct", "memory" or
+                "copy"); results carry 'timings'
             
         Returns:
-            List of results for each split
+            List of results for each split, in input order
         """
+        with trace_batch(Path(input_path).stem):
+            return PDFProcessor._run_batch(input_path, splits, workers, save_profile,
+                                           fidelity, staging)
+    
+    @staticmethod
+    def _run_batch(
+        input_path: str,
+        splits: List[Dict[str, Any]],
+        workers: int,
+        save_profile: str,
+        fidelity: str,
+        staging: str
+    ) -> List[Dict[str, Any]]:
+        """Run a batch in-process or on a process pool (see batch_split)."""
         results = []
         output_folder = str(Path(input_path).parent)
+        configs = [
+            {'input_path': input_path, 'output_folder': output_folder,
+             'save_profile': save_profile, 'fidelity': fidelity, **split}
+            for split in splits
+        ]
         
-        for split in splits:
-            config = {
-                'input_path': input_path,
-                'output_folder': output_folder,
-                **split
-            }
-            result = PDFProcessor.split_single(config)
-            results.append(result)
+        if workers != 1 and len(configs) > 1:
+            return run_parallel(
+                input_path, configs, PDFProcessor._split_job,
+                PDFProcessor._failure_result, workers, staging=staging
+            )
+        
+        try:
+            session = SplitSession(input_path, staging=staging).open()
+        except Exception as e:
+            return [PDFProcessor._failure_result(i, str(e)) for i in range(len(configs))]
+        
+        try:
+            for config in configs:
+                result = PDFProcessor.split_single(config, session)
+                results.append(result)
+        finally:
+            session.close()
         
         return results
+    
+    @staticmethod
+    def _split_job(
+        session: SplitSession,
+        config: Dict[str, Any],
+        index: int
+    ) -> Dict[str, Any]:
+        """Run one batch split against an open session."""
+        return PDFProcessor.split_single(config, session)
+    
+    @staticmethod
+    def _failure_result(index: int, error: str) -> Dict[str, Any]:
+        """Build the result for a split that could not run."""
+        return {'success': False, 'error': error}
 
 
 class PDFValidator:
@@ -168,31 +266,33 @@ class OutputNameGenerator:
 
 
 def _execute_split(
-    input_path: str,
+    session: SplitSession,
     start_page: int,
     end_page: int,
-    output_path: str
+    output_path: str,
+    pages: str = "",
+    save_profile: str = DEFAULT_SAVE_PROFILE,
+    fidelity: str = DEFAULT_FIDELITY
 ) -> None:
     """
     Execute the actual PDF split operation.
     
+    Pages are compiled into contiguous runs and each run is copied with a
+    single insert_pdf call instead of one call per page.
+    
     Args:
-        input_path: Source PDF
+        session: Open session holding the source PDF
         start_page: First page (1-indexed)
-        end_page: Last page (1-indexed)
+        end_page: Last page (1-indexed), clamped to the document
         output_path: Destination path
+        pages: Optional page selection expression overriding the range
+        save_profile: Named save profile for the output
+        fidelity: Copy-fidelity profile (links/annotations/widgets)
     """
-    with fitz.open(input_path) as pdf_input:
-        pdf_output = fitz.open()
-        
-        # Convert to 0-indexed for PyMuPDF
-        for page_num in range(start_page - 1, end_page):
-            if page_num < len(pdf_input):
-                pdf_output.insert_pdf(
-                    pdf_input,
-                    from_page=page_num,
-                    to_page=page_num
-                )
-        
-        pdf_output.save(output_path)
-        pdf_output.close()
\ No newline at end of file
+    with session.timings.phase('validate'):
+        if pages and pages.strip():
+            selection = compile_selection(pages, session.page_count)
+        else:
+            selection = range_selection(start_page, end_page, session.page_count)
+    
+    session.write_selection(selection, output_path, save_profile, fidelity)
\ No newline at end of file
@@ -1,22 +1,55 @@
 import fitz  # PyMuPDF
 import os
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterator, Optional
+from src.models.page_selection import PageSelection, chunk_runs
+from src.services.split_session import SplitSession
+from src.services.output_names import OutputNameIndex, part_code
+from src.services.parallel_split import run_parallel
+from src.services.fidelity_profiles import DEFAULT_FIDELITY
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE, save_document
+from src.services.source_staging import DEFAULT_STAGING
+from src.services.split_trace import span, trace_batch
+from src.services.metadata_cache import get_metadata_cache
+from src.services.pdf_prevalidator import prevalidate_pdf, INVALID, VALID
 
 
 class PDFService:
     """Service class for PDF operations - separates logic from UI"""
     
+    # Pages copied by split_every_n_pages before the source is reopened
+    RELOAD_EVERY_PAGES = 2500
+    
     @staticmethod
     def _check_pdf_readable(path_obj: Path) -> bool:
         """Check if PDF file can be opened and has pages. Max 20 lines."""
+        return PDFService.check_pdf_structure(str(path_obj))['valid']
+    
+    @staticmethod
+    def check_pdf_structure(file_path: str) -> Dict[str, Any]:
+        """Validate a PDF, opening it fully only if the fast check can't decide. Max 20 lines.
+        
+        A sound structure still needs pages, so a fast VALID verdict is only
+        reported once the (cached) page count is above zero.
+        
+        Returns:
+            Dict with valid, method ('fast' or 'full'), reason and encrypted
+        """
+        check = prevalidate_pdf(file_path)
+        result = {'valid': check.verdict == VALID, 'reason': check.reason,
+                  'method': 'fast' if check.conclusive else 'full',
+                  'encrypted': check.encrypted}
+        if check.verdict == INVALID:
+            return result
+        step = "page tree" if check.conclusive else "full open"
         try:
-            doc = fitz.open(str(path_obj))
-            page_count = len(doc)
-            doc.close()
-            return page_count > 0
-        except Exception:
-            return False
+            page_count = get_metadata_cache().get(file_path).page_count
+            result.update(valid=page_count > 0,
+                          reason=f"{check.reason}; {step} found {page_count} pages")
+        except Exception as e:
+            result.update(valid=False, reason=f"{check.reason}; {step} failed: {e}")
+        return result
     
     @staticmethod
     def validate_pdf_path(file_path: str) -> bool:
@@ -37,12 +70,11 @@ class PDFService:
     
     @staticmethod
     def _get_pdf_page_count(path_obj: Path) -> int:
-        """Get page count from PDF file. Max 20 lines."""
+        """Get page count from PDF file (cached per file version). Max 20 lines."""
         try:
-            doc = fitz.open(str(path_obj))
-            page_count = len(doc)
-            doc.close()
-            return page_count
+            return get_metadata_cache().get(str(path_obj)).page_count
+        except ValueError:
+            raise
         except Exception as e:
             raise ValueError(f"Error reading PDF: {e}")
     
@@ -67,14 +99,6 @@ class PDFService:
             'file_path': str(path_obj)
         }
     
-    @staticmethod
-    def _validate_page_range(doc: fitz.Document, start_page: int, end_page: int) -> None:
-        """Validate page range for PDF. Max 20 lines."""
-        total_pages = len(doc)
-        if start_page < 1 or end_page > total_pages or start_page > end_page:
-            doc.close()
-            raise ValueError(f"Invalid page range. PDF has {total_pages} pages.")
-    
     @staticmethod
     def _build_output_filename(output_name: str, document_code: str, 
                              case_number: str, optional_other: str) -> str:
@@ -88,29 +112,18 @@ class PDFService:
         return "_".join(filename_parts) + ".pdf"
     
     @staticmethod
-    def _get_unique_output_path(output_dir: Path, filename: str) -> Path:
-        """Get unique output path, adding counter if needed. Max 20 lines."""
-        output_path = output_dir / filename
-        
-        if not output_path.exists():
-            return output_path
-            
-        # Handle duplicates
-        counter = 1
-        original_path = output_path
-        while output_path.exists():
-            name_without_ext = original_path.stem
-            extension = original_path.suffix
-            output_path = output_dir / f"{name_without_ext} ({counter}){extension}"
-            counter += 1
-        return output_path
+    def _get_unique_output_path(output_dir: Path, filename: str,
+                                names: Optional[OutputNameIndex] = None) -> Path:
+        """Reserve a unique output path, adding a counter if needed. Max 20 lines."""
+        if names is None:
+            names = OutputNameIndex(output_dir)
+        return names.reserve(filename)
     
     @staticmethod
-    def _extract_page_range(doc: fitz.Document, start_page: int, end_page: int) -> fitz.Document:
-        """Extract page range from PDF document. Max 20 lines."""
-        new_doc = fitz.open()
-        new_doc.insert_pdf(doc, from_page=start_page-1, to_page=end_page-1)
-        return new_doc
+    def _extract_page_range(session: SplitSession, selection: PageSelection,
+                            fidelity: str = DEFAULT_FIDELITY) -> fitz.Document:
+        """Extract selected page runs from the session's PDF. Max 20 lines."""
+        return session.extract_selection(selection, fidelity)
     
     @staticmethod
     def _prepare_output_directory(output_folder: str) -> Path:
@@ -120,14 +133,18 @@ class PDFService:
         return Path.home() / "Downloads"
     
     @staticmethod
-    def _save_pdf_document(new_doc: fitz.Document, output_path: Path) -> str:
-        """Save PDF document to file. Max 20 lines."""
-        new_doc.save(output_path)
-        return str(output_path)
+    def _save_pdf_document(new_doc: fitz.Document, output_path: Path,
+                           save_profile: str = DEFAULT_SAVE_PROFILE) -> str:
+        """Save PDF document to file using a named save profile. Max 20 lines."""
+        return save_document(new_doc, output_path, save_profile)
     
     @staticmethod
     def split_pdf(input_path: str, start_page: int, end_page: int, 
-                  output_name: str, document_code: str, case_number: str = "", optional_other: str = "", output_folder: str = "") -> str:
+                  output_name: str, document_code: str, case_number: str = "", optional_other: str = "", output_folder: str = "",
+                  pages: str = "", save_profile: str = DEFAULT_SAVE_PROFILE,
+                  fidelity: str = DEFAULT_FIDELITY,
+                  session: Optional[SplitSession] = None,
+                  output_path: str = "") -> str:
         """
         Split a PDF file by extracting specified page range.
         
@@ -137,83 +154,342 @@ class PDFService:
             end_page (int): Ending page number (1-indexed)
             output_name (str): Name for the output file
             document_code (str): Document code to append to filename
+            pages (str): Optional page selection expression such as
+                "1-50,75,odd,last-10"; overrides start_page/end_page
+            save_profile (str): "fast", "compact" or "web" (see save_profiles)
+            fidelity (str): "full", "no-links", "no-annots" or "bare" (see
+                fidelity_profiles)
+            session (SplitSession): Open batch session to reuse instead of
+                reopening input_path for this split
+            output_path (str): Write to this path, replacing it, instead of
+                reserving a unique name (used by job journals, which
+                reserve names before the batch starts)
         
         Returns:
             str: Path to the created output file
         """
-        # Clean up the input path
-        input_path = input_path.strip().strip('"').strip("'")
+        if session is None:
+            with SplitSession(input_path) as single_session:
+                return PDFService.split_pdf(
+                    input_path, start_page, end_page, output_name, document_code,
+                    case_number, optional_other, output_folder, pages=pages,
+                    save_profile=save_profile, fidelity=fidelity, session=single_session,
+                    output_path=output_path
+                )
         
-        # Open the PDF
-        doc = fitz.open(input_path)
-        
-        # Validate page range
-        PDFService._validate_page_range(doc, start_page, end_page)
+        # Validate and compile the page selection against the open source
+        selection = session.select_pages(start_page, end_page, pages)
         
         # Create new PDF with selected pages
-        new_doc = PDFService._extract_page_range(doc, start_page, end_page)
+        new_doc = PDFService._extract_page_range(session, selection, fidelity)
+        if output_path:
+            try:
+                with session.timings.phase('save'):
+                    return PDFService._save_pdf_document(new_doc, Path(output_path),
+                                                         save_profile)
+            finally:
+                new_doc.close()
         
         # Prepare output path
-        output_dir = PDFService._prepare_output_directory(output_folder)
-        filename = PDFService._build_output_filename(
-            output_name, document_code, case_number, optional_other
-        )
-        output_path = PDFService._get_unique_output_path(output_dir, filename)
-        
-        # Save the new PDF
-        result = PDFService._save_pdf_document(new_doc, output_path)
-        
-        # Close documents
-        doc.close()
-        new_doc.close()
+        with session.timings.phase('names'):
+            output_dir = PDFService._prepare_output_directory(output_folder)
+            filename = PDFService._build_output_filename(
+                output_name, document_code, case_number, optional_other
+            )
+            names = session.output_names(output_dir)
+            output_path = PDFService._get_unique_output_path(output_dir, filename, names)
         
-        return result
+        # Save the new PDF over the reserved placeholder
+        try:
+            with session.timings.phase('save'):
+                return PDFService._save_pdf_document(new_doc, output_path, save_profile)
+        except Exception:
+            names.release(output_path)
+            raise
+        finally:
+            new_doc.close()
     
     @staticmethod
-    def _process_single_split(input_path: str, request: Dict[str, Any], index: int) -> Dict[str, Any]:
+    def _process_single_split(session: SplitSession, request: Dict[str, Any], index: int) -> Dict[str, Any]:
         """Process a single split request. Max 20 lines."""
+        started = time.perf_counter()
         try:
-            output_path = PDFService.split_pdf(
-                input_path=input_path,
-                start_page=request['start_page'],
-                end_page=request['end_page'],
-                output_name=request.get('client_name', ''),
-                document_code=request['document_code'],
-                case_number=request.get('case_number', ''),
-                optional_other=request.get('output_name', ''),
-                output_folder=request.get('output_folder', '')
-            )
+            with span('split', request_index=index, document_code=request['document_code']):
+                output_path = PDFService.split_pdf(
+                    input_path=session.input_path,
+                    start_page=request.get('start_page', 0),
+                    end_page=request.get('end_page', 0),
+                    output_name=request.get('client_name', ''),
+                    document_code=request['document_code'],
+                    case_number=request.get('case_number', ''),
+                    optional_other=request.get('output_name', ''),
+                    output_folder=request.get('output_folder', ''),
+                    pages=request.get('pages', ''),
+                    save_profile=request.get('save_profile', DEFAULT_SAVE_PROFILE),
+                    fidelity=request.get('fidelity', DEFAULT_FIDELITY),
+                    session=session,
+                    output_path=request.get('output_path', '')
+                )
             
-            return {
+            result = {
                 'success': True,
                 'output_path': output_path,
                 'request_index': index,
                 'message': f"Successfully created {Path(output_path).name}"
             }
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'request_index': index,
-                'message': f"Failed to create split {index+1}: {e}"
-            }
+            result = PDFService._failure_result(index, str(e))
+        result['timings'] = session.timings.for_result(time.perf_counter() - started)
+        return result
+    
+    @staticmethod
+    def _failure_result(index: int, error: str) -> Dict[str, Any]:
+        """Build the result dict for a failed split. Max 20 lines."""
+        return {
+            'success': False,
+            'error': error,
+            'request_index': index,
+            'message': f"Failed to create split {index+1}: {error}"
+        }
     
     @staticmethod
-    def batch_split_pdf(input_path: str, split_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def batch_split_pdf(input_path: str, split_requests: List[Dict[str, Any]],
+                        workers: int = 1,
+                        save_profile: str = DEFAULT_SAVE_PROFILE,
+                        fidelity: str = DEFAULT_FIDELITY,
+                        staging: str = DEFAULT_STAGING,
+                        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+                        ) -> List[Dict[str, Any]]:
         """
         Process multiple split requests for the same PDF.
         
+        The source is opened once in a SplitSession and shared by every split.
+        With workers other than 1 the splits are spread over a process pool
+        in which each worker opens the source once.
+        
         Args:
             input_path (str): Path to the input PDF file
             split_requests (list): List of split request dictionaries
+            workers (int): Worker processes; 1 runs in-process, 0 uses one
+                per CPU
+            save_profile (str): Save profile for requests that don't set
+                their own 'save_profile'
+            fidelity (str): Copy-fidelity profile for requests that don't
+                set their own 'fidelity'
+            staging (str): Source staging mode for network shares: "auto",
+                "direct", "memory" or "copy" (see source_staging)
+            on_result (callable): Called in this process with each result
+                as soon as it is known, in completion order
         
         Returns:
-            list: Results of each split operation
+            list: Results of each split operation, in request order. Each
+            has 'timings' with staging, open and split seconds and the
+            seconds of each phase (see split_trace); staging and open time
+            appear on the first result of each session.
         """
-        results = []
+        split_requests = [
+            {'save_profile': save_profile, 'fidelity': fidelity, **request}
+            for request in split_requests
+        ]
+        with trace_batch(Path(input_path.strip('"')).stem):
+            return PDFService._run_batch(input_path, split_requests, workers, staging,
+                                         on_result)
+    
+    @staticmethod
+    def _run_batch(input_path: str, split_requests: List[Dict[str, Any]], workers: int,
+                   staging: str, on_result: Optional[Callable[[Dict[str, Any]], None]]
+                   ) -> List[Dict[str, Any]]:
+        """Run a batch in-process or on a process pool (see batch_split_pdf)."""
+        if workers != 1 and len(split_requests) > 1:
+            return run_parallel(
+                input_path, split_requests, PDFService._process_single_split,
+                PDFService._failure_result, workers, staging=staging, on_result=on_result
+            )
         
-        for i, request in enumerate(split_requests):
-            result = PDFService._process_single_split(input_path, request, i)
-            results.append(result)
+        report = on_result or (lambda result: None)
+        try:
+            session = SplitSession(input_path, staging=staging).open()
+        except Exception as e:
+            results = [PDFService._failure_result(i, str(e)) for i in range(len(split_requests))]
+            for result in results:
+                report(result)
+            return results
         
-        return results
\ No newline at end of file
+        try:
+            results = []
+            for i, request in enumerate(split_requests):
+                results.append(PDFService._process_single_split(session, request, i))
+                report(results[-1])
+            return results
+        finally:
+            session.close()
+    
+    @staticmethod
+    def split_every_n_pages(input_path: str, pages_per_chunk: int, output_name: str,
+                            document_code: str, case_number: str = "",
+                            optional_other: str = "", output_folder: str = "",
+                            save_profile: str = DEFAULT_SAVE_PROFILE,
+                            fidelity: str = DEFAULT_FIDELITY,
+                            staging: str = DEFAULT_STAGING) -> Iterator[Dict[str, Any]]:
+        """
+        Split a PDF into consecutive chunks of pages_per_chunk pages, lazily.
+        
+        A generator: each chunk is assembled, saved and closed, and
+        MuPDF's object store is emptied, before the chunk's result is
+        yielded and the next chunk started. The source is reopened every
+        RELOAD_EVERY_PAGES pages to drop the objects MuPDF has cached from
+        it, so memory stays flat however many chunks there are. Parts are
+        named <code>_Part01, _Part02, ...
+        
+        Args:
+            input_path (str): Path to the input PDF file
+            pages_per_chunk (int): Pages per output; the last may be shorter
+            output_name (str): Name for the output files
+            document_code (str): Document code the part number is appended to
+            save_profile (str): "fast", "compact" or "web" (see save_profiles)
+            fidelity (str): Copy-fidelity profile (see fidelity_profiles)
+            staging (str): Source staging mode (see source_staging)
+        
+        Yields:
+            dict: One result per chunk with output_path, start_page,
+            end_page and timings, as soon as the chunk is written
+        """
+        if pages_per_chunk < 1:
+            yield PDFService._failure_result(0, "Pages per chunk must be at least 1")
+            return
+        try:
+            session = SplitSession(input_path, staging=staging).open()
+        except Exception as e:
+            yield PDFService._failure_result(0, str(e))
+            return
+        try:
+            runs = list(chunk_runs(session.page_count, pages_per_chunk))
+            width = max(2, len(str(len(runs))))
+            reload_interval = max(1, PDFService.RELOAD_EVERY_PAGES // pages_per_chunk)
+            for index, (start, end) in enumerate(runs):
+                result = PDFService._process_single_split(session, {
+                    'start_page': start, 'end_page': end,
+                    'client_name': output_name, 'case_number': case_number,
+                    'document_code': part_code(document_code, index + 1, width),
+                    'output_name': optional_other, 'output_folder': output_folder,
+                    'save_profile': save_profile, 'fidelity': fidelity,
+                }, index)
+                fitz.TOOLS.store_shrink(100)
+                if index % reload_interval == reload_interval - 1:
+                    session.reload()
+                yield {**result, 'start_page': start, 'end_page': end}
+        finally:
+            session.close()
+    
+    @staticmethod
+    def split_by_size(input_path: str, max_bytes: int, output_name: str,
+                      document_code: str, case_number: str = "", optional_other: str = "",
+                      output_folder: str = "",
+                      save_profile: str = DEFAULT_SAVE_PROFILE,
+                      fidelity: str = DEFAULT_FIDELITY,
+                      staging: str = DEFAULT_STAGING) -> List[Dict[str, Any]]:
+        """
+        Split a PDF into consecutive parts that each stay under max_bytes.
+        
+        Pages are packed from per-page byte estimates for the save profile
+        (see size_splitter), so no trial saves are needed. Only the final outputs are measured:
+        a part that still comes out over the limit is re-packed with a
+        proportionally smaller budget and written again under the same
+        name. A single page larger than the limit becomes its own part and
+        is marked 'oversized'.
+        
+        Args:
+            input_path (str): Path to the input PDF file
+            max_bytes (int): Size limit per output file
+            output_name (str): Name for the output files
+            document_code (str): Parts are named <code>_Part01, _Part02, ...
+                (Part01, ... when empty)
+            save_profile (str): "fast", "compact" or "web" (see save_profiles)
+            fidelity (str): Copy-fidelity profile (see fidelity_profiles)
+            staging (str): Source staging mode (see source_staging)
+        
+        Returns:
+            list: One result per part with output_path, start_page,
+            end_page, size_bytes, estimated_bytes and timings
+        """
+        if max_bytes <= 0:
+            return [PDFService._failure_result(0, "Maximum size must be positive")]
+        with trace_batch(Path(input_path.strip('"')).stem):
+            return PDFService._run_size_split(
+                input_path, max_bytes, output_name, document_code, case_number,
+                optional_other, output_folder, save_profile, fidelity, staging
+            )
+    
+    @staticmethod
+    def _run_size_split(input_path: str, max_bytes: int, output_name: str,
+                        document_code: str, case_number: str, optional_other: str,
+                        output_folder: str, save_profile: str, fidelity: str,
+                        staging: str) -> List[Dict[str, Any]]:
+        """Pack and write the parts of split_by_size. Max 20 lines."""
+        from src.services.size_splitter import get_cost_table, pack_pages
+
+        try:
+            session = SplitSession(input_path, staging=staging).open()
+        except Exception as e:
+            return [PDFService._failure_result(0, str(e))]
+        results: List[Dict[str, Any]] = []
+        try:
+            table = get_cost_table(session.doc, session.input_path, save_profile)
+            pending = pack_pages(table, max_bytes)
+            output_dir = PDFService._prepare_output_directory(output_folder)
+            names = session.output_names(output_dir)
+            while pending:
+                with session.timings.phase('names'):
+                    filename = PDFService._build_output_filename(
+                        output_name, part_code(document_code, len(results) + 1),
+                        case_number, optional_other
+                    )
+                    output_path = names.reserve(filename)
+                result, pending = PDFService._write_size_part(
+                    session, table, pending, max_bytes, output_path,
+                    save_profile, fidelity
+                )
+                result['request_index'] = len(results)
+                results.append(result)
+        except Exception as e:
+            # Parts already written stay; the failure ends the list
+            results.append(PDFService._failure_result(len(results), str(e)))
+        finally:
+            session.close()
+        return results
+    
+    @staticmethod
+    def _write_size_part(session: SplitSession, table, pending: List[tuple], max_bytes: int,
+                         output_path: Path, save_profile: str, fidelity: str):
+        """Write the next part under max_bytes; returns its result and the rest. Max 20 lines."""
+        from src.services.size_splitter import pack_pages
+
+        started = time.perf_counter()
+        try:
+            while True:
+                start, end = pending[0]
+                session.write_split(start, end, str(output_path), save_profile, fidelity)
+                size = os.path.getsize(output_path)
+                estimate = table.estimate(start, end)
+                if size <= max_bytes or start == end:
+                    break
+                budget = int(estimate * max_bytes / size * 0.95)
+                repacked = pack_pages(table, budget, start, end)
+                if len(repacked) == 1:
+                    middle = (start + end) // 2
+                    repacked = [(start, middle), (middle + 1, end)]
+                pending = repacked + pending[1:]
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
+        return {
+            'success': True,
+            'output_path': str(output_path),
+            'start_page': start,
+            'end_page': end,
+            'size_bytes': size,
+            'estimated_bytes': estimate,
+            'oversized': size > max_bytes,
+            'message': f"Successfully created {output_path.name}",
+            'timings': session.timings.for_result(time.perf_counter() - started),
+        }, pending[1:]
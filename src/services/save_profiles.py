@@ -0,0 +1,90 @@
+"""Named save profiles for output PDFs.
+
+PyMuPDF is only imported when saving, so the GUI can list the profiles
+without paying for it at startup.
+"""
+
+import inspect
+import warnings
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import fitz
+
+
+# Options passed to fitz.Document.save for each profile
+SAVE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Minimum CPU: write objects as they are (PyMuPDF defaults)
+    'fast': {'garbage': 0, 'deflate': False},
+    # Smallest file: drop unused/duplicate objects, compress streams and
+    # pack objects into object streams
+    'compact': {
+        'garbage': 3, 'deflate': True, 'deflate_images': True,
+        'deflate_fonts': True, 'use_objstms': 1,
+    },
+    # Linearized ("fast web view") so viewers can show page 1 before the
+    # whole file has downloaded; object streams don't mix with linearization
+    'web': {'garbage': 3, 'deflate': True, 'linear': True},
+}
+
+SAVE_PROFILE_LABELS = {
+    'fast': "Fast (minimum CPU)",
+    'compact': "Compact (smallest file)",
+    'web': "Web (linearized)",
+}
+
+DEFAULT_SAVE_PROFILE = 'fast'
+
+
+def get_save_options(profile: str) -> Dict[str, Any]:
+    """Get the fitz save options for a profile.
+
+    Options this PyMuPDF build does not know (e.g. use_objstms on older
+    releases) are dropped.
+
+    Args:
+        profile: One of SAVE_PROFILES
+
+    Returns:
+        Keyword arguments for fitz.Document.save
+    """
+    if profile not in SAVE_PROFILES:
+        raise ValueError(
+            f"Unknown save profile '{profile}'. Choose from: {', '.join(SAVE_PROFILES)}"
+        )
+    supported = _supported_save_options()
+    return {key: value for key, value in SAVE_PROFILES[profile].items() if key in supported}
+
+
+def save_document(doc: 'fitz.Document', output_path: Union[str, Path],
+                  profile: str = DEFAULT_SAVE_PROFILE) -> str:
+    """Save a document using a named profile.
+
+    MuPDF 1.26 removed linearization; on such builds the "web" profile
+    falls back to "compact" with a warning.
+
+    Returns:
+        The output path as a string
+    """
+    options = get_save_options(profile)
+    try:
+        doc.save(str(output_path), **options)
+    except Exception as e:
+        if not options.get('linear') or 'linear' not in str(e).lower():
+            raise
+        warnings.warn("Linearized saving is not supported by this PyMuPDF build; "
+                      "saving with the 'compact' profile instead")
+        doc.save(str(output_path), **get_save_options('compact'))
+    return str(output_path)
+
+
+@lru_cache(maxsize=1)
+def _supported_save_options() -> frozenset:
+    """Names of the keyword arguments fitz.Document.save accepts."""
+    import fitz
+    try:
+        return frozenset(inspect.signature(fitz.Document.save).parameters)
+    except (TypeError, ValueError):
+        return frozenset(key for options in SAVE_PROFILES.values() for key in options)
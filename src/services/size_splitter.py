@@ -0,0 +1,167 @@
+"""Pack pages into outputs under a maximum file size.
+
+A page's cost is the serialized size of the objects it pulls into an
+output: the page object and everything reachable from it through the
+xref (content streams, resources, fonts, images, annotations), without
+following /Parent or links to other pages. Objects already in the
+current output cost nothing, so a font or logo shared by many pages is
+counted once per output. Save profiles that deflate streams are
+estimated with unfiltered streams compressed once. The per-document table
+of object sizes and page closures is cached by fingerprint.
+"""
+
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Set, Tuple, TYPE_CHECKING
+
+from src.services.metadata_cache import get_metadata_cache
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE, SAVE_PROFILES
+
+if TYPE_CHECKING:
+    import fitz
+
+
+BASE_BYTES = 512              # Catalog, page tree, trailer and xref header
+OBJECT_OVERHEAD = 40          # "n 0 obj ... endobj" plus the xref entry
+STREAM_OVERHEAD = 20          # "stream ... endstream"
+PAGE_TREE_BYTES = 8           # The page's entry in /Kids
+MAX_CACHED_DOCUMENTS = 8
+MEGABYTE = 1024 * 1024
+
+_REFERENCE = re.compile(rb'(\d+) \d+ R')
+_PARENT = re.compile(rb'/Parent\s*\d+ \d+ R')
+
+
+@dataclass(frozen=True)
+class PageCostTable:
+    """Serialized object sizes and per-page object closures of a document."""
+    object_sizes: Dict[int, int]
+    page_objects: List[FrozenSet[int]]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_objects)
+
+    def estimate(self, start_page: int, end_page: int) -> int:
+        """Estimated output size of pages start_page..end_page (1-indexed)."""
+        objects: Set[int] = set()
+        for number in range(start_page, end_page + 1):
+            objects |= self.page_objects[number - 1]
+        return (BASE_BYTES + PAGE_TREE_BYTES * (end_page - start_page + 1)
+                + sum(self.object_sizes[xref] for xref in objects))
+
+
+def build_cost_table(doc: 'fitz.Document', deflate: bool = False) -> PageCostTable:
+    """Walk every page's object closure once; shared objects are sized once.
+
+    Args:
+        doc: Open source document
+        deflate: Size unfiltered streams as they will be once compressed
+    """
+    page_xrefs = {doc.page_xref(number) for number in range(doc.page_count)}
+    sizes: Dict[int, int] = {}
+    children: Dict[int, Tuple[int, ...]] = {}
+
+    def visit(xref: int) -> None:
+        source = doc.xref_object(xref, compressed=True).encode('latin-1', 'replace')
+        size = OBJECT_OVERHEAD + len(source)
+        if doc.xref_is_stream(xref):
+            size += STREAM_OVERHEAD + _stream_length(doc, xref, deflate)
+        sizes[xref] = size
+        children[xref] = tuple(
+            int(match.group(1)) for match in _REFERENCE.finditer(_PARENT.sub(b'', source))
+        )
+
+    page_objects = []
+    for number in range(doc.page_count):
+        page_xref = doc.page_xref(number)
+        closure = {page_xref}
+        pending = [page_xref]
+        while pending:
+            xref = pending.pop()
+            if xref not in children:
+                visit(xref)
+            for child in children[xref]:
+                if child not in closure and child not in page_xrefs and 0 < child < doc.xref_length():
+                    closure.add(child)
+                    pending.append(child)
+        page_objects.append(frozenset(closure))
+    return PageCostTable(sizes, page_objects)
+
+
+def pack_pages(table: PageCostTable, max_bytes: int, start_page: int = 1,
+               end_page: int = 0) -> List[Tuple[int, int]]:
+    """Greedily pack consecutive pages into ranges estimated under max_bytes.
+
+    A page that is over the limit on its own gets a range to itself.
+
+    Args:
+        table: Cost table of the document
+        max_bytes: Size limit per output
+        start_page: First page to pack (1-indexed)
+        end_page: Last page to pack; 0 means the last page
+
+    Returns:
+        (start, end) page ranges covering start_page..end_page in order
+    """
+    end_page = end_page or table.page_count
+    ranges: List[Tuple[int, int]] = []
+    range_start = start_page
+    objects: Set[int] = set()
+    size = BASE_BYTES
+    for number in range(start_page, end_page + 1):
+        new_objects = table.page_objects[number - 1] - objects
+        cost = PAGE_TREE_BYTES + sum(table.object_sizes[xref] for xref in new_objects)
+        if number > range_start and size + cost > max_bytes:
+            ranges.append((range_start, number - 1))
+            range_start, objects, size = number, set(), BASE_BYTES
+            new_objects = table.page_objects[number - 1]
+            cost = PAGE_TREE_BYTES + sum(table.object_sizes[xref] for xref in new_objects)
+        objects |= new_objects
+        size += cost
+    ranges.append((range_start, end_page))
+    return ranges
+
+
+def get_cost_table(doc: 'fitz.Document', file_path: str,
+                   save_profile: str = DEFAULT_SAVE_PROFILE) -> PageCostTable:
+    """Cost table for an open document, cached by fingerprint and compression."""
+    deflate = bool(SAVE_PROFILES[save_profile].get('deflate'))
+    key = (get_metadata_cache().get(file_path).fingerprint, deflate)
+    with _cache_lock:
+        table = _cost_tables.get(key)
+        if table is not None:
+            _cost_tables.move_to_end(key)
+            return table
+    table = build_cost_table(doc, deflate)
+    with _cache_lock:
+        _cost_tables[key] = table
+        while len(_cost_tables) > MAX_CACHED_DOCUMENTS:
+            _cost_tables.popitem(last=False)
+    return table
+
+
+def plan_size_splits(file_path: str, max_bytes: int,
+                     save_profile: str = DEFAULT_SAVE_PROFILE) -> List[Tuple[int, int]]:
+    """Page ranges of a PDF whose estimated output sizes stay under max_bytes."""
+    import fitz
+
+    with fitz.open(file_path) as doc:
+        return pack_pages(get_cost_table(doc, file_path, save_profile), max_bytes)
+
+
+def _stream_length(doc: 'fitz.Document', xref: int, deflate: bool) -> int:
+    """Stored length of a stream, or its compressed length if it will be deflated."""
+    if deflate and doc.xref_get_key(xref, "Filter")[0] == 'null':
+        return len(zlib.compress(doc.xref_stream_raw(xref) or b''))
+    kind, value = doc.xref_get_key(xref, "Length")
+    if kind == 'int':
+        return int(value)
+    return len(doc.xref_stream_raw(xref) or b'')
+
+
+_cost_tables: "OrderedDict[Tuple[str, bool], PageCostTable]" = OrderedDict()
+_cache_lock = threading.Lock()
@@ -0,0 +1,217 @@
+"""Staging of source PDFs that live on network shares.
+
+MuPDF reads a PDF with many small random-access reads (xref, objects,
+streams). On an SMB or NFS share each read is a network round trip, so
+opening and splitting a file in place is far slower than reading it
+once, sequentially. Staging modes:
+
+- direct: open the file where it is (local files)
+- memory: read the whole file into one buffer with large sequential
+  reads and open it from memory, without an extra copy
+- copy: copy the file to a local temp directory and open the copy
+- auto: direct for local files; on a network filesystem, memory up to
+  memory_threshold bytes and copy above it
+
+Timings for staging, opening and splitting are collected in
+SourceTimings so the cost of staging can be compared with the split,
+along with the time each split spends in each phase (see split_trace).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING
+
+from src.services.split_trace import SPLIT_PHASES, record_span
+
+if TYPE_CHECKING:
+    import fitz
+
+
+STAGING_MODES = ('auto', 'direct', 'memory', 'copy')
+DEFAULT_STAGING = 'auto'
+DEFAULT_MEMORY_THRESHOLD = 512 * 1024 * 1024
+READ_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Filesystem types treated as network shares (from /proc/mounts)
+_NETWORK_FS_TYPES = frozenset({
+    'cifs', 'smb3', 'smbfs', 'nfs', 'nfs4', 'afpfs', 'ncpfs', '9p',
+    'fuse.sshfs', 'fuse.rclone', 'davfs', 'fuse.davfs2',
+})
+_DRIVE_REMOTE = 4
+
+
+@dataclass
+class SourceTimings:
+    """Seconds spent staging, opening and splitting one source."""
+    staging_mode: str = 'direct'
+    staging_seconds: float = 0.0
+    open_seconds: float = 0.0
+    split_seconds: float = 0.0
+    _reported: bool = field(default=False, repr=False, compare=False)
+    _phases: Dict[str, float] = field(default_factory=dict, repr=False, compare=False)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time one phase of the current split and add it to the batch trace."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            self._phases[name] = self._phases.get(name, 0.0) + ended - started
+            record_span(name, started, ended)
+
+    def for_result(self, split_seconds: float) -> Dict[str, Any]:
+        """Timings to attach to one split result.
+
+        Staging and open time are reported with the first result only,
+        so summing over a batch's results gives the batch totals.
+        split_seconds is also added to this source's running total, and
+        the phase times since the previous result are reported and reset.
+        """
+        first = not self._reported
+        self._reported = True
+        self.split_seconds += split_seconds
+        phases = {f"{name}_seconds": round(self._phases.get(name, 0.0), 6)
+                  for name in SPLIT_PHASES}
+        self._phases.clear()
+        return {
+            'staging_mode': self.staging_mode,
+            'staging_seconds': round(self.staging_seconds if first else 0.0, 6),
+            'open_seconds': round(self.open_seconds if first else 0.0, 6),
+            'split_seconds': round(split_seconds, 6),
+            **phases,
+        }
+
+
+class StagedSource:
+    """A source PDF made ready for opening according to a staging mode."""
+
+    def __init__(self, input_path: str, mode: str = DEFAULT_STAGING,
+                 memory_threshold: int = DEFAULT_MEMORY_THRESHOLD):
+        """Initialize without touching the file.
+
+        Args:
+            input_path: Path to the source PDF
+            mode: One of STAGING_MODES
+            memory_threshold: Largest file (bytes) that auto stages in memory
+        """
+        if mode not in STAGING_MODES:
+            raise ValueError(
+                f"Unknown staging mode '{mode}'. Choose from: {', '.join(STAGING_MODES)}"
+            )
+        self.input_path = input_path
+        self.requested_mode = mode
+        self.memory_threshold = memory_threshold
+        self.mode = mode
+        self.local_path: Optional[str] = None
+        self.seconds = 0.0
+        self._buffer: Optional[bytearray] = None
+        self._temp_dir: Optional[str] = None
+
+    def stage(self) -> 'StagedSource':
+        """Read or copy the source as the mode requires. Max 20 lines."""
+        started = time.perf_counter()
+        self.mode = resolve_staging_mode(self.input_path, self.requested_mode,
+                                         self.memory_threshold)
+        if self.mode == 'memory':
+            self._buffer = read_sequential(self.input_path)
+        elif self.mode == 'copy':
+            self._temp_dir = tempfile.mkdtemp(prefix="pdf_splitter_")
+            self.local_path = os.path.join(self._temp_dir, Path(self.input_path).name)
+            shutil.copyfile(self.input_path, self.local_path)
+        else:
+            self.local_path = self.input_path
+        self.seconds = time.perf_counter() - started
+        record_span('staging', started, started + self.seconds, mode=self.mode)
+        return self
+
+    def open_document(self) -> 'fitz.Document':
+        """Open the staged source with PyMuPDF."""
+        import fitz
+
+        if self._buffer is None:
+            return fitz.open(self.local_path)
+        try:
+            # A memoryview lets MuPDF read the buffer in place
+            return fitz.open(stream=memoryview(self._buffer), filetype='pdf')
+        except TypeError:
+            # Builds that only take bytes copy the buffer once
+            return fitz.open(stream=bytes(self._buffer), filetype='pdf')
+
+    def close(self) -> None:
+        """Release the buffer or remove the temp copy.
+
+        Call only after every document opened from this source is closed.
+        """
+        self._buffer = None
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+        self.local_path = None
+
+
+def resolve_staging_mode(input_path: str, mode: str = DEFAULT_STAGING,
+                         memory_threshold: int = DEFAULT_MEMORY_THRESHOLD) -> str:
+    """Turn 'auto' into direct, memory or copy for this file."""
+    if mode != 'auto':
+        return mode
+    if not is_network_path(input_path):
+        return 'direct'
+    return 'memory' if os.path.getsize(input_path) <= memory_threshold else 'copy'
+
+
+def read_sequential(input_path: str, chunk_size: int = READ_CHUNK_BYTES) -> bytearray:
+    """Read a whole file into one preallocated buffer with large reads."""
+    size = os.path.getsize(input_path)
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    filled = 0
+    with open(input_path, 'rb', buffering=0) as handle:
+        while filled < size:
+            count = handle.readinto(view[filled:filled + chunk_size])
+            if not count:
+                break
+            filled += count
+    view.release()
+    if filled < size:
+        # The file shrank while being read
+        del buffer[filled:]
+    return buffer
+
+
+def is_network_path(input_path: str) -> bool:
+    """Best-effort check whether a path is on a network filesystem."""
+    path = os.path.abspath(input_path)
+    if sys.platform == 'win32':
+        if path.startswith('\\\\'):
+            return True
+        try:
+            import ctypes
+            root = os.path.splitdrive(path)[0] + '\\'
+            return ctypes.windll.kernel32.GetDriveTypeW(root) == _DRIVE_REMOTE
+        except (AttributeError, OSError):
+            return False
+    return _mount_fs_type(os.path.realpath(path)) in _NETWORK_FS_TYPES
+
+
+def _mount_fs_type(path: str) -> Optional[str]:
+    """Filesystem type of the longest mount point containing path (Linux)."""
+    try:
+        with open('/proc/mounts', encoding='utf-8') as mounts:
+            entries = [line.split()[1:3] for line in mounts if line.strip()]
+    except OSError:
+        return None
+    best, fs_type = '', None
+    for mount_point, mount_type in entries:
+        mount_point = mount_point.replace('\\040', ' ')
+        prefix = mount_point.rstrip('/') + '/'
+        if (path == mount_point or path.startswith(prefix)) and len(mount_point) > len(best):
+            best, fs_type = mount_point, mount_type
+    return fs_type
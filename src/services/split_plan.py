@@ -0,0 +1,107 @@
+"""Loading split plans (lists of split requests) from JSON or CSV files."""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.models.page_selection import PageSelectionError, parse_selection
+from src.services.fidelity_profiles import FIDELITY_PROFILES
+from src.services.save_profiles import SAVE_PROFILES
+
+
+# Plan columns understood by PDFService.batch_split_pdf
+PLAN_FIELDS = (
+    'start_page', 'end_page', 'pages', 'document_code', 'client_name',
+    'case_number', 'output_name', 'output_folder', 'save_profile', 'fidelity'
+)
+INT_FIELDS = ('start_page', 'end_page')
+
+
+class SplitPlanError(ValueError):
+    """Raised when a split plan file cannot be read or is invalid."""
+
+
+def load_split_plan(plan_path: str) -> List[Dict[str, Any]]:
+    """Load split requests from a .json or .csv plan file.
+
+    JSON plans are either a list of request objects or an object with a
+    "splits" list; any other top-level keys are defaults applied to every
+    split (e.g. "client_name", "output_folder"). CSV plans have one split
+    per row with PLAN_FIELDS as column headers.
+
+    Args:
+        plan_path: Path to the plan file
+
+    Returns:
+        List of split request dictionaries
+    """
+    path = Path(plan_path)
+    try:
+        text = path.read_text(encoding='utf-8-sig')
+    except OSError as e:
+        raise SplitPlanError(f"Cannot read split plan: {e}")
+    if path.suffix.lower() == '.csv':
+        rows = list(csv.DictReader(text.splitlines()))
+    else:
+        rows = _json_rows(text)
+    if not rows:
+        raise SplitPlanError("Split plan contains no splits")
+    return [normalize_request(row, i) for i, row in enumerate(rows)]
+
+
+def normalize_request(row: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Clean and validate one plan row into a split request dictionary."""
+    request = {}
+    for field in PLAN_FIELDS:
+        value = row.get(field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        request[field] = value.strip() if isinstance(value, str) else value
+    for field in INT_FIELDS:
+        if field in request:
+            request[field] = _to_int(request[field], field, index)
+    _check_request(request, index)
+    return request
+
+
+def _json_rows(text: str) -> List[Dict[str, Any]]:
+    """Parse a JSON plan into a list of rows with defaults applied."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise SplitPlanError(f"Invalid JSON split plan: {e}")
+    if isinstance(data, dict):
+        defaults = {key: value for key, value in data.items() if key != 'splits'}
+        splits = data.get('splits', [])
+        data = [{**defaults, **split} for split in splits if isinstance(split, dict)]
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        raise SplitPlanError("JSON split plan must be a list of split objects")
+    return data
+
+
+def _to_int(value: Any, field: str, index: int) -> int:
+    """Convert a page number field, reporting the split it came from."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise SplitPlanError(f"Split {index + 1}: {field} must be a whole number")
+
+
+def _check_request(request: Dict[str, Any], index: int) -> None:
+    """Check that a request has a code and either pages or a full range."""
+    if not request.get('document_code'):
+        raise SplitPlanError(f"Split {index + 1}: document_code is required")
+    if 'save_profile' in request and request['save_profile'] not in SAVE_PROFILES:
+        raise SplitPlanError(f"Split {index + 1}: unknown save_profile '{request['save_profile']}'")
+    if 'fidelity' in request and request['fidelity'] not in FIDELITY_PROFILES:
+        raise SplitPlanError(f"Split {index + 1}: unknown fidelity '{request['fidelity']}'")
+    if 'pages' in request:
+        try:
+            parse_selection(str(request['pages']))
+        except PageSelectionError as e:
+            raise SplitPlanError(f"Split {index + 1}: {e}")
+    elif 'start_page' not in request or 'end_page' not in request:
+        raise SplitPlanError(
+            f"Split {index + 1}: start_page and end_page (or pages) are required"
+        )
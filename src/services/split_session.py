@@ -0,0 +1,226 @@
+"""Batch split session that keeps one source PDF open for every split."""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+import fitz  # PyMuPDF
+from src.models.page_selection import PageSelection, compile_selection, range_selection
+from src.services.fidelity_profiles import DEFAULT_FIDELITY, get_copy_options
+from src.services.output_names import OutputNameIndex
+from src.services.save_profiles import DEFAULT_SAVE_PROFILE, save_document
+from src.services.source_staging import DEFAULT_STAGING, SourceTimings, StagedSource
+from src.services.split_trace import record_span
+
+
+class SplitCancelled(Exception):
+    """Raised when a split is cancelled between pages."""
+
+
+class SplitSession:
+    """Opens, validates and holds a source PDF for a whole batch of splits.
+
+    Opening a large PDF parses its full xref table, so a batch should pay
+    that cost once. Use as a context manager:
+
+        with SplitSession(input_path) as session:
+            session.write_split(1, 10, "part1.pdf")
+            session.write_split(11, 20, "part2.pdf")
+
+    When on_pages or should_cancel is given, runs are copied in slices of
+    progress_step pages so progress can be reported and a cancel request
+    honoured between pages.
+
+    The source is opened through StagedSource, so a file on a network
+    share can be read into memory or copied locally first (see
+    source_staging). Staging, open and split time are kept in timings,
+    as is the time each split spends validating, inserting and saving.
+    """
+
+    progress_step: int = 10
+
+    def __init__(self, input_path: str,
+                 on_pages: Optional[Callable[[int], None]] = None,
+                 should_cancel: Optional[Callable[[], bool]] = None,
+                 staging: str = DEFAULT_STAGING):
+        """Initialize the session without opening the document.
+
+        Args:
+            input_path: Path to the source PDF (surrounding quotes allowed)
+            on_pages: Called with the pages copied so far in the current split
+            should_cancel: Polled between pages; returning True raises
+                SplitCancelled
+            staging: Source staging mode: "auto", "direct", "memory" or "copy"
+        """
+        self.input_path = input_path.strip().strip('"').strip("'")
+        self.doc: Optional[fitz.Document] = None
+        self.page_count: int = 0
+        self.on_pages = on_pages
+        self.should_cancel = should_cancel
+        self.staging = staging
+        self.timings = SourceTimings()
+        self._source: Optional[StagedSource] = None
+        self._name_indexes: Dict[str, OutputNameIndex] = {}
+
+    def open(self) -> 'SplitSession':
+        """Open and validate the source document. Max 20 lines."""
+        if self.doc is not None:
+            return self
+        if not Path(self.input_path).exists():
+            raise FileNotFoundError(f"PDF file not found: {self.input_path}")
+        source = StagedSource(self.input_path, self.staging).stage()
+        started = time.perf_counter()
+        try:
+            doc = source.open_document()
+        except BaseException:
+            source.close()
+            raise
+        if len(doc) == 0:
+            doc.close()
+            source.close()
+            raise ValueError(f"PDF has no pages: {self.input_path}")
+        opened = time.perf_counter()
+        record_span('open', started, opened, pages=len(doc))
+        self.timings = SourceTimings(source.mode, source.seconds, opened - started)
+        self.doc, self._source = doc, source
+        self.page_count = len(doc)
+        return self
+
+    def reload(self) -> None:
+        """Reopen the source document from its staged copy.
+
+        MuPDF keeps every object it has parsed cached in the open
+        document, so a long pass over a large source grows steadily.
+        Reopening drops that cache; the source is not staged again.
+        """
+        self._require_open()
+        self.doc.close()
+        self.doc = self._source.open_document()
+
+    def close(self) -> None:
+        """Close the source document if it is open."""
+        if self.doc is not None:
+            self.doc.close()
+        if self._source is not None:
+            self._source.close()
+        self.doc = None
+        self._source = None
+        self.page_count = 0
+        self._name_indexes.clear()
+
+    def __enter__(self) -> 'SplitSession':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def is_open(self) -> bool:
+        """Check if the source document is currently open."""
+        return self.doc is not None
+
+    def output_names(self, output_dir: Path) -> OutputNameIndex:
+        """Get the batch's filename reservation index for output_dir.
+
+        The directory is listed on first use and then tracked in memory
+        for the rest of the session.
+        """
+        key = str(Path(output_dir))
+        if key not in self._name_indexes:
+            self._name_indexes[key] = OutputNameIndex(Path(output_dir))
+        return self._name_indexes[key]
+
+    def validate_page_range(self, start_page: int, end_page: int) -> None:
+        """Raise ValueError if the 1-indexed range is outside the document."""
+        if start_page < 1 or end_page > self.page_count or start_page > end_page:
+            raise ValueError(f"Invalid page range. PDF has {self.page_count} pages.")
+
+    def select_pages(self, start_page: int, end_page: int, pages: str = "") -> PageSelection:
+        """Resolve a split to compiled page runs.
+
+        Args:
+            start_page: First page (1-indexed), used when pages is empty
+            end_page: Last page (1-indexed), used when pages is empty
+            pages: Optional selection expression such as "1-50,75,odd"
+
+        Returns:
+            Compiled PageSelection for this document
+        """
+        with self.timings.phase('validate'):
+            if pages and pages.strip():
+                return compile_selection(pages, self.page_count)
+            self.validate_page_range(start_page, end_page)
+            return range_selection(start_page, end_page, self.page_count)
+
+    def extract_selection(self, selection: PageSelection,
+                          fidelity: str = DEFAULT_FIDELITY) -> fitz.Document:
+        """Copy the selected runs into a new in-memory document.
+
+        Each contiguous run is grafted with a single insert_pdf call. The
+        graft map is kept between runs (final=0) so fonts and images shared
+        by several runs are copied only once.
+
+        Args:
+            selection: Compiled page runs to copy
+            fidelity: Fidelity profile deciding whether links, annotations
+                and widgets are copied (see fidelity_profiles)
+        """
+        self._require_open()
+        copy_options = get_copy_options(fidelity)
+        steps = list(self._copy_steps(selection))
+        new_doc = fitz.open()
+        try:
+            with self.timings.phase('insert'):
+                copied = 0
+                for i, (start, end) in enumerate(steps):
+                    self._check_cancelled()
+                    new_doc.insert_pdf(
+                        self.doc, from_page=start - 1, to_page=end - 1,
+                        final=1 if i == len(steps) - 1 else 0, **copy_options
+                    )
+                    copied += end - start + 1
+                    if self.on_pages:
+                        self.on_pages(copied)
+        except BaseException:
+            new_doc.close()
+            raise
+        return new_doc
+
+    def _copy_steps(self, selection: PageSelection):
+        """Yield the runs to copy, sliced when progress hooks are set."""
+        if not (self.on_pages or self.should_cancel):
+            yield from selection.runs
+            return
+        for start, end in selection.runs:
+            for step_start in range(start, end + 1, self.progress_step):
+                yield step_start, min(end, step_start + self.progress_step - 1)
+
+    def _check_cancelled(self) -> None:
+        """Raise SplitCancelled if the caller asked to stop."""
+        if self.should_cancel and self.should_cancel():
+            raise SplitCancelled("Split cancelled")
+
+    def extract_pages(self, start_page: int, end_page: int) -> fitz.Document:
+        """Copy a 1-indexed page range, clamped to the document length."""
+        return self.extract_selection(range_selection(start_page, end_page, self.page_count))
+
+    def write_selection(self, selection: PageSelection, output_path: str,
+                        save_profile: str = DEFAULT_SAVE_PROFILE,
+                        fidelity: str = DEFAULT_FIDELITY) -> str:
+        """Extract the selected pages and save them to output_path. Max 20 lines."""
+        new_doc = self.extract_selection(selection, fidelity)
+        try:
+            with self.timings.phase('save'):
+                return save_document(new_doc, output_path, save_profile)
+        finally:
+            new_doc.close()
+
+    def write_split(self, start_page: int, end_page: int, output_path: str,
+                    save_profile: str = DEFAULT_SAVE_PROFILE,
+                    fidelity: str = DEFAULT_FIDELITY) -> str:
+        """Extract a page range and save it to output_path."""
+        selection = range_selection(start_page, end_page, self.page_count)
+        return self.write_selection(selection, output_path, save_profile, fidelity)
+
+    def _require_open(self) -> None:
+        """Raise if the session has not been opened."""
+        if self.doc is None:
+            raise RuntimeError("Split session is not open")
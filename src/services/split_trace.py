@@ -0,0 +1,225 @@
+"""Per-phase split timings and opt-in tracing of whole batches.
+
+Every split result's 'timings' has the seconds spent in each phase:
+
+- validate: checking the request and resolving its page selection
+- names: building the output name and reserving a unique path
+- insert: grafting the selected pages into the new document
+- save: writing the output file
+
+(open_seconds and staging_seconds are reported with a session's first
+result, see source_staging.SourceTimings.)
+
+A batch can also be traced as a whole. The trace mode comes from the
+SPS_TRACE environment variable or configure_tracing():
+
+- off: the default; no trace is recorded and span() costs nothing
+- chrome: every phase and split is written as a Chrome trace event; open
+  the .trace.json in chrome://tracing or https://ui.perfetto.dev
+- cprofile: the batch runs under cProfile; read the .prof with pstats
+
+One file per batch is written to SPS_TRACE_DIR (default: sps-traces in
+the temp folder). The batch being traced is kept per thread, so batches
+run on different threads (the GUI's split worker, say) get files of
+their own. Worker processes trace their own chunks and send the events
+or profile back, so a parallel batch still gives one file.
+"""
+
+import cProfile
+import itertools
+import json
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+
+TRACE_MODES = ('off', 'chrome', 'cprofile')
+DEFAULT_TRACE_MODE = 'off'
+SPLIT_PHASES = ('validate', 'names', 'insert', 'save')
+_SUFFIXES = {'chrome': '.trace.json', 'cprofile': '.prof'}
+
+_mode = os.environ.get('SPS_TRACE') or DEFAULT_TRACE_MODE
+_folder = os.environ.get('SPS_TRACE_DIR') or str(Path(tempfile.gettempdir()) / 'sps-traces')
+_on_written: Optional[Callable[[str], None]] = None
+_local = threading.local()     # .batch: the BatchTrace of this thread's batch
+_file_numbers = itertools.count(1)
+_NO_SPAN = nullcontext()
+
+
+def configure_tracing(mode: str, folder: str = "",
+                      on_written: Optional[Callable[[str], None]] = None) -> None:
+    """Set the trace mode for later batches in this process and its workers.
+
+    Args:
+        mode: "off", "chrome" or "cprofile"
+        folder: Where trace files are written; unchanged when empty
+        on_written: Called with the path of each trace file written
+
+    Raises:
+        ValueError: If mode is not a trace mode
+    """
+    global _mode, _folder, _on_written
+    if mode not in TRACE_MODES:
+        raise ValueError(f"Unknown trace mode '{mode}'. Choose from: {', '.join(TRACE_MODES)}")
+    _mode, _folder, _on_written = mode, folder or _folder, on_written
+    # Worker processes read these when they start
+    os.environ['SPS_TRACE'] = mode
+    os.environ['SPS_TRACE_DIR'] = _folder
+
+
+def tracing_enabled() -> bool:
+    """True if batches are being traced in this process."""
+    return _mode != 'off'
+
+
+class BatchTrace:
+    """The spans or profile of one batch, written to one file at the end."""
+
+    def __init__(self, mode: str, label: str):
+        self.mode = mode
+        self.label = label
+        self.events: List[Dict[str, Any]] = []
+        self._profile = cProfile.Profile() if mode == 'cprofile' else None
+        self._worker_stats: List[Dict[Any, Any]] = []
+
+    def start(self) -> None:
+        if self._profile:
+            self._profile.enable()
+
+    def stop(self) -> None:
+        if self._profile:
+            self._profile.disable()
+
+    def record(self, name: str, started: float, ended: float, args: Dict[str, Any]) -> None:
+        """Add a finished span as a Chrome "complete" event (times in microseconds)."""
+        if self.mode == 'chrome':
+            self.events.append({'name': name, 'cat': 'split', 'ph': 'X',
+                                'ts': round(started * 1e6, 3),
+                                'dur': round((ended - started) * 1e6, 3),
+                                'pid': os.getpid(), 'tid': threading.get_ident(),
+                                'args': args})
+
+    def payload(self) -> Any:
+        """What a worker sends back to the batch it is part of."""
+        if self._profile:
+            self._profile.create_stats()
+            return self._profile.stats
+        return self.events
+
+    def merge(self, payload: Any) -> None:
+        """Add a worker's events or profile to this batch."""
+        if self._profile:
+            self._worker_stats.append(payload)
+        else:
+            self.events.extend(payload)
+
+    def write(self, folder: str) -> str:
+        """Write the trace file and return its path."""
+        name = re.sub(r'[^\w.-]+', '_', self.label)[:60] or 'batch'
+        path = Path(folder) / (f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+                               f"-{next(_file_numbers)}{_SUFFIXES[self.mode]}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._profile:
+            stats = pstats.Stats(self._profile)
+            for worker_stats in self._worker_stats:
+                stats.add(_LoadedStats(worker_stats))
+            stats.dump_stats(str(path))
+        else:
+            path.write_text(json.dumps({'traceEvents': self.events,
+                                        'displayTimeUnit': 'ms'}), encoding='utf-8')
+        return str(path)
+
+
+class _LoadedStats:
+    """Profile stats received from a worker, in the form pstats.Stats loads."""
+
+    def __init__(self, stats: Dict[Any, Any]):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+@contextmanager
+def trace_batch(label: str) -> Iterator[None]:
+    """Trace everything run inside as one batch, if tracing is on.
+
+    A batch started inside another on the same thread (a journaled
+    batch, say) is part of the outer one.
+    """
+    if _mode == 'off' or _current() is not None:
+        yield
+        return
+    trace = _local.batch = BatchTrace(_mode, label)
+    trace.start()
+    try:
+        with span('batch', label=label):
+            yield
+    finally:
+        _local.batch = None
+        trace.stop()
+        path = trace.write(_folder)
+        if _on_written:
+            _on_written(path)
+
+
+def traced_call(func: Callable[[], Any]) -> Tuple[Any, Any]:
+    """Run func in a worker process, returning its value and trace payload.
+
+    The payload is None when tracing is off; otherwise pass it to
+    merge_worker_trace() in the process running the batch.
+    """
+    if _mode == 'off':
+        return func(), None
+    inherited = _current()
+    if inherited is not None:
+        inherited.stop()    # A forked worker starts with a copy of the parent's trace
+    trace = _local.batch = BatchTrace(_mode, 'worker')
+    trace.start()
+    try:
+        value = func()
+    finally:
+        _local.batch = inherited
+        trace.stop()
+    return value, trace.payload()
+
+
+def merge_worker_trace(payload: Any) -> None:
+    """Add a worker's trace payload to the batch being traced, if any."""
+    batch = _current()
+    if payload is not None and batch is not None:
+        batch.merge(payload)
+
+
+def record_span(name: str, started: float, ended: float, **args: Any) -> None:
+    """Add a span timed by the caller (perf_counter seconds) to the batch trace."""
+    batch = _current()
+    if batch is not None:
+        batch.record(name, started, ended, args)
+
+
+def span(name: str, **args: Any) -> ContextManager[None]:
+    """Time the enclosed block as a trace span; a shared no-op when not tracing."""
+    if _current() is None:
+        return _NO_SPAN
+    return _timed_span(name, args)
+
+
+def _current() -> Optional[BatchTrace]:
+    """The batch being traced on this thread, if any."""
+    return getattr(_local, 'batch', None)
+
+
+@contextmanager
+def _timed_span(name: str, args: Dict[str, Any]) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, started, time.perf_counter(), **args)
@@ -0,0 +1,101 @@
+"""Cold-start measurement: `-X importtime` parsing and first-paint timing.
+
+`python main_gui.py --measure-startup` prints one JSON line with the time
+from process start to the first painted window and then exits. This
+module runs that command under `-X importtime` and reports both numbers.
+It must stay free of Qt and PyMuPDF imports.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+MEASURE_FLAG = "--measure-startup"
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportRecord:
+    """One line of `-X importtime` output (times in microseconds)."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr_text: str) -> List[ImportRecord]:
+    """Parse `-X importtime` stderr into records, skipping other lines."""
+    records = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append(ImportRecord(name.strip(), int(fields[0]), int(fields[1]), depth))
+    return records
+
+
+def slowest_imports(records: List[ImportRecord], limit: int = 10) -> List[ImportRecord]:
+    """Return the records with the largest self time."""
+    return sorted(records, key=lambda record: record.self_us, reverse=True)[:limit]
+
+
+def first_paint_report(started_at: float, shown_at: float) -> Dict[str, float]:
+    """Build the record printed by main_gui in measurement mode."""
+    now = time.perf_counter()
+    return {
+        'window_show_seconds': round(shown_at - started_at, 4),
+        'first_paint_seconds': round(now - started_at, 4),
+    }
+
+
+def measure_cold_start(python: Optional[str] = None, timeout: float = 60.0) -> Dict[str, Any]:
+    """Launch the GUI in measurement mode and collect timings.
+
+    Args:
+        python: Interpreter to use (defaults to the current one)
+        timeout: Seconds to wait for the window to paint
+
+    Returns:
+        Dict with first_paint_seconds, window_show_seconds, wall_seconds,
+        total_import_us and the slowest imports
+    """
+    env = dict(os.environ)
+    if sys.platform.startswith("linux") and not env.get("DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    command = [python or sys.executable, "-X", "importtime", "main_gui.py", MEASURE_FLAG]
+    started = time.perf_counter()
+    completed = subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True,
+                               text=True, timeout=timeout)
+    wall_seconds = time.perf_counter() - started
+    paint = _last_json_line(completed.stdout)
+    if completed.returncode != 0 or paint is None:
+        raise RuntimeError(f"Startup measurement failed: {completed.stderr[-2000:]}")
+    records = parse_importtime(completed.stderr)
+    return {
+        **paint,
+        'wall_seconds': round(wall_seconds, 4),
+        'total_import_us': sum(r.self_us for r in records),
+        'slowest_imports': [(r.module, r.self_us) for r in slowest_imports(records)],
+    }
+
+
+def _last_json_line(text: str) -> Optional[Dict[str, Any]]:
+    """Return the last stdout line that parses as a JSON object."""
+    for line in reversed(text.splitlines()):
+        try:
+            value = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(value, dict):
+            return value
+    return None